@@ -1,16 +1,26 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, g
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
 import os
 import hashlib
-import json
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
-from resume_parser.extract_text import extract_text
-from resume_parser.extract_entities import extract_entities
-from resume_parser.extract_experience import extract_experience
-from resume_parser.extract_education import extract_education
-from resume_parser.sections import detect_sections
-from resume_parser.adapter import build_resume_output
+from pydantic import ValidationError
+
+from resume_parser.extract_text import extract_text_from_upload
+from resume_parser.pipeline import RESULT_VERSION, parse_text, parse_upload, parse_upload_timed, warm_up
+from resume_parser.serialization import JSON_MIMETYPE, RESPONSE_MIMETYPES, dump_json, encode_body, splice_json
+from resume_parser.preload import memory_usage, preload_stats
+from resume_parser.cache import ResultCache
+from resume_parser.jobs import JobQueue, JobStore, QueueFullError, PRIORITIES
+from resume_parser.job_index import JobIndex
+from resume_parser.candidate_index import CandidateIndex, QueryError, parse_query
+from resume_parser.near_duplicates import NEAR_DUPLICATE_THRESHOLD, NearDuplicateIndex, minhash
+from resume_parser import metrics
+from resume_parser.profiling import StageProfiler
 
 app = Flask(__name__)
 CORS(app)
@@ -20,16 +30,282 @@ UPLOAD_DIR = os.path.join(BASE_DIR, "resumes")
 OUTPUT_DIR = os.path.join(BASE_DIR, "output_json")
 CACHE_DIR = os.path.join(BASE_DIR, "cache")
 
-os.makedirs(UPLOAD_DIR, exist_ok=True)
-os.makedirs(OUTPUT_DIR, exist_ok=True)
+# Uploads are parsed in memory. Keeping a copy of the upload in UPLOAD_DIR
+# and of the result in OUTPUT_DIR is opt-in (both hold candidate PII).
+PERSIST_UPLOADS = os.environ.get("PERSIST_UPLOADS", "0") == "1"
+WRITE_OUTPUT_JSON = os.environ.get("WRITE_OUTPUT_JSON", "0") == "1"
+
+if PERSIST_UPLOADS:
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+if WRITE_OUTPUT_JSON:
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
 os.makedirs(CACHE_DIR, exist_ok=True)
 
+# Result cache: in-process LRU in front of a single SQLite file in CACHE_DIR.
+# Keys are versioned (RESULT_VERSION: parser version and code + skill
+# taxonomy + job-title gazetteer + section headers) so upgrades never serve
+# stale results.
+CACHE_DB_PATH = os.environ.get("CACHE_DB_PATH", os.path.join(CACHE_DIR, "results.sqlite3"))
+CACHE_MEMORY_ITEMS = int(os.environ.get("CACHE_MEMORY_ITEMS", 1024))
+CACHE_MAX_ITEMS = int(os.environ.get("CACHE_MAX_ITEMS", 100_000))
+CACHE_TTL_SECONDS = float(os.environ["CACHE_TTL_SECONDS"]) if os.environ.get("CACHE_TTL_SECONDS") else None
+
+RESULT_CACHE = ResultCache(
+    CACHE_DB_PATH,
+    version=RESULT_VERSION,
+    memory_items=CACHE_MEMORY_ITEMS,
+    max_disk_items=CACHE_MAX_ITEMS,
+    ttl_seconds=CACHE_TTL_SECONDS,
+)
+
+# Batch parsing: size of the worker pool and max files per request
+PARSE_POOL_WORKERS = int(os.environ.get("PARSE_POOL_WORKERS", os.cpu_count() or 1))
+MAX_BATCH_FILES = int(os.environ.get("MAX_BATCH_FILES", 500))
+
+_parse_pool: ProcessPoolExecutor | None = None
+_parse_pool_lock = threading.Lock()
+
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    """
+    Lazily create the process pool used by /parse-resumes and parse jobs.
+    Each worker loads the NLP models once at startup (see warm_up).
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=PARSE_POOL_WORKERS,
+                initializer=warm_up,
+            )
+        return _parse_pool
+
+
+def replace_parse_pool(broken: ProcessPoolExecutor) -> None:
+    """
+    Drop a broken pool (a worker died, e.g. OOM-killed on a huge file) so
+    the next get_parse_pool() starts a new one. A broken executor rejects
+    every later submit, so without this one crash would fail all parses
+    until the server restarts. No-op if another thread already replaced it.
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is broken:
+            _parse_pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def submit_parse(filename: str, data: bytes) -> tuple[ProcessPoolExecutor, Future]:
+    """Submit a parse to the pool; returns the pool with the future."""
+    pool = get_parse_pool()
+    try:
+        return pool, pool.submit(parse_upload_timed, filename, data)
+    except BrokenProcessPool:
+        replace_parse_pool(pool)
+        pool = get_parse_pool()
+        return pool, pool.submit(parse_upload_timed, filename, data)
+
+
+def parse_result(pool: ProcessPoolExecutor, future: Future, filename: str, data: bytes) -> tuple[bytes, dict]:
+    """
+    future.result(), retried once in a new pool if the pool broke. When a
+    worker dies every pending future fails, not only the file that killed
+    it; the retry lets the others through, and the file that crashes the
+    new pool too fails on its own.
+    """
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        replace_parse_pool(pool)
+        return submit_parse(filename, data)[1].result()
+
+
+# On-demand profiling of a single /parse-resume request (X-Profile: 1 header
+# or ?profile=1). Off unless ALLOW_PROFILING=1; reports are also written to
+# PROFILE_DIR when it is set.
+ALLOW_PROFILING = os.environ.get("ALLOW_PROFILING", "0") == "1"
+PROFILE_DIR = os.environ.get("PROFILE_DIR")
+
+# Async parse jobs: bounded priority queue drained into the parse pool.
+# Job records live in a SQLite file so any web worker can report status.
+JOB_DB_PATH = os.environ.get("JOB_DB_PATH", os.path.join(CACHE_DIR, "jobs.sqlite3"))
+JOB_MAX_PENDING = int(os.environ.get("JOB_MAX_PENDING", 1000))
+JOB_TTL_SECONDS = float(os.environ.get("JOB_TTL_SECONDS", 3600))
+JOB_RETRY_AFTER_SECONDS = 5
+
+
+def run_parse_job(filename: str, data: bytes) -> bytes:
+    try:
+        with metrics.JOBS_RUNNING.track_in_progress():
+            body, timings = parse_result(*submit_parse(filename, data), filename, data)
+    except Exception as e:
+        metrics.ERRORS.inc(exception=type(e).__name__)
+        raise
+    record_stage_timings(timings)
+    save_cached_result(file_cache_key(hash_bytes_sha1(data)), body)
+    return body
+
+
+JOB_QUEUE = JobQueue(
+    run_parse_job,
+    JobStore(JOB_DB_PATH, ttl_seconds=JOB_TTL_SECONDS),
+    workers=PARSE_POOL_WORKERS,
+    max_pending=JOB_MAX_PENDING,
+)
+
+
+# Local job matching (/match-jobs): BM25 index over the JSONL job postings
+# file at JOB_POSTINGS_PATH, built on first use. Disabled when unset.
+JOB_POSTINGS_PATH = os.environ.get("JOB_POSTINGS_PATH")
+JOB_MATCH_TOP_K = int(os.environ.get("JOB_MATCH_TOP_K", 20))
+JOB_MATCH_MAX_TOP_K = 200
+
+_job_index: JobIndex | None = None
+_job_index_lock = threading.Lock()
+
+
+def get_job_index() -> JobIndex | None:
+    global _job_index
+    if JOB_POSTINGS_PATH and _job_index is None:
+        with _job_index_lock:
+            if _job_index is None:
+                _job_index = JobIndex.from_file(JOB_POSTINGS_PATH)
+                app.logger.info("Indexed %d job postings from %s", len(_job_index), JOB_POSTINGS_PATH)
+    return _job_index
+
+
+# Candidate search (/candidates/search): the CandidateIndex file at
+# CANDIDATE_INDEX_PATH (filled by `bulk_parse.py --index` or
+# `python -m resume_parser.candidate_index add`), reloaded when it changes.
+CANDIDATE_INDEX_PATH = os.environ.get("CANDIDATE_INDEX_PATH")
+CANDIDATE_SEARCH_LIMIT = 100
+
+_candidate_index: CandidateIndex | None = None
+_candidate_index_mtime: float | None = None
+_candidate_index_lock = threading.Lock()
+
+
+def get_candidate_index() -> CandidateIndex | None:
+    global _candidate_index, _candidate_index_mtime
+    if not CANDIDATE_INDEX_PATH or not os.path.exists(CANDIDATE_INDEX_PATH):
+        return None
+    mtime = os.path.getmtime(CANDIDATE_INDEX_PATH)
+    if mtime != _candidate_index_mtime:
+        with _candidate_index_lock:
+            if mtime != _candidate_index_mtime:
+                _candidate_index = CandidateIndex.load(CANDIDATE_INDEX_PATH)
+                _candidate_index_mtime = mtime
+    return _candidate_index
+
+
+# Near-duplicate flagging (opt-in, NEAR_DUPLICATES=1): every parsed upload is
+# checked against the uploads this worker parsed before (MinHash/LSH over its
+# lines, see near_duplicates). A match is reported in the X-Near-Duplicate-Of
+# (sha1 of the earlier upload) and X-Near-Duplicate-Similarity headers; the
+# upload is still parsed. The index is per process, capped at
+# NEAR_DUPLICATE_MAX_ITEMS (oldest dropped first).
+NEAR_DUPLICATES = os.environ.get("NEAR_DUPLICATES", "0") == "1"
+NEAR_DUPLICATE_MAX_ITEMS = int(os.environ.get("NEAR_DUPLICATE_MAX_ITEMS", 100_000))
+
+NEAR_DUPLICATE_INDEX = (
+    NearDuplicateIndex(NEAR_DUPLICATE_THRESHOLD, max_items=NEAR_DUPLICATE_MAX_ITEMS) if NEAR_DUPLICATES else None
+)
+_near_duplicate_lock = threading.Lock()
+
+
+def check_near_duplicate(file_hash: str, raw_text: str) -> tuple[str, float] | None:
+    """(sha1, similarity) of an earlier upload `raw_text` nearly duplicates, or None."""
+    signature = minhash(raw_text)
+    if signature is None:
+        return None
+    with _near_duplicate_lock:
+        match = NEAR_DUPLICATE_INDEX.check(file_hash, signature)
+    if match is not None:
+        metrics.NEAR_DUPLICATES.inc()
+    return match
+
+
+# Metrics read from existing state at scrape time
+KNOWN_FILE_TYPES = {"pdf", "docx", "txt"}
+
+metrics.REGISTRY.register(metrics.CollectedMetric(
+    "resume_parser_result_cache_events_total",
+    "Result cache storage events (memory/disk hits, misses, evictions).",
+    "counter",
+    ["event"],
+    lambda: {(k,): v for k, v in RESULT_CACHE.stats().items() if k != "memory_items"},
+))
+metrics.REGISTRY.register(metrics.CollectedMetric(
+    "resume_parser_jobs_pending",
+    "Async parse jobs waiting in the queue.",
+    "gauge",
+    [],
+    lambda: {(): JOB_QUEUE.pending()},
+))
+
+
+# Latency of the first parse request served by this worker process
+PARSE_ENDPOINTS = {"parse_resume", "parse_resumes", "submit_job"}
+_first_parse_ms: float | None = None
+
+
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+    if request.endpoint in PARSE_ENDPOINTS:
+        metrics.IN_FLIGHT.inc(endpoint=request.endpoint)
+        g.in_flight_endpoint = request.endpoint
+
+
+@app.teardown_request
+def finish_request_metrics(exc):
+    endpoint = g.pop("in_flight_endpoint", None)
+    if endpoint is not None:
+        metrics.IN_FLIGHT.dec(endpoint=endpoint)
+        metrics.REQUEST_SECONDS.observe(time.perf_counter() - g.request_start, endpoint=endpoint)
+
+
+@app.after_request
+def record_first_parse_latency(response):
+    global _first_parse_ms
+    if _first_parse_ms is None and request.endpoint in PARSE_ENDPOINTS:
+        _first_parse_ms = round((time.perf_counter() - g.request_start) * 1000, 1)
+        app.logger.info("pid %s: first parse request took %.1f ms", os.getpid(), _first_parse_ms)
+    return response
+
 
 @app.route("/", methods=["GET"])
 def home():
     return jsonify({"message": "Resume Parser API is running."}), 200
 
 
+@app.route("/worker-stats", methods=["GET"])
+def worker_stats():
+    """
+    Per-worker sizing info: memory (rss/pss), whether models were preloaded
+    before fork, how long the first parse request took in this worker, and
+    result cache hit/miss counters.
+    """
+    return jsonify({
+        "pid": os.getpid(),
+        **memory_usage(),
+        **preload_stats(),
+        "first_parse_ms": _first_parse_ms,
+        "cache": RESULT_CACHE.stats(),
+        "jobs_pending": JOB_QUEUE.pending(),
+    }), 200
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics_endpoint():
+    """
+    Prometheus text-format metrics for this worker process: per-stage latency
+    histograms, cache lookups per tier, upload types/sizes, errors by
+    exception type and in-flight requests.
+    """
+    return Response(metrics.REGISTRY.render(), content_type=metrics.CONTENT_TYPE)
+
+
 @app.route("/parse-resume", methods=["POST"])
 def parse_resume():
     if "resume" not in request.files:
@@ -40,64 +316,306 @@ def parse_resume():
         return jsonify({"error": "Empty filename"}), 400
 
     filename = secure_filename(file.filename)
-    file_path = os.path.join(UPLOAD_DIR, filename)
-    file.save(file_path)
+    data = file.read()
+    record_upload(filename, data)
+
+    if profiling_requested():
+        if not ALLOW_PROFILING:
+            return jsonify({"error": "Profiling is disabled on this server"}), 403
+        return parse_resume_profiled(filename, data)
+
+    # Tier 1: cache keyed on the raw upload bytes, checked before any parsing
+    file_hash = hash_bytes_sha1(data)
+    file_key = file_cache_key(file_hash)
+    cached = lookup_cached_result(file_key, tier="file")
+    if cached is not None:
+        return result_response(cached)
+
+    if PERSIST_UPLOADS:
+        with open(os.path.join(UPLOAD_DIR, filename), "wb") as f:
+            f.write(data)
 
     try:
-        raw_text = extract_text(file_path)
+        timings: dict[str, float] = {}
+        start = time.perf_counter()
+        raw_text = extract_text_from_upload(data, filename)
+        timings["extract_text"] = time.perf_counter() - start
 
+        # Tier 2: cache keyed on extracted text (different bytes, same text)
         text_hash = hash_text_sha1(raw_text)
-        cached = load_cached_result(text_hash)
+        cached = lookup_cached_result(text_hash, tier="text")
         if cached is not None:
-            return jsonify(cached), 200
+            save_cached_result(file_key, cached)
+            return result_response(cached)
+
+        near_duplicate = None
+        if NEAR_DUPLICATE_INDEX is not None:
+            start = time.perf_counter()
+            near_duplicate = check_near_duplicate(file_hash, raw_text)
+            timings["near_duplicates"] = time.perf_counter() - start
+
+        resume_output = parse_text(raw_text, timings)
+        # Serialize once, straight from the validated model; the same bytes
+        # go to both cache tiers, the output file and the response.
+        start = time.perf_counter()
+        body = dump_json(resume_output)
+        timings["serialize"] = time.perf_counter() - start
+        record_stage_timings(timings)
 
-        sections = detect_sections(raw_text)
+        save_cached_result(text_hash, body)
+        save_cached_result(file_key, body)
 
-        parsed_data = extract_entities(raw_text, sections=sections)
-        parsed_data["experience"] = extract_experience(raw_text, sections=sections)
-        parsed_data["education"] = extract_education(raw_text, sections=sections)
+        if WRITE_OUTPUT_JSON:
+            output_filename = os.path.splitext(filename)[0] + ".json"
+            with open(os.path.join(OUTPUT_DIR, output_filename), "wb") as f:
+                f.write(body)
 
-        resume_output = build_resume_output(parsed_data)
-        output_data = resume_output.model_dump()
+        response = result_response(body)
+        if near_duplicate is not None:
+            response.headers["X-Near-Duplicate-Of"] = near_duplicate[0]
+            response.headers["X-Near-Duplicate-Similarity"] = f"{near_duplicate[1]:.3f}"
+        return response
+
+    except Exception as e:
+        metrics.ERRORS.inc(exception=type(e).__name__)
+        return jsonify({"error": f"Failed to parse resume: {str(e)}"}), 500
 
-        save_cached_result(text_hash, output_data)
 
-        output_filename = os.path.splitext(filename)[0] + ".json"
-        with open(os.path.join(OUTPUT_DIR, output_filename), "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=4, ensure_ascii=False)
+def profiling_requested() -> bool:
+    flag = request.headers.get("X-Profile") or request.args.get("profile")
+    return flag in ("1", "true", "yes")
 
-        return jsonify(output_data), 200
 
+def parse_resume_profiled(filename: str, data: bytes):
+    """
+    Parse with cProfile + tracemalloc on every stage. Bypasses the result
+    cache so the real parse is measured; returns the result and the profile.
+    """
+    try:
+        with StageProfiler() as profiler:
+            output_data = parse_upload(filename, data, profiler=profiler)
     except Exception as e:
+        metrics.ERRORS.inc(exception=type(e).__name__)
         return jsonify({"error": f"Failed to parse resume: {str(e)}"}), 500
 
+    report = profiler.report()
+    if PROFILE_DIR:
+        report["saved_to"] = profiler.save(PROFILE_DIR, os.path.splitext(filename)[0])
+    return jsonify({"result": output_data, "profile": report}), 200
+
+
+@app.route("/parse-resumes", methods=["POST"])
+def parse_resumes():
+    """
+    Batch endpoint: parse every file sent under the "resumes" field in a
+    process pool. Returns one result per file, in upload order; a file that
+    fails to parse gets an error entry instead of failing the whole batch.
+    """
+    files = [f for f in request.files.getlist("resumes") if f.filename]
+    if not files:
+        return jsonify({"error": "No resume files provided"}), 400
+    if len(files) > MAX_BATCH_FILES:
+        return jsonify({"error": f"Too many files (max {MAX_BATCH_FILES})"}), 413
+
+    jobs = []
+    for file in files:
+        filename = secure_filename(file.filename)
+        data = file.read()
+        record_upload(filename, data)
+        file_key = file_cache_key(hash_bytes_sha1(data))
+        cached = lookup_cached_result(file_key, tier="file")
+        if cached is not None:
+            jobs.append((filename, file_key, cached))
+        else:
+            jobs.append((filename, file_key, (data, *submit_parse(filename, data))))
+
+    # Each result is already serialized JSON (from the cache or a worker);
+    # the entries are spliced around it instead of decoding it again.
+    results = []
+    for filename, file_key, job in jobs:
+        if isinstance(job, bytes):
+            results.append(splice_json({"filename": filename, "status": "ok"}, {"data": job}))
+            continue
+        data, pool, future = job
+        try:
+            body, timings = parse_result(pool, future, filename, data)
+        except Exception as e:
+            metrics.ERRORS.inc(exception=type(e).__name__)
+            results.append(dump_json(
+                {"filename": filename, "status": "error", "error": f"Failed to parse resume: {str(e)}"}
+            ))
+            continue
+        record_stage_timings(timings)
+        save_cached_result(file_key, body)
+        results.append(splice_json({"filename": filename, "status": "ok"}, {"data": body}))
+
+    return result_response(splice_json({}, {"results": b"[" + b",".join(results) + b"]"}))
+
+
+@app.route("/jobs", methods=["POST"])
+def submit_job():
+    """
+    Async parse: queue the "resume" file and return a job id right away.
+    Optional "priority" (form field or query arg): "interactive" (default)
+    or "bulk"; interactive jobs are always dispatched first.
+    Returns 429 with Retry-After when the queue is full.
+    """
+    if "resume" not in request.files:
+        return jsonify({"error": "No resume file provided"}), 400
+
+    file = request.files["resume"]
+    if file.filename == "":
+        return jsonify({"error": "Empty filename"}), 400
+
+    priority = request.form.get("priority") or request.args.get("priority", "interactive")
+    if priority not in PRIORITIES:
+        return jsonify({"error": f"Unknown priority: {priority}"}), 400
+
+    filename = secure_filename(file.filename)
+    data = file.read()
+    record_upload(filename, data)
+
+    cached = lookup_cached_result(file_cache_key(hash_bytes_sha1(data)), tier="file")
+    if cached is not None:
+        job_id = JOB_QUEUE.record_done(filename, cached, priority)
+        return jsonify({"job_id": job_id, "status": "done"}), 200
+
+    try:
+        job_id = JOB_QUEUE.submit(filename, data, priority)
+    except QueueFullError as e:
+        response = jsonify({"error": str(e)})
+        response.headers["Retry-After"] = str(JOB_RETRY_AFTER_SECONDS)
+        return response, 429
+
+    response = jsonify({"job_id": job_id, "status": "queued"})
+    response.headers["Location"] = f"/jobs/{job_id}"
+    return response, 202
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    found = JOB_QUEUE.store.get_raw(job_id)
+    if found is None:
+        return jsonify({"error": "Job not found"}), 404
+    # The stored result is already serialized JSON; splice it in as-is.
+    job, result = found
+    return result_response(splice_json(job, {} if result is None else {"result": result}))
+
+
+@app.route("/match-jobs", methods=["POST"])
+def match_jobs():
+    """
+    Rank the local job postings against a parsed resume (the JSON returned
+    by /parse-resume) by its skills and experience titles. Optional "top"
+    query arg: number of jobs to return.
+    """
+    index = get_job_index()
+    if index is None:
+        return jsonify({"error": "No job postings loaded (set JOB_POSTINGS_PATH)"}), 503
+
+    parsed = request.get_json(silent=True)
+    if not isinstance(parsed, dict):
+        return jsonify({"error": "Invalid payload: expected JSON object."}), 400
+
+    top_k = min(request.args.get("top", JOB_MATCH_TOP_K, type=int), JOB_MATCH_MAX_TOP_K)
+    try:
+        matches = index.rank(parsed, top_k=max(top_k, 1))
+    except ValidationError as e:
+        return jsonify({"error": f"Invalid resume: {e.error_count()} validation error(s)"}), 400
+
+    jobs = [
+        {
+            "title": posting.get("title"),
+            "company": posting.get("company"),
+            "location": posting.get("location"),
+            "salary": posting.get("salary"),
+            "url": posting.get("link") or posting.get("url"),
+            "score": round(score, 4),
+        }
+        for posting, score in matches
+    ]
+    return jsonify({"jobs": jobs}), 200
+
+
+@app.route("/candidates/search", methods=["GET"])
+def search_candidates():
+    """
+    Boolean candidate search over indexed parses, e.g.
+    ?q=python AND react AND NOT php AND years>=3 (see candidate_index for
+    the query syntax). Optional "limit" query arg (default 100).
+    """
+    index = get_candidate_index()
+    if index is None:
+        return jsonify({"error": "No candidate index loaded (set CANDIDATE_INDEX_PATH)"}), 503
+
+    query = request.args.get("q", "")
+    limit = request.args.get("limit", CANDIDATE_SEARCH_LIMIT, type=int)
+    try:
+        tree = parse_query(query)
+    except QueryError as e:
+        return jsonify({"error": f"Invalid query: {e}"}), 400
+
+    return jsonify({
+        "query": query,
+        "total": index.count(tree),
+        "candidates": index.search(tree, limit=max(limit, 0)),
+    }), 200
+
 
 def hash_text_sha1(text: str) -> str:
     return hashlib.sha1(text.encode("utf-8")).hexdigest()
 
 
-def cache_path_for_hash(text_hash: str) -> str:
-    return os.path.join(CACHE_DIR, f"{text_hash}.json")
+def hash_bytes_sha1(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
 
 
-def load_cached_result(text_hash: str):
-    path = cache_path_for_hash(text_hash)
-    if os.path.exists(path):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return None
-    return None
+def file_cache_key(file_hash: str) -> str:
+    """
+    Cache key for the upload-bytes tier. Prefixed so it never shares a
+    namespace with the text-hash tier.
+    """
+    return f"file-{file_hash}"
 
 
-def save_cached_result(text_hash: str, data: dict):
-    path = cache_path_for_hash(text_hash)
-    try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
-    except Exception:
-        pass
+def lookup_cached_result(key: str, tier: str):
+    """load_cached_result, counting the hit/miss for the given key tier."""
+    cached = load_cached_result(key)
+    metrics.CACHE_LOOKUPS.inc(tier=tier, result="miss" if cached is None else "hit")
+    return cached
+
+
+def load_cached_result(key: str) -> bytes | None:
+    """Cached result as serialized JSON bytes (ready to send), or None."""
+    return RESULT_CACHE.get_raw(key)
+
+
+def save_cached_result(key: str, body: bytes):
+    RESULT_CACHE.set_raw(key, body)
+
+
+def result_response(body: bytes, status: int = 200) -> Response:
+    """
+    Response for a result that is already serialized JSON. The bytes are sent
+    as-is, unless the Accept header prefers another of RESPONSE_MIMETYPES
+    (msgpack, when installed); anything else gets JSON.
+    """
+    mimetype = request.accept_mimetypes.best_match(RESPONSE_MIMETYPES) or JSON_MIMETYPE
+    response = Response(encode_body(body, mimetype), status=status, mimetype=mimetype)
+    response.vary.add("Accept")
+    return response
+
+
+def record_upload(filename: str, data: bytes):
+    ext = os.path.splitext(filename)[1].lower().lstrip(".")
+    file_type = ext if ext in KNOWN_FILE_TYPES else "other"
+    metrics.UPLOADS.inc(file_type=file_type)
+    metrics.UPLOAD_BYTES.observe(len(data), file_type=file_type)
+
+
+def record_stage_timings(timings: dict):
+    for stage, seconds in timings.items():
+        metrics.STAGE_SECONDS.observe(seconds, stage=stage)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,150 @@
+# benchmarks/bench_daemon.py
+#
+# Startup cost vs. throughput: one `resume_parser_main.py` spawn per file
+# (cold start every time) against a single `--daemon` process fed the same
+# files over stdin.
+#
+# Usage (from parser/):
+#   python -m benchmarks.bench_daemon
+#   python -m benchmarks.bench_daemon --per-size 10 --workers 4 --output daemon.json
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List
+
+from benchmarks.corpus import FORMATS, SIZES, build_corpus
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resume_parser_main.py")
+
+
+def bench_cold(paths: List[str]) -> Dict[str, Any]:
+    """Spawn the CLI once per file, sequentially."""
+    samples = []
+    errors = 0
+    start = time.perf_counter()
+    for path in paths:
+        t0 = time.perf_counter()
+        proc = subprocess.run([sys.executable, MAIN, path], capture_output=True, text=True)
+        samples.append((time.perf_counter() - t0) * 1000)
+        try:
+            if proc.returncode != 0 or "error" in json.loads(proc.stdout):
+                errors += 1
+        except ValueError:
+            errors += 1
+    total = time.perf_counter() - start
+    return {
+        "docs": len(paths),
+        "errors": errors,
+        "total_s": round(total, 3),
+        "median_ms_per_doc": round(statistics.median(samples), 1),
+        "docs_per_s": round(len(paths) / total, 2),
+    }
+
+
+def bench_daemon(paths: List[str], workers: int) -> Dict[str, Any]:
+    """Start one daemon, wait until it is ready, then send every file at once."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, MAIN, "--daemon", "--workers", str(workers)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    ready = json.loads(proc.stdout.readline())
+    if not ready.get("ready"):
+        raise RuntimeError(f"daemon did not start: {ready}")
+    startup = time.perf_counter() - start
+
+    def send() -> None:
+        # Separate thread so a full stdout pipe can't deadlock us.
+        for i, path in enumerate(paths):
+            proc.stdin.write(json.dumps({"id": str(i), "path": path}) + "\n")
+        proc.stdin.close()
+
+    t0 = time.perf_counter()
+    writer = threading.Thread(target=send)
+    writer.start()
+
+    answered = set()
+    errors = 0
+    for line in proc.stdout:
+        response = json.loads(line)
+        answered.add(response["id"])
+        errors += "error" in response
+        if len(answered) == len(paths):
+            break
+    total = time.perf_counter() - t0
+
+    writer.join()
+    proc.wait()
+    return {
+        "docs": len(paths),
+        "errors": errors,
+        "workers": workers,
+        "startup_s": round(startup, 3),
+        "total_s": round(total, 3),
+        "docs_per_s": round(len(paths) / total, 2),
+        "total_with_startup_s": round(startup + total, 3),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Cold-spawn vs daemon throughput of resume_parser_main.py")
+    parser.add_argument("--sizes", default="small,medium", help="comma-separated: " + ",".join(SIZES))
+    parser.add_argument("--formats", default=",".join(FORMATS), help="comma-separated: " + ",".join(FORMATS))
+    parser.add_argument("--per-size", type=int, default=3, help="documents per size")
+    parser.add_argument("--workers", type=int, default=1, help="daemon --workers")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write results JSON here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    sizes = [s for s in args.sizes.split(",") if s]
+    formats = [f for f in args.formats.split(",") if f]
+    corpus_dir = tempfile.mkdtemp(prefix="resume-bench-")
+    paths = [d["path"] for d in build_corpus(corpus_dir, sizes, formats, per_size=args.per_size, seed=args.seed)]
+
+    cold = bench_cold(paths)
+    daemon = bench_daemon(paths, args.workers)
+    output = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "sizes": sizes,
+            "formats": formats,
+            "per_size": args.per_size,
+            "seed": args.seed,
+        },
+        "cold": cold,
+        "daemon": daemon,
+        "speedup": round(cold["total_s"] / daemon["total_with_startup_s"], 2),
+    }
+    print(
+        f"cold:   {cold['docs_per_s']:.2f} docs/s ({cold['median_ms_per_doc']:.0f} ms per spawn)\n"
+        f"daemon: {daemon['docs_per_s']:.2f} docs/s after {daemon['startup_s']:.2f}s startup "
+        f"({daemon['workers']} worker(s))\n"
+        f"speedup incl. daemon startup: x{output['speedup']}",
+        file=sys.stderr,
+    )
+
+    payload = json.dumps(output, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload)
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
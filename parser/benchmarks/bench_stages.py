@@ -0,0 +1,216 @@
+# benchmarks/bench_stages.py
+#
+# Per-stage micro-benchmarks over a synthetic resume corpus.
+#
+# Usage (from parser/):
+#   python -m benchmarks.bench_stages --output bench.json
+#   python -m benchmarks.bench_stages --compare bench.json        # fail on regressions
+#   python -m benchmarks.bench_stages --sizes small,large --formats pdf --repeat 10
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.corpus import FORMATS, SIZES, build_corpus
+from resume_parser.utils import detect_language, extract_text_from_file
+from resume_parser.document import ResumeDocument
+from resume_parser.sections import detect_sections
+from resume_parser.extract_entities import (
+    extract_entities,
+    extract_name_with_confidence,
+    extract_emails_raw,
+    extract_phones_raw,
+    normalize_phone,
+    extract_skills_with_confidence,
+    get_nlp,
+)
+from resume_parser.extract_experience import extract_experience
+from resume_parser.extract_education import extract_education
+from resume_parser.adapter import build_resume_output
+from resume_parser.pipeline import warm_up
+
+
+def _time_ms(fn: Callable[[], Any], repeat: int) -> tuple[List[float], Any]:
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples, result
+
+
+def _contacts(clean: str) -> Any:
+    emails = extract_emails_raw(clean)
+    phones = [normalize_phone(p) for p in extract_phones_raw(clean)]
+    return emails, phones
+
+
+def bench_document(path: str, repeat: int) -> Dict[str, List[float]]:
+    """
+    Time every pipeline stage on one document. Each stage gets the real
+    output of the previous one, exactly as in the app.
+    """
+    timings: Dict[str, List[float]] = {}
+
+    def run(stage: str, fn: Callable[[], Any]) -> Any:
+        samples, result = _time_ms(fn, repeat)
+        timings[stage] = samples
+        return result
+
+    text = run("extract_text_from_file", lambda: extract_text_from_file(path))
+    doc = run("build_document", lambda: ResumeDocument(text))
+    # Same call and input as before ResumeDocument existed, so this stage
+    # stays comparable with older baselines (build_document includes it).
+    run("detect_sections", lambda: detect_sections(doc.text))
+
+    lang = run("entities.language", lambda: detect_language(doc.clean)) or "en"
+    run("entities.name", lambda: extract_name_with_confidence(doc, lang))
+    run("entities.contacts", lambda: _contacts(doc.clean))
+    run("entities.skills", lambda: extract_skills_with_confidence(doc))
+    parsed = run("extract_entities", lambda: extract_entities(doc))
+
+    parsed["experience"] = run("extract_experience", lambda: extract_experience(doc))
+    parsed["education"] = run("extract_education", lambda: extract_education(doc))
+    run("build_resume_output", lambda: build_resume_output(parsed))
+
+    return timings
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        "median_ms": round(statistics.median(ordered), 4),
+        "p95_ms": round(ordered[p95_index], 4),
+        "min_ms": round(ordered[0], 4),
+        "n": len(ordered),
+    }
+
+
+def run_benchmarks(corpus: List[Dict[str, str]], repeat: int) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Returns {stage: {"<size>/<format>": summary}}.
+    Text extraction depends on the file format; later stages only see text,
+    but are keyed the same way so every row is directly comparable.
+    """
+    grouped: Dict[str, Dict[str, List[float]]] = {}
+    for doc in corpus:
+        group = f"{doc['size']}/{doc['format']}"
+        for stage, samples in bench_document(doc["path"], repeat).items():
+            grouped.setdefault(stage, {}).setdefault(group, []).extend(samples)
+
+    return {
+        stage: {group: _summary(samples) for group, samples in sorted(groups.items())}
+        for stage, groups in grouped.items()
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """
+    Compare median timings against a saved baseline.
+    Returns one row per stage/group present in both, flagged as a regression
+    when current is more than `threshold` (e.g. 0.10 = 10%) slower.
+    """
+    rows = []
+    for stage, groups in current["results"].items():
+        for group, summary in groups.items():
+            base = baseline.get("results", {}).get(stage, {}).get(group)
+            if not base or not base["median_ms"]:
+                continue
+            ratio = summary["median_ms"] / base["median_ms"]
+            rows.append(
+                {
+                    "stage": stage,
+                    "group": group,
+                    "baseline_ms": base["median_ms"],
+                    "current_ms": summary["median_ms"],
+                    "ratio": round(ratio, 3),
+                    "regression": ratio > 1 + threshold,
+                }
+            )
+    return rows
+
+
+def _print_table(results: Dict[str, Dict[str, Dict[str, float]]]) -> None:
+    print(f"{'stage':<26} {'group':<14} {'median ms':>10} {'p95 ms':>10}", file=sys.stderr)
+    for stage, groups in results.items():
+        for group, s in groups.items():
+            print(f"{stage:<26} {group:<14} {s['median_ms']:>10.3f} {s['p95_ms']:>10.3f}", file=sys.stderr)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Per-stage resume parser benchmarks")
+    parser.add_argument("--sizes", default=",".join(SIZES), help="comma-separated: " + ",".join(SIZES))
+    parser.add_argument("--formats", default=",".join(FORMATS), help="comma-separated: " + ",".join(FORMATS))
+    parser.add_argument("--per-size", type=int, default=3, help="documents per size")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per stage per document")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--corpus-dir", help="where to write the corpus (default: a temp dir)")
+    parser.add_argument("--output", help="write results JSON here (default: stdout)")
+    parser.add_argument("--compare", help="baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown before flagging")
+    args = parser.parse_args(argv)
+
+    sizes = [s for s in args.sizes.split(",") if s]
+    formats = [f for f in args.formats.split(",") if f]
+
+    corpus_dir = args.corpus_dir or tempfile.mkdtemp(prefix="resume-bench-")
+    corpus = build_corpus(corpus_dir, sizes, formats, per_size=args.per_size, seed=args.seed)
+
+    # Model loading and lazy initialization are not part of any stage.
+    get_nlp("en")
+    warm_up()
+
+    output = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "sizes": sizes,
+            "formats": formats,
+            "per_size": args.per_size,
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "corpus_dir": corpus_dir,
+        },
+        "results": run_benchmarks(corpus, args.repeat),
+    }
+    _print_table(output["results"])
+
+    exit_code = 0
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare(output, baseline, args.threshold)
+        output["comparison"] = rows
+        regressions = [r for r in rows if r["regression"]]
+        for r in regressions:
+            print(
+                f"REGRESSION {r['stage']} {r['group']}: "
+                f"{r['baseline_ms']:.3f} -> {r['current_ms']:.3f} ms (x{r['ratio']})",
+                file=sys.stderr,
+            )
+        exit_code = 1 if regressions else 0
+
+    payload = json.dumps(output, indent=2)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload)
+    else:
+        print(payload)
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+# benchmarks/corpus.py
+#
+# Reproducible synthetic resume corpus for the stage benchmarks.
+# The same seed always yields the same resumes, in .txt, .docx and .pdf.
+
+from __future__ import annotations
+
+import os
+import random
+from typing import Dict, List
+
+import docx
+
+FIRST_NAMES = ["Aarav", "Maria", "John", "Priya", "Wei", "Fatima", "Lucas", "Emma", "Ravi", "Sofia"]
+LAST_NAMES = ["Sharma", "Garcia", "Smith", "Iyer", "Chen", "Khan", "Martin", "Brown", "Nair", "Rossi"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Tech", "Hooli"]
+TITLES = [
+    "Software Engineer", "Data Scientist", "Machine Learning Engineer", "Backend Developer",
+    "Frontend Developer", "Full Stack Developer", "Data Analyst", "Research Assistant", "Intern",
+]
+SKILLS = [
+    "Python", "Java", "C++", "JavaScript", "TypeScript", "React", "Node.js", "Next.js", "Flask",
+    "Django", "SQL", "PostgreSQL", "MongoDB", "Docker", "Kubernetes", "AWS", "Git", "TensorFlow",
+    "PyTorch", "scikit-learn", "Pandas", "NumPy", "GraphQL", "Redis", "Linux",
+]
+DEGREES = [
+    "Bachelor of Technology in Computer Science",
+    "B.Sc. in Mathematics",
+    "Master of Science in Data Science",
+    "M.Tech in Artificial Intelligence",
+    "Ph.D. in Computer Science",
+]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+BULLETS = [
+    "Built and maintained REST APIs serving millions of requests per day",
+    "Designed data pipelines for reporting and analytics",
+    "Reduced page load time by optimizing queries and caching",
+    "Mentored junior engineers and reviewed code",
+    "Deployed services on Kubernetes with CI/CD pipelines",
+    "Trained and evaluated machine learning models for ranking",
+    "Collaborated with product teams to define requirements",
+]
+
+# Size presets: number of experience entries, bullets per entry, projects.
+SIZES: Dict[str, Dict[str, int]] = {
+    "small": {"jobs": 2, "bullets": 3, "projects": 1},
+    "medium": {"jobs": 6, "bullets": 5, "projects": 4},
+    "large": {"jobs": 30, "bullets": 8, "projects": 25},
+}
+
+FORMATS = ["txt", "docx", "pdf"]
+
+
+def _date_range(rng: random.Random, start_year: int, end_year: int | None) -> str:
+    """Mix the date formats parse_date_range has to handle."""
+    style = rng.randrange(4)
+    end = "Present" if end_year is None else None
+    if style == 0:
+        start = f"{rng.choice(MONTHS)} {start_year}"
+        end = end or f"{rng.choice(MONTHS)} {end_year}"
+    elif style == 1:
+        start = f"{start_year}/{rng.randint(1, 12):02d}"
+        end = end or f"{end_year}/{rng.randint(1, 12):02d}"
+    elif style == 2:
+        start = f"{rng.choice(MONTHS)}'{start_year % 100:02d}"
+        end = end or f"{rng.choice(MONTHS)}'{end_year % 100:02d}"
+    else:
+        start = str(start_year)
+        end = end or str(end_year)
+    return f"{start} - {end}"
+
+
+def generate_resume_lines(size: str, seed: int) -> List[str]:
+    """Return the lines of one synthetic resume of the given size."""
+    preset = SIZES[size]
+    rng = random.Random(f"{size}-{seed}")
+
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    lines = [
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}@example.com",
+        f"+91 98{rng.randint(10000000, 99999999)}",
+        "",
+        "Skills",
+        ", ".join(rng.sample(SKILLS, k=min(len(SKILLS), 6 + preset["jobs"]))),
+        "",
+        "Experience",
+    ]
+
+    year = 2024
+    for i in range(preset["jobs"]):
+        start = year - rng.randint(1, 3)
+        end = None if i == 0 else year
+        lines.append(f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)}, {_date_range(rng, start, end)}")
+        lines.extend(f"- {rng.choice(BULLETS)}" for _ in range(preset["bullets"]))
+        year = start
+
+    lines += ["", "Education"]
+    for _ in range(1 + preset["jobs"] // 10):
+        lines.append(f"{rng.choice(DEGREES)}, {rng.randint(2005, 2022)}")
+
+    lines += ["", "Projects"]
+    for i in range(preset["projects"]):
+        lines.append(f"Project {i + 1}: {rng.choice(BULLETS)} using {rng.choice(SKILLS)}")
+
+    return lines
+
+
+# ---------- Writers ----------
+
+
+def write_txt(lines: List[str], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def write_docx(lines: List[str], path: str) -> None:
+    document = docx.Document()
+    for line in lines:
+        document.add_paragraph(line)
+    document.save(path)
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(lines: List[str], path: str, lines_per_page: int = 55) -> None:
+    """
+    Minimal text-only PDF writer (Helvetica, one text object per page), so the
+    corpus needs no PDF library beyond what the parser already depends on.
+    """
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    objects: List[bytes] = []
+    font_id = 3
+    page_ids = []
+    for page_lines in pages:
+        ops = ["BT", "/F1 11 Tf", "14 TL", "50 800 Td"]
+        ops += [f"({_pdf_escape(line)}) Tj T*" for line in page_lines]
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1", errors="replace")
+        content_id = 4 + len(objects)
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        page_id = 4 + len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>" % (font_id, content_id)
+        )
+        page_ids.append(page_id)
+
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids).encode()
+    header_objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids)),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(header_objects + objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, body)
+
+    xref_at = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(offsets) + 1)
+    out += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(offsets) + 1, xref_at)
+
+    with open(path, "wb") as f:
+        f.write(bytes(out))
+
+
+WRITERS = {"txt": write_txt, "docx": write_docx, "pdf": write_pdf}
+
+
+def build_corpus(out_dir: str, sizes: List[str], formats: List[str], per_size: int = 3, seed: int = 0) -> List[Dict[str, str]]:
+    """
+    Write `per_size` resumes for every size x format into `out_dir`.
+    Returns one record per file: {"path", "size", "format"}.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    corpus = []
+    for size in sizes:
+        for i in range(per_size):
+            lines = generate_resume_lines(size, seed + i)
+            for fmt in formats:
+                path = os.path.join(out_dir, f"{size}_{seed + i}.{fmt}")
+                WRITERS[fmt](lines, path)
+                corpus.append({"path": path, "size": size, "format": fmt})
+    return corpus
@@ -0,0 +1,460 @@
+# bulk_parse.py
+#
+# Bulk (backfill) parsing of a directory tree or glob of resumes with a pool
+# of worker processes. Results are streamed as JSON lines, progress is
+# checkpointed so an interrupted run picks up where it stopped, and the app's
+# content-hash result cache is shared (same file key tier as /parse-resume).
+#
+# Usage (from parser/):
+#   python bulk_parse.py /data/resumes --output results.jsonl
+#   python bulk_parse.py "/data/resumes/**/*.pdf" --output out/ --shard-size 10000 --workers 8
+#
+# Output records (one per file):
+#   {"path": ..., "sha1": ..., "status": "ok" | "cached", "result": {...}}
+#   {"path": ..., "sha1": ..., "status": "error", "error": "..."}
+#   {"path": ..., "sha1": ..., "status": "duplicate", "duplicate_of": ..., "similarity": 0.93}
+#
+# Checkpoint: one JSON line {"path", "status"} per finished file, written after
+# the file's output record. Files already in the checkpoint are skipped on the
+# next run (failures too, unless --retry-failed).
+#
+# --index adds every parsed file (keyed by path) to a candidate search index
+# (resume_parser.candidate_index), saved when the run ends. After a hard
+# crash, re-add the output with `python -m resume_parser.candidate_index add`.
+#
+# --near-duplicates flag|skip checks every file's text against the files seen
+# before it (resume_parser.near_duplicates) before parsing it. "flag" parses
+# it anyway and adds "duplicate_of" / "similarity" to its record; "skip" does
+# not parse (or index) it and writes a "duplicate" record instead. Files are
+# compared with the first file of their group. --near-duplicates-index keeps
+# the seen files across runs.
+
+from __future__ import annotations
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Set
+
+from resume_parser.cache import ResultCache
+from resume_parser.candidate_index import CandidateIndex
+from resume_parser.extract_text import extract_text_from_upload
+from resume_parser.near_duplicates import NEAR_DUPLICATE_THRESHOLD, NearDuplicateIndex, minhash
+from resume_parser.pipeline import RESULT_VERSION, parse_text, parse_upload_json, warm_up
+from resume_parser.serialization import dump_json, splice_json
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(BASE_DIR, "cache")
+
+# Same defaults as the app, so both read and fill the same cache.
+CACHE_DB_PATH = os.environ.get("CACHE_DB_PATH", os.path.join(CACHE_DIR, "results.sqlite3"))
+CACHE_MAX_ITEMS = int(os.environ.get("CACHE_MAX_ITEMS", 100_000))
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx", ".txt")
+
+
+# ---------- Input discovery ----------
+
+
+def iter_input_files(inputs: List[str], extensions=SUPPORTED_EXTENSIONS) -> Iterator[str]:
+    """
+    Yield supported files under each input (a directory, walked recursively,
+    a glob pattern, or a single file), as absolute paths in a stable order.
+    """
+    seen: Set[str] = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            candidates = []
+            for root, dirs, files in os.walk(item):
+                dirs.sort()
+                candidates.extend(os.path.join(root, name) for name in sorted(files))
+        elif os.path.isfile(item):
+            candidates = [item]
+        else:
+            candidates = sorted(glob.glob(item, recursive=True))
+
+        for path in candidates:
+            path = os.path.abspath(path)
+            if path in seen or not path.lower().endswith(extensions) or not os.path.isfile(path):
+                continue
+            seen.add(path)
+            yield path
+
+
+# ---------- Worker side ----------
+
+_worker_cache: Optional[ResultCache] = None
+
+
+def _init_worker(cache_db: Optional[str], cache_max_items: int) -> None:
+    global _worker_cache
+    warm_up()
+    if cache_db:
+        _worker_cache = ResultCache(cache_db, version=RESULT_VERSION, memory_items=0, max_disk_items=cache_max_items)
+
+
+def _cache_key(file_hash: str) -> str:
+    # Same key as the app's file-bytes tier (app.file_cache_key).
+    return f"file-{file_hash}"
+
+
+def process_file(path: str, near_duplicates: bool = False) -> Dict:
+    """
+    Parse one file (or fetch it from the cache) and return its output record.
+    The result stays serialized JSON (bytes) all the way to the output file.
+
+    With `near_duplicates`, the record also carries the MinHash "signature"
+    of the text, and an uncached file is only extracted: it comes back as
+    status "extracted" with its "text", for parse_extracted once the parent
+    has checked it against the files seen so far.
+    """
+    record: Dict = {"path": path, "sha1": None}
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        file_hash = hashlib.sha1(data).hexdigest()
+        record["sha1"] = file_hash
+        key = _cache_key(file_hash)
+
+        cached = _worker_cache.get_raw(key) if _worker_cache else None
+        if near_duplicates:
+            raw_text = extract_text_from_upload(data, os.path.basename(path))
+            record["signature"] = minhash(raw_text)
+            if cached is None:
+                record.update(status="extracted", text=raw_text)
+                return record
+        if cached is not None:
+            record.update(status="cached", result=cached)
+            return record
+
+        result = parse_upload_json(os.path.basename(path), data)
+        if _worker_cache:
+            _worker_cache.set_raw(key, result)
+        record.update(status="ok", result=result)
+    except Exception as e:
+        record.update(status="error", error=f"{type(e).__name__}: {e}")
+    return record
+
+
+def parse_extracted(record: Dict) -> Dict:
+    """Second half of process_file(near_duplicates=True): parse the extracted text."""
+    try:
+        result = dump_json(parse_text(record.pop("text")))
+        if _worker_cache:
+            _worker_cache.set_raw(_cache_key(record["sha1"]), result)
+        record.update(status="ok", result=result)
+    except Exception as e:
+        record.update(status="error", error=f"{type(e).__name__}: {e}")
+    return record
+
+
+# ---------- Output & checkpoint ----------
+
+
+def _open_for_append(path: str):
+    """
+    Open a JSON-lines file for appending, first dropping a partial last line
+    left behind by a crash mid-write.
+    """
+    if os.path.exists(path):
+        with open(path, "rb+") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size:
+                f.seek(max(0, size - 65536))
+                tail = f.read()
+                if not tail.endswith(b"\n"):
+                    cut = tail.rfind(b"\n")
+                    f.truncate(size - len(tail) + cut + 1 if cut >= 0 else max(0, size - len(tail)))
+    return open(path, "ab")
+
+
+def load_checkpoint(path: str) -> Dict[str, str]:
+    """{path: status} for every file a previous run finished."""
+    done: Dict[str, str] = {}
+    if not os.path.exists(path):
+        return done
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # partial last line after a crash
+            done[entry["path"]] = entry["status"]
+    return done
+
+
+class ResultWriter:
+    """
+    Appends output records to a single JSONL file, or to numbered shards of
+    `shard_size` records in a directory. A resumed run starts a new shard
+    instead of reopening an old one.
+    """
+
+    def __init__(self, output: str, shard_size: int = 0):
+        self.output = output
+        self.shard_size = shard_size
+        self._file = None
+        self._in_shard = 0
+        if shard_size:
+            os.makedirs(output, exist_ok=True)
+            existing = glob.glob(os.path.join(output, "results-*.jsonl"))
+            self._next_shard = len(existing)
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+            self._file = _open_for_append(output)
+
+    def _rotate(self) -> None:
+        if self._file:
+            self._file.close()
+        path = os.path.join(self.output, f"results-{self._next_shard:05d}.jsonl")
+        self._next_shard += 1
+        self._in_shard = 0
+        self._file = open(path, "ab")
+
+    def write(self, record: Dict) -> None:
+        if self.shard_size and (self._file is None or self._in_shard >= self.shard_size):
+            self._rotate()
+        if "result" in record:
+            fields = {k: v for k, v in record.items() if k != "result"}
+            line = splice_json(fields, {"result": record["result"]})
+        else:
+            line = json.dumps(record, ensure_ascii=False).encode("utf-8")
+        self._file.write(line + b"\n")
+        self._file.flush()
+        self._in_shard += 1
+
+    def close(self) -> None:
+        if self._file:
+            self._file.close()
+
+
+# ---------- Progress ----------
+
+
+class Progress:
+    """Counts outcomes and prints docs/s and failures to stderr every `every` seconds."""
+
+    def __init__(self, total: int, skipped: int, every: float):
+        self.total = total
+        self.skipped = skipped
+        self.every = every
+        self.counts = {"ok": 0, "cached": 0, "duplicate": 0, "error": 0}
+        self.start = self._last = time.perf_counter()
+        self._last_done = 0
+
+    @property
+    def done(self) -> int:
+        return sum(self.counts.values())
+
+    def add(self, record: Dict) -> None:
+        self.counts[record["status"]] += 1
+        if record["status"] == "error":
+            print(f"FAILED {record['path']}: {record['error']}", file=sys.stderr)
+        now = time.perf_counter()
+        if now - self._last >= self.every:
+            recent = (self.done - self._last_done) / (now - self._last)
+            self._last, self._last_done = now, self.done
+            print(self.line(recent), file=sys.stderr)
+
+    def line(self, recent: Optional[float] = None) -> str:
+        elapsed = time.perf_counter() - self.start
+        rate = self.done / elapsed if elapsed else 0.0
+        text = (
+            f"{self.done}/{self.total} done ({self.skipped} skipped from checkpoint), "
+            f"{rate:.1f} docs/s"
+        )
+        if recent is not None:
+            text += f" (last interval {recent:.1f} docs/s)"
+        return text + (
+            f", {self.counts['cached']} cached, {self.counts['duplicate']} duplicates skipped,"
+            f" {self.counts['error']} failed"
+        )
+
+    def summary(self) -> Dict:
+        elapsed = time.perf_counter() - self.start
+        return {
+            **self.counts,
+            "processed": self.done,
+            "skipped": self.skipped,
+            "elapsed_s": round(elapsed, 3),
+            "docs_per_s": round(self.done / elapsed, 2) if elapsed else 0.0,
+        }
+
+
+# ---------- Driver ----------
+
+
+def run_bulk(
+    inputs: List[str],
+    output: str,
+    checkpoint: Optional[str] = None,
+    workers: int = os.cpu_count() or 1,
+    shard_size: int = 0,
+    use_cache: bool = True,
+    retry_failed: bool = False,
+    progress_every: float = 10.0,
+    index_path: Optional[str] = None,
+    near_duplicates: Optional[str] = None,
+    near_duplicate_threshold: float = NEAR_DUPLICATE_THRESHOLD,
+    near_duplicates_index: Optional[str] = None,
+) -> Dict:
+    """
+    Parse every input file not already checkpointed; returns the run summary.
+    `near_duplicates` is None, "flag" or "skip" (see the module comment).
+    """
+    if near_duplicates not in (None, "flag", "skip"):
+        raise ValueError(f"Unknown near_duplicates mode: {near_duplicates}")
+    checkpoint = checkpoint or (
+        os.path.join(output, "checkpoint.jsonl") if shard_size else output + ".checkpoint"
+    )
+    done = load_checkpoint(checkpoint)
+    skip = {p for p, status in done.items() if status != "error" or not retry_failed}
+
+    todo = [p for p in iter_input_files(inputs) if p not in skip]
+    progress = Progress(total=len(todo), skipped=len(skip), every=progress_every)
+    print(f"{len(todo)} files to parse with {workers} workers -> {output}", file=sys.stderr)
+
+    if use_cache:
+        os.makedirs(os.path.dirname(os.path.abspath(CACHE_DB_PATH)), exist_ok=True)
+    writer = ResultWriter(output, shard_size)
+    checkpoint_file = _open_for_append(checkpoint)
+    index = CandidateIndex.open(index_path) if index_path else None
+    seen = None
+    if near_duplicates:
+        seen = (
+            NearDuplicateIndex.open(near_duplicates_index, near_duplicate_threshold)
+            if near_duplicates_index
+            else NearDuplicateIndex(near_duplicate_threshold)
+        )
+
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(CACHE_DB_PATH if use_cache else None, CACHE_MAX_ITEMS),
+    )
+    # Keep a bounded number of files in flight instead of queueing them all.
+    max_in_flight = workers * 4
+    in_flight: Set[Future] = set()
+    files = iter(todo)
+    # parse_extracted steps not finished yet -> path. Those files were checked
+    # for near-duplicates (and indexed if original) but are not parsed yet.
+    parsing: Dict[Future, str] = {}
+
+    def finish(future: Future) -> Optional[Future]:
+        """Record a finished file, or return the future of its parse_extracted step."""
+        parsing.pop(future, None)
+        record = future.result()
+        signature = record.pop("signature", None)
+        if signature is not None:
+            match = seen.check(record["path"], signature)
+            if match is not None:
+                record["duplicate_of"], record["similarity"] = match[0], round(match[1], 3)
+                if near_duplicates == "skip" and record["status"] == "extracted":
+                    del record["text"]
+                    record["status"] = "duplicate"
+        if record["status"] == "extracted":
+            parse = pool.submit(parse_extracted, record)
+            parsing[parse] = record["path"]
+            return parse
+        if record["status"] == "error" and seen is not None:
+            # A file that failed to parse is no group's original.
+            seen.remove(record["path"])
+
+        writer.write(record)
+        # Only checkpoint once the record is safely in the output.
+        entry = {"path": record["path"], "status": record["status"]}
+        checkpoint_file.write(json.dumps(entry).encode("utf-8") + b"\n")
+        checkpoint_file.flush()
+        progress.add(record)
+        if index is not None:
+            if "result" in record:
+                index.add(record["path"], json.loads(record["result"]))
+            else:
+                index.delete(record["path"])
+        return None
+
+    try:
+        while True:
+            for path in files:
+                in_flight.add(pool.submit(process_file, path, seen is not None))
+                if len(in_flight) >= max_in_flight:
+                    break
+            if not in_flight:
+                break
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                parse = finish(future)
+                if parse is not None:
+                    in_flight.add(parse)
+    except KeyboardInterrupt:
+        print("interrupted; finishing files in flight (the next run resumes from here)", file=sys.stderr)
+        for future in in_flight:
+            future.cancel()
+        for future in in_flight:
+            # Extracted-only files are left for the next run.
+            if not future.cancelled() and future.result()["status"] != "extracted":
+                finish(future)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        writer.close()
+        checkpoint_file.close()
+        if index is not None:
+            index.save(index_path)
+        if seen is not None:
+            # Files whose parse never finished are left for the next run and
+            # are nobody's original until then.
+            for path in parsing.values():
+                seen.remove(path)
+            if near_duplicates_index:
+                seen.save(near_duplicates_index)
+
+    print(progress.line(), file=sys.stderr)
+    return progress.summary()
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Parse a directory or glob of resumes into JSON lines")
+    parser.add_argument("inputs", nargs="+", help="directories (recursive), glob patterns or files")
+    parser.add_argument("--output", required=True, help="JSONL file, or directory with --shard-size")
+    parser.add_argument("--shard-size", type=int, default=0, help="records per output shard (0 = single file)")
+    parser.add_argument("--checkpoint", help="progress file (default: next to the output)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--no-cache", action="store_true", help="don't read or fill the shared result cache")
+    parser.add_argument("--retry-failed", action="store_true", help="parse files that failed in a previous run again")
+    parser.add_argument("--progress-every", type=float, default=10.0, help="seconds between progress lines")
+    parser.add_argument("--index", help="add parsed files to this candidate search index file")
+    parser.add_argument(
+        "--near-duplicates",
+        choices=["flag", "skip"],
+        help="check each file for near-duplicates of earlier files: flag them, or skip parsing them",
+    )
+    parser.add_argument("--near-duplicate-threshold", type=float, default=NEAR_DUPLICATE_THRESHOLD)
+    parser.add_argument("--near-duplicates-index", help="file keeping the near-duplicate index across runs")
+    args = parser.parse_args(argv)
+
+    summary = run_bulk(
+        args.inputs,
+        args.output,
+        checkpoint=args.checkpoint,
+        workers=args.workers,
+        shard_size=args.shard_size,
+        use_cache=not args.no_cache,
+        retry_failed=args.retry_failed,
+        progress_every=args.progress_every,
+        index_path=args.index,
+        near_duplicates=args.near_duplicates,
+        near_duplicate_threshold=args.near_duplicate_threshold,
+        near_duplicates_index=args.near_duplicates_index,
+    )
+    print(json.dumps(summary))
+    return 1 if summary["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
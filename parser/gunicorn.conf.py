@@ -0,0 +1,43 @@
+# gunicorn.conf.py
+#
+# Multi-worker deployment:  gunicorn -c gunicorn.conf.py app:app
+#
+# With PRELOAD_MODELS=1 (default) the master loads spaCy and the skills
+# taxonomy, runs a warm-up parse and freezes the GC heap before forking, so
+# workers share the model pages copy-on-write and the first request is warm.
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 8000)}"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 120))
+
+PRELOAD_MODELS = os.environ.get("PRELOAD_MODELS", "1") == "1"
+preload_app = PRELOAD_MODELS
+
+
+def when_ready(server):
+    # Runs in the master after the app is imported and before workers fork.
+    if not PRELOAD_MODELS:
+        return
+
+    from resume_parser.preload import preload, memory_usage
+
+    stats = preload()
+    server.log.info(
+        "Preloaded models in %.3fs (master rss=%s bytes)",
+        stats["preload_seconds"],
+        memory_usage()["rss_bytes"],
+    )
+
+
+def post_fork(server, worker):
+    from resume_parser.preload import memory_usage
+
+    mem = memory_usage()
+    server.log.info(
+        "Worker %s forked: rss=%s bytes, pss=%s bytes",
+        worker.pid,
+        mem["rss_bytes"],
+        mem["pss_bytes"],
+    )
@@ -1,6 +1,9 @@
-from resume_parser.schema import ResumeOutput, ContactField, SkillField, ExperienceEntry, EducationEntry
+from resume_parser.schema import ResumeOutput
 
 def build_resume_output(parsed_data: dict) -> ResumeOutput:
+    # The nested fields are assembled as plain dicts and validated in a single
+    # pydantic-core call (ResumeOutput.model_validate) instead of constructing
+    # and validating every sub-model separately from Python.
     # Contacts
     name_info = parsed_data.get("name", {"value": None, "confidence": 0.0})
     primary_email_info = parsed_data.get(
@@ -13,7 +16,7 @@ def build_resume_output(parsed_data: dict) -> ResumeOutput:
     # Skills
     skills_detailed = parsed_data.get("skills_detailed", [])
     skills = [
-        SkillField(value=s.get("value"), confidence=float(s.get("confidence", 0.0)))
+        {"value": s.get("value"), "confidence": float(s.get("confidence", 0.0))}
         for s in skills_detailed
         if s.get("value")
     ]
@@ -21,27 +24,28 @@ def build_resume_output(parsed_data: dict) -> ResumeOutput:
     # Experience
     experience_raw = parsed_data.get("experience", [])
     experience = [
-        ExperienceEntry(
-            title=exp.get("title"),
-            company=exp.get("company"),
-            start_year=exp.get("start_year"),
-            end_year=exp.get("end_year"),
-            years=exp.get("years"),
-            responsibilities=exp.get("responsibilities") or [],
-            confidence=float(exp.get("confidence", 0.0)),
-        )
+        {
+            "title": exp.get("title"),
+            "company": exp.get("company"),
+            "start_year": exp.get("start_year"),
+            # 'present' (ongoing role) has no end year; clients render None as "Present"
+            "end_year": exp.get("end_year") if isinstance(exp.get("end_year"), int) else None,
+            "years": exp.get("years"),
+            "responsibilities": exp.get("responsibilities") or [],
+            "confidence": float(exp.get("confidence", 0.0)),
+        }
         for exp in experience_raw
     ]
 
     # Education
     education_raw = parsed_data.get("education", [])
     education = [
-        EducationEntry(
-            degree_raw=ed.get("degree_raw"),
-            line=ed.get("line"),
-            graduation_year=ed.get("graduation_year"),
-            confidence=float(ed.get("confidence", 0.0)),
-        )
+        {
+            "degree_raw": ed.get("degree_raw"),
+            "line": ed.get("line"),
+            "graduation_year": ed.get("graduation_year"),
+            "confidence": float(ed.get("confidence", 0.0)),
+        }
         for ed in education_raw
     ]
 
@@ -54,25 +58,25 @@ def build_resume_output(parsed_data: dict) -> ResumeOutput:
     phones = parsed_data.get("phones")
     skills_flat = parsed_data.get("skills")
 
-    return ResumeOutput(
-        name=ContactField(
-            value=name_info.get("value"),
-            confidence=float(name_info.get("confidence", 0.0)),
-        ),
-        primary_email=ContactField(
-            value=primary_email_info.get("value"),
-            confidence=float(primary_email_info.get("confidence", 0.0)),
-        ),
-        primary_phone=ContactField(
-            value=primary_phone_info.get("value"),
-            confidence=float(primary_phone_info.get("confidence", 0.0)),
-        ),
-        skills=skills,
-        experience=experience,
-        education=education,
-        language=language,
-        name_flat=name_flat,
-        emails=emails,
-        phones=phones,
-        skills_flat=skills_flat,
-    )
+    return ResumeOutput.model_validate({
+        "name": {
+            "value": name_info.get("value"),
+            "confidence": float(name_info.get("confidence", 0.0)),
+        },
+        "primary_email": {
+            "value": primary_email_info.get("value"),
+            "confidence": float(primary_email_info.get("confidence", 0.0)),
+        },
+        "primary_phone": {
+            "value": primary_phone_info.get("value"),
+            "confidence": float(primary_phone_info.get("confidence", 0.0)),
+        },
+        "skills": skills,
+        "experience": experience,
+        "education": education,
+        "language": language,
+        "name_flat": name_flat,
+        "emails": emails,
+        "phones": phones,
+        "skills_flat": skills_flat,
+    })
@@ -0,0 +1,208 @@
+# resume_parser/cache.py
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from resume_parser.serialization import dump_json
+
+# How many inserts between two disk eviction passes (amortizes the DELETE).
+_EVICT_EVERY = 64
+
+
+class ResultCache:
+    """
+    Two-tier cache for parse results.
+
+    - Tier 1: in-process LRU (OrderedDict) holding the serialized JSON bytes.
+    - Tier 2: a single SQLite file shared by all workers on the box, storing
+      compact (minified + zlib) JSON blobs.
+
+    `get_raw`/`set_raw` work on the serialized JSON directly, so a result can
+    be serialized once and the same bytes cached and sent as the response;
+    `get`/`set` decode/encode around them for callers that want plain data.
+
+    Every key is prefixed with `version` (parser + taxonomy version), so a
+    parser or taxonomy upgrade never serves stale results. Entries older than
+    `ttl_seconds` are treated as misses and dropped; the disk tier keeps at
+    most `max_disk_items` rows, evicting the least recently used.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        version: str,
+        memory_items: int = 1024,
+        max_disk_items: int = 100_000,
+        ttl_seconds: Optional[float] = None,
+    ):
+        self.db_path = db_path
+        self.version = version
+        self.memory_items = memory_items
+        self.max_disk_items = max_disk_items
+        self.ttl_seconds = ttl_seconds
+
+        self._memory: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._inserts = 0
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "memory_evictions": 0,
+            "disk_evictions": 0,
+        }
+
+    # ---------- SQLite connection (one per process, opened lazily) ----------
+
+    def _db(self) -> sqlite3.Connection:
+        # A connection must never be reused across fork(), so reopen per pid.
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_results_accessed ON results(accessed_at)")
+            conn.commit()
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    # ---------- Encoding ----------
+
+    @staticmethod
+    def _encode(raw: bytes) -> bytes:
+        return zlib.compress(raw)
+
+    @staticmethod
+    def _decode(blob: bytes) -> bytes:
+        return zlib.decompress(blob)
+
+    # ---------- Public API ----------
+
+    def _full_key(self, key: str) -> str:
+        return f"{self.version}:{key}"
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.get_raw(key)
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        self.set_raw(key, dump_json(value))
+
+    def get_raw(self, key: str) -> Optional[bytes]:
+        """The cached result as serialized (compact UTF-8) JSON, or None."""
+        full_key = self._full_key(key)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(full_key)
+            if entry is not None:
+                created_at, value = entry
+                if not self._expired(created_at, now):
+                    self._memory.move_to_end(full_key)
+                    self._stats["memory_hits"] += 1
+                    return value
+                del self._memory[full_key]
+
+            try:
+                db = self._db()
+                row = db.execute(
+                    "SELECT value, created_at FROM results WHERE key = ?", (full_key,)
+                ).fetchone()
+                if row is None:
+                    self._stats["misses"] += 1
+                    return None
+
+                blob, created_at = row
+                if self._expired(created_at, now):
+                    db.execute("DELETE FROM results WHERE key = ?", (full_key,))
+                    db.commit()
+                    self._stats["expired"] += 1
+                    self._stats["misses"] += 1
+                    return None
+
+                db.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, full_key))
+                db.commit()
+                value = self._decode(blob)
+            except (sqlite3.Error, ValueError, zlib.error):
+                self._stats["misses"] += 1
+                return None
+
+            self._stats["disk_hits"] += 1
+            self._remember(full_key, created_at, value)
+            return value
+
+    def set_raw(self, key: str, raw: bytes) -> None:
+        """Cache a result given as serialized JSON (see serialization.dump_json)."""
+        full_key = self._full_key(key)
+        now = time.time()
+
+        with self._lock:
+            self._remember(full_key, now, raw)
+            try:
+                db = self._db()
+                db.execute(
+                    "INSERT OR REPLACE INTO results (key, value, created_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    (full_key, self._encode(raw), now, now),
+                )
+                db.commit()
+                self._inserts += 1
+                if self._inserts % _EVICT_EVERY == 0:
+                    self._evict_disk(db, now)
+            except sqlite3.Error:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "memory_items": len(self._memory)}
+
+    # ---------- Eviction ----------
+
+    def _remember(self, full_key: str, created_at: float, raw: bytes) -> None:
+        self._memory[full_key] = (created_at, raw)
+        self._memory.move_to_end(full_key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+            self._stats["memory_evictions"] += 1
+
+    def _evict_disk(self, db: sqlite3.Connection, now: float) -> None:
+        if self.ttl_seconds is not None:
+            cur = db.execute("DELETE FROM results WHERE created_at < ?", (now - self.ttl_seconds,))
+            self._stats["disk_evictions"] += cur.rowcount
+
+        (count,) = db.execute("SELECT COUNT(*) FROM results").fetchone()
+        overflow = count - self.max_disk_items
+        if overflow > 0:
+            cur = db.execute(
+                "DELETE FROM results WHERE key IN"
+                " (SELECT key FROM results ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            )
+            self._stats["disk_evictions"] += cur.rowcount
+        db.commit()
@@ -0,0 +1,542 @@
+# resume_parser/candidate_index.py
+#
+# Inverted index over parsed resumes (ResumeOutput records) for boolean
+# candidate search by skill, degree and years of experience, e.g.
+#   python AND react AND NOT php AND years>=3
+#   (degree:msc OR level:doctorate) AND (java OR kotlin) AND years<5
+#
+# Records are added and deleted one at a time as parses land; the index is
+# saved to a single file and loaded back, never rebuilt from the results.
+#
+# CLI (from parser/):
+#   python -m resume_parser.candidate_index add index.pkl results.jsonl ...
+#   python -m resume_parser.candidate_index search index.pkl "python AND react AND NOT php AND years>=3"
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import json
+import math
+import os
+import pickle
+import re
+import sys
+import time
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from resume_parser.extract_education import DEGREE_LEVELS, degree_id
+from resume_parser.schema import ResumeOutput
+
+# Format of saved index files; bump when the pickled layout changes.
+INDEX_FORMAT = 1
+
+# Years of experience are bucketed by whole years; the last bucket is "this
+# many or more".
+MAX_YEARS_BUCKET = 30
+
+SKILL_PREFIX = "skill:"
+DEGREE_PREFIX = "degree:"
+LEVEL_PREFIX = "level:"
+YEARS_PREFIX = "years:"
+
+# Deleted ids are reclaimed by compact() once they make up this fraction of
+# all ids (and there are at least COMPACT_MIN_DELETED of them), so masks stay
+# proportional to the live records under churn.
+COMPACT_RATIO = 0.5
+COMPACT_MIN_DELETED = 1024
+
+
+# ---------- Posting lists ----------
+
+
+class Posting:
+    """
+    Ids of the candidates that have one term.
+
+    Stored like a roaring container: a sorted uint32 id array while the term
+    is rare, switched to a packed bitset (numpy uint8, little-endian bit
+    order) once the array would take more space than the bitset. Ids are
+    handed out in increasing order, so adding to the array is an append.
+    """
+
+    __slots__ = ("ids", "bits", "count")
+
+    def __init__(self):
+        self.ids: Optional[array] = array("I")
+        self.bits: Optional[np.ndarray] = None
+        self.count = 0
+
+    def add(self, doc_id: int, capacity: int) -> None:
+        """Add `doc_id`; `capacity` is the index's id capacity (a multiple of 8)."""
+        self.count += 1
+        if self.ids is not None:
+            self.ids.append(doc_id)
+            if len(self.ids) * self.ids.itemsize > capacity // 8:
+                self.bits = self.mask(capacity)
+                self.ids = None
+            return
+        if len(self.bits) * 8 < capacity:
+            # Grow geometrically so appending ids stays amortized O(1).
+            grown = np.zeros(max(capacity // 8, 2 * len(self.bits)), np.uint8)
+            grown[: len(self.bits)] = self.bits
+            self.bits = grown
+        self.bits[doc_id >> 3] |= np.uint8(1 << (doc_id & 7))
+
+    def remove(self, doc_id: int) -> None:
+        if self.ids is not None:
+            i = bisect.bisect_left(self.ids, doc_id)
+            if i < len(self.ids) and self.ids[i] == doc_id:
+                del self.ids[i]
+                self.count -= 1
+            return
+        byte, bit = doc_id >> 3, np.uint8(1 << (doc_id & 7))
+        if byte < len(self.bits) and self.bits[byte] & bit:
+            self.bits[byte] &= ~bit
+            self.count -= 1
+
+    def mask(self, capacity: int) -> np.ndarray:
+        """The ids as a packed bitset of `capacity` bits (a new array)."""
+        if self.ids is None:
+            size = capacity // 8
+            if len(self.bits) >= size:
+                return self.bits[:size].copy()
+            out = np.zeros(size, np.uint8)
+            out[: len(self.bits)] = self.bits
+            return out
+        dense = np.zeros(capacity, dtype=bool)
+        dense[np.frombuffer(self.ids, dtype=np.uint32)] = True
+        return np.packbits(dense, bitorder="little")
+
+
+# ---------- Query language ----------
+#
+#   query   := or
+#   or      := and ("OR" and)*
+#   and     := unary (["AND"] unary)*        (juxtaposition means AND)
+#   unary   := "NOT" unary | "(" or ")" | years | term
+#   years   := "years" ("<" | "<=" | ">" | ">=" | "=") number
+#   term    := skill id | "skill:" id | "degree:" id | "level:" level
+#
+# Keywords are case-insensitive; terms are lowercased. Skill ids with spaces
+# can be quoted: "machine learning".
+
+_TOKEN_RE = re.compile(
+    r'\s*(?:(?P<open>\()|(?P<close>\))|"(?P<quoted>[^"]*)"'
+    r"|years\s*(?P<op><=|>=|<|>|=)\s*(?P<num>\d+(?:\.\d+)?)(?![\w.])"
+    r"|(?P<bad_years>years\s*[<>=!][^\s()\"]*)"
+    r"|(?P<word>[^\s()\"]+))",
+    re.IGNORECASE,
+)
+
+
+class QueryError(ValueError):
+    pass
+
+
+def _tokenize(query: str) -> List[Tuple[str, Any]]:
+    tokens: List[Tuple[str, Any]] = []
+    pos = 0
+    query = query.rstrip()
+    while pos < len(query):
+        m = _TOKEN_RE.match(query, pos)
+        if not m or m.end() == pos:
+            raise QueryError(f"Cannot parse query at: {query[pos:]!r}")
+        pos = m.end()
+        if m.group("open"):
+            tokens.append(("(", None))
+        elif m.group("close"):
+            tokens.append((")", None))
+        elif m.group("op"):
+            tokens.append(("years", (m.group("op"), float(m.group("num")))))
+        elif m.group("bad_years"):
+            raise QueryError(f"Invalid years comparison: {m.group('bad_years')!r} (e.g. years>=3)")
+        elif m.group("quoted") is not None:
+            tokens.append(("term", m.group("quoted").strip().lower()))
+        elif m.group("word").upper() in ("AND", "OR", "NOT"):
+            tokens.append((m.group("word").upper(), None))
+        else:
+            tokens.append(("term", m.group("word").lower()))
+    return tokens
+
+
+def parse_query(query: str) -> Tuple:
+    """
+    Parse a query string into a tree of ("and", a, b), ("or", a, b),
+    ("not", a), ("term", "skill:python"), ("years", op, value) nodes.
+    """
+    tokens = _tokenize(query)
+    pos = 0
+
+    def peek() -> Optional[str]:
+        return tokens[pos][0] if pos < len(tokens) else None
+
+    def take() -> Tuple[str, Any]:
+        nonlocal pos
+        if pos >= len(tokens):
+            raise QueryError("Unexpected end of query")
+        pos += 1
+        return tokens[pos - 1]
+
+    def parse_or() -> Tuple:
+        node = parse_and()
+        while peek() == "OR":
+            take()
+            node = ("or", node, parse_and())
+        return node
+
+    def parse_and() -> Tuple:
+        node = parse_unary()
+        while peek() not in (None, "OR", ")"):
+            if peek() == "AND":
+                take()
+            node = ("and", node, parse_unary())
+        return node
+
+    def parse_unary() -> Tuple:
+        kind, value = take()
+        if kind == "NOT":
+            return ("not", parse_unary())
+        if kind == "(":
+            node = parse_or()
+            if take()[0] != ")":
+                raise QueryError("Expected ')'")
+            return node
+        if kind == "years":
+            return ("years", *value)
+        if kind == "term":
+            if not value.startswith((SKILL_PREFIX, DEGREE_PREFIX, LEVEL_PREFIX)):
+                value = SKILL_PREFIX + value
+            return ("term", value)
+        raise QueryError(f"Unexpected {kind!r} in query")
+
+    if not tokens:
+        raise QueryError("Empty query")
+    tree = parse_or()
+    if pos != len(tokens):
+        raise QueryError(f"Unexpected {tokens[pos][0]!r} in query")
+    return tree
+
+
+# ---------- Candidate terms ----------
+
+
+def experience_years(resume: ResumeOutput) -> float:
+    """
+    Total years of experience: the union of the experience entries' year
+    ranges (overlapping roles count once), or the sum of their durations
+    when no start years are known.
+    """
+    spans = sorted(
+        (e.start_year, e.start_year + e.years)
+        for e in resume.experience
+        if e.start_year is not None and e.years is not None and e.years >= 0
+    )
+    if not spans:
+        return float(sum(e.years for e in resume.experience if e.years and e.years > 0))
+
+    total = 0.0
+    start, end = spans[0]
+    for s, e in spans[1:]:
+        if s > end:
+            total += end - start
+            start, end = s, e
+        else:
+            end = max(end, e)
+    return float(total + end - start)
+
+
+def candidate_terms(resume: ResumeOutput) -> Tuple[List[str], float]:
+    """(index terms, years of experience) of one parsed resume."""
+    terms = {SKILL_PREFIX + skill.value.lower() for skill in resume.skills}
+    for entry in resume.education:
+        canonical = degree_id(entry.degree_raw)
+        if canonical:
+            terms.add(DEGREE_PREFIX + canonical)
+            terms.add(LEVEL_PREFIX + DEGREE_LEVELS[canonical])
+    years = experience_years(resume)
+    terms.add(f"{YEARS_PREFIX}{min(int(years), MAX_YEARS_BUCKET)}")
+    return sorted(terms), years
+
+
+# ---------- Index ----------
+
+
+class CandidateIndex:
+    """
+    Inverted index from skill / degree / years-bucket terms to candidates.
+
+    Every record gets an internal id (increasing, so id order is insertion
+    order); `key` is the caller's id for it (e.g. the result cache key or a
+    file path). Adding a key again replaces its record. Queries combine the
+    terms' postings as packed bitsets with numpy bitwise operations, so a
+    query costs a few passes over (number of ids / 8) bytes whatever the
+    result size. Deleted ids are reclaimed by compact(), which runs by
+    itself when they pile up (see COMPACT_RATIO).
+    """
+
+    def __init__(self):
+        self._keys: List[Optional[str]] = []  # id -> key (None once deleted)
+        self._ids: Dict[str, int] = {}  # key -> id
+        self._doc_terms: Dict[int, List[str]] = {}
+        self._years = array("f")  # id -> years of experience
+        self._postings: Dict[str, Posting] = {}
+        self._live = Posting()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._ids
+
+    @property
+    def deleted(self) -> int:
+        """Ids held by deleted records until the next compact()."""
+        return len(self._keys) - len(self._ids)
+
+    @property
+    def _capacity(self) -> int:
+        # Bits in every mask: ids so far, rounded up to whole bytes.
+        return (len(self._keys) + 7) // 8 * 8
+
+    # ---------- Updates ----------
+
+    def add(self, key: str, resume: ResumeOutput | Dict[str, Any]) -> None:
+        """Index (or re-index) the parsed resume `resume` under `key`."""
+        if not isinstance(resume, ResumeOutput):
+            resume = ResumeOutput.model_validate(resume)
+        terms, years = candidate_terms(resume)
+
+        self.delete(key)
+        doc_id = len(self._keys)
+        self._keys.append(key)
+        self._ids[key] = doc_id
+        self._years.append(years)
+        self._doc_terms[doc_id] = terms
+
+        capacity = self._capacity
+        self._live.add(doc_id, capacity)
+        for term in terms:
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = Posting()
+            posting.add(doc_id, capacity)
+
+    def delete(self, key: str) -> bool:
+        """Remove `key` from the index; False if it wasn't indexed."""
+        doc_id = self._ids.pop(key, None)
+        if doc_id is None:
+            return False
+        self._keys[doc_id] = None
+        self._live.remove(doc_id)
+        for term in self._doc_terms.pop(doc_id):
+            posting = self._postings[term]
+            posting.remove(doc_id)
+            if not posting.count:
+                del self._postings[term]
+        deleted = self.deleted
+        if deleted >= COMPACT_MIN_DELETED and deleted >= COMPACT_RATIO * len(self._keys):
+            self.compact()
+        return True
+
+    def compact(self) -> None:
+        """
+        Renumber the live records 0..n-1 (keeping their order) and rebuild
+        the postings, dropping the ids of deleted records. Costs one pass
+        over the live records' terms; delete() runs it after as many
+        deletions, so it is amortized O(1) per delete.
+        """
+        old_ids = [doc_id for doc_id, key in enumerate(self._keys) if key is not None]
+        doc_terms = self._doc_terms
+        years = self._years
+
+        self._keys = [self._keys[old] for old in old_ids]
+        self._ids = {key: doc_id for doc_id, key in enumerate(self._keys)}
+        self._doc_terms = {doc_id: doc_terms[old] for doc_id, old in enumerate(old_ids)}
+        self._years = array("f", (years[old] for old in old_ids))
+        self._postings = {}
+        self._live = Posting()
+
+        capacity = self._capacity
+        for doc_id, terms in self._doc_terms.items():
+            self._live.add(doc_id, capacity)
+            for term in terms:
+                posting = self._postings.get(term)
+                if posting is None:
+                    posting = self._postings[term] = Posting()
+                posting.add(doc_id, capacity)
+
+    # ---------- Queries ----------
+
+    def _term_mask(self, term: str) -> np.ndarray:
+        posting = self._postings.get(term)
+        if posting is None:
+            return np.zeros(self._capacity // 8, np.uint8)
+        return posting.mask(self._capacity)
+
+    def _years_mask(self, op: str, value: float) -> np.ndarray:
+        # Whole buckets from the postings; only a fractional boundary bucket
+        # is checked against the exact years.
+        low = math.floor(value)
+        if op in (">", ">="):
+            full = range(low + 1, MAX_YEARS_BUCKET + 1)
+        elif op in ("<", "<="):
+            full = range(0, min(low, MAX_YEARS_BUCKET))
+        else:
+            full = range(0)
+
+        mask = np.zeros(self._capacity // 8, np.uint8)
+        for bucket in full:
+            posting = self._postings.get(f"{YEARS_PREFIX}{bucket}")
+            if posting is not None:
+                mask |= posting.mask(self._capacity)
+
+        boundary = min(low, MAX_YEARS_BUCKET)
+        if boundary >= 0:
+            candidates = self._term_mask(f"{YEARS_PREFIX}{boundary}")
+            years = np.zeros(self._capacity, np.float32)
+            years[: len(self._years)] = np.frombuffer(self._years, dtype=np.float32)
+            compare = {
+                ">": np.greater, ">=": np.greater_equal, "<": np.less, "<=": np.less_equal, "=": np.equal,
+            }[op]
+            mask |= candidates & np.packbits(compare(years, value), bitorder="little")
+        return mask
+
+    def _eval(self, node: Tuple) -> np.ndarray:
+        kind = node[0]
+        if kind == "term":
+            return self._term_mask(node[1])
+        if kind == "years":
+            return self._years_mask(node[1], node[2])
+        if kind == "not":
+            return self._live.mask(self._capacity) & ~self._eval(node[1])
+        left, right = self._eval(node[1]), self._eval(node[2])
+        return left & right if kind == "and" else left | right
+
+    def search(self, query: str | Tuple, limit: Optional[int] = None) -> List[str]:
+        """
+        Keys of the candidates matching `query` (a query string or a
+        parse_query tree), oldest first, at most `limit` of them.
+        """
+        tree = parse_query(query) if isinstance(query, str) else query
+        if not self._keys:
+            return []
+        mask = self._eval(tree) & self._live.mask(self._capacity)
+        ids = np.flatnonzero(np.unpackbits(mask, bitorder="little"))
+        if limit is not None:
+            ids = ids[:limit]
+        keys = self._keys
+        return [keys[i] for i in ids.tolist()]
+
+    def count(self, query: str | Tuple) -> int:
+        tree = parse_query(query) if isinstance(query, str) else query
+        if not self._keys:
+            return 0
+        mask = self._eval(tree) & self._live.mask(self._capacity)
+        return int(np.unpackbits(mask).sum())
+
+    def term_counts(self) -> Dict[str, int]:
+        """Number of candidates per indexed term."""
+        return {term: posting.count for term, posting in self._postings.items()}
+
+    # ---------- Persistence ----------
+
+    def save(self, path: str) -> None:
+        """Write the index to `path` (atomically, via a temp file and rename)."""
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump((INDEX_FORMAT, self.__dict__), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "CandidateIndex":
+        with open(path, "rb") as f:
+            version, state = pickle.load(f)
+        if version != INDEX_FORMAT:
+            raise ValueError(f"{path}: index format {version}, expected {INDEX_FORMAT}")
+        index = cls.__new__(cls)
+        index.__dict__.update(state)
+        return index
+
+    @classmethod
+    def open(cls, path: str) -> "CandidateIndex":
+        """load() if `path` exists, else a new empty index."""
+        return cls.load(path) if os.path.exists(path) else cls()
+
+
+# ---------- CLI ----------
+
+
+def iter_result_records(paths: Iterable[str]) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+    """
+    (key, result) pairs from bulk_parse JSONL output files (key = the record's
+    path; result None for failed records) or single result JSON files.
+    """
+    for path in paths:
+        if path.endswith(".jsonl"):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    yield record.get("path"), record.get("result")
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                yield os.path.abspath(path), json.load(f)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Boolean candidate search over parsed resumes")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="add bulk_parse output (.jsonl) or result .json files")
+    add.add_argument("index")
+    add.add_argument("inputs", nargs="+")
+
+    search = commands.add_parser("search", help='e.g. "python AND react AND NOT php AND years>=3"')
+    search.add_argument("index")
+    search.add_argument("query")
+    search.add_argument("--limit", type=int, default=20)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "add":
+        index = CandidateIndex.open(args.index)
+        start = time.perf_counter()
+        added = 0
+        for key, result in iter_result_records(args.inputs):
+            if key is None:
+                continue
+            if result is None:
+                index.delete(key)
+            else:
+                index.add(key, result)
+                added += 1
+        index.save(args.index)
+        print(
+            f"indexed {added} records in {time.perf_counter() - start:.2f}s; {len(index)} candidates in {args.index}",
+            file=sys.stderr,
+        )
+        return 0
+
+    index = CandidateIndex.load(args.index)
+    try:
+        tree = parse_query(args.query)
+    except QueryError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    start = time.perf_counter()
+    keys = index.search(tree)
+    elapsed = time.perf_counter() - start
+    print(f"{len(keys)} of {len(index)} candidates match ({elapsed * 1000:.2f} ms)", file=sys.stderr)
+    for key in keys[: args.limit]:
+        print(key)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+# resume_parser/document.py
+
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Dict, List, Tuple
+
+from resume_parser.utils import clean_text, normalize_line, remove_repeated_lines
+from resume_parser.sections import section_line_ranges
+
+# Number of raw lines at the top of a resume looked at for the candidate name.
+HEAD_LINES = 5
+
+
+class ResumeDocument:
+    """
+    A resume's extracted text, split and normalized once and shared by every
+    extraction stage (sections, entities, experience, education).
+
+    - text:          the text as given
+    - lines:         normalized, non-empty lines (what extract_lines returns)
+    - line_offsets:  character offset in `text` of the raw line behind each line
+    - line_ends:     offset just past that raw line (terminator excluded)
+    - head_lines:    the first HEAD_LINES raw lines (text.splitlines()[:5])
+    - sections:      section key -> [(start, end), ...] ranges into `lines`
+                     (see sections.section_line_ranges)
+
+    The single-line clean text and its lowercase view are built on first use
+    and cached.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lines: List[str] = []
+        self.line_offsets: List[int] = []
+        self.line_ends: List[int] = []
+        self.head_lines: List[str] = []
+
+        offset = 0
+        for raw in text.splitlines(keepends=True):
+            content = raw.splitlines()[0]
+            if len(self.head_lines) < HEAD_LINES:
+                self.head_lines.append(content)
+            line = normalize_line(content)
+            if line:
+                self.lines.append(line)
+                self.line_offsets.append(offset)
+                self.line_ends.append(offset + len(content))
+            offset += len(raw)
+
+        self.sections: Dict[str, List[Tuple[int, int]]] = section_line_ranges(self.lines)
+
+    @cached_property
+    def clean(self) -> str:
+        """Whole text collapsed to a single line (see utils.clean_text)."""
+        return clean_text(self.text)
+
+    @cached_property
+    def lower(self) -> str:
+        """Lowercase view of `clean`."""
+        return self.clean.lower()
+
+    def section_lines(self, key: str) -> List[str]:
+        """Lines of section `key` (all occurrences, in order); [] if absent."""
+        return [line for start, end in self.sections.get(key, ()) for line in self.lines[start:end]]
+
+    def section_text(self, key: str) -> str:
+        """Text of section `key`, as detect_sections would return it; "" if absent."""
+        return "\n".join(self.section_lines(key))
+
+    def section_spans(self, key: str) -> List[Tuple[int, int]]:
+        """
+        (start, end) character spans of section `key` in `text`, one per
+        occurrence, so callers can slice the original text lazily.
+        """
+        return [
+            (self.line_offsets[start], self.line_ends[end - 1])
+            for start, end in self.sections.get(key, ())
+        ]
+
+    def block_lines(self, key: str) -> List[str]:
+        """
+        Lines of section `key`, or of the whole document if there is no such
+        section, with repeated header/footer lines removed. This is what the
+        block-based extractors (experience, education) work on.
+        """
+        return remove_repeated_lines(self.section_lines(key) or self.lines)
@@ -6,6 +6,7 @@ import re
 from typing import List, Dict, Any, Optional
 
 from .utils import clean_text_preserve_structure
+from .document import ResumeDocument
 
 DEGREE_PATTERNS = [
     r"(b\.?\s*tech|bachelor of technology)",
@@ -21,6 +22,14 @@ DEGREE_PATTERNS = [
 ]
 
 DEGREE_REGEXES = [re.compile(p, re.IGNORECASE) for p in DEGREE_PATTERNS]
+
+# Canonical id and level of each DEGREE_PATTERNS entry (same order).
+DEGREE_IDS = ["btech", "be", "mtech", "bsc", "msc", "bca", "mca", "bcom", "mcom", "phd"]
+DEGREE_LEVELS = {
+    "btech": "bachelor", "be": "bachelor", "bsc": "bachelor", "bca": "bachelor", "bcom": "bachelor",
+    "mtech": "master", "msc": "master", "mca": "master", "mcom": "master",
+    "phd": "doctorate",
+}
 YEAR_REGEX = re.compile(r"\b(19|20)\d{2}\b")
 
 def _education_signature(ed: dict) -> str:
@@ -43,6 +52,16 @@ def _find_degree(line_lower: str) -> Optional[str]:
     return None
 
 
+def degree_id(degree_raw: Optional[str]) -> Optional[str]:
+    """Canonical id (see DEGREE_IDS) of a degree as found in the text, e.g. "B.Sc" -> "bsc"."""
+    if not degree_raw:
+        return None
+    for rx, canonical in zip(DEGREE_REGEXES, DEGREE_IDS):
+        if rx.fullmatch(degree_raw.strip()):
+            return canonical
+    return None
+
+
 def _score_education(degree: Optional[str], grad_year: Optional[int]) -> float:
     if degree and grad_year:
         return 0.9
@@ -51,12 +70,13 @@ def _score_education(degree: Optional[str], grad_year: Optional[int]) -> float:
     return 0.0
 
 
-def extract_education(text: str, sections: dict | None = None) -> List[Dict[str, Any]]:
-    if sections and "education" in sections and sections["education"].strip():
-        text = sections["education"]
-
-    text = clean_text_preserve_structure(text)
-    lines = text.splitlines()
+def extract_education(text: str | ResumeDocument, sections: dict | None = None) -> List[Dict[str, Any]]:
+    if isinstance(text, ResumeDocument):
+        lines = text.block_lines("education")
+    else:
+        if sections and "education" in sections and sections["education"].strip():
+            text = sections["education"]
+        lines = clean_text_preserve_structure(text).splitlines()
 
     entries: List[Dict[str, Any]] = []
 
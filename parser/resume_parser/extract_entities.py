@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
-import json
+import os
 import re
-import importlib.resources as pkg_resources
+import time
 from typing import Dict, List, Any, Optional
 
 import spacy
 from resume_parser.utils import clean_text, detect_language
+from resume_parser.taxonomy import load_skill_matcher
+from resume_parser.document import ResumeDocument
+from resume_parser.semantic_skills import SEMANTIC_SKILLS, SemanticSkillMatcher
 
 # ---------- spaCy Models (multilingual + lazy) ----------
 
+# NER_MODE:
+#   - "full": load the whole pipeline (tagger, parser, lemmatizer, NER) and
+#             always run spaCy for name extraction (default).
+#   - "lite": load only what NER needs, and skip spaCy entirely when the
+#             capitalized-line heuristic already finds a confident name.
+# NER_MODEL picks the English model, e.g. "en_core_web_sm" for a smaller, faster one.
+NER_MODE = os.environ.get("NER_MODE", "full").lower()
+NER_MODEL = os.environ.get("NER_MODEL", "en_core_web_md")
+
+# Components the "lite" mode excludes: NER only needs tok2vec + ner.
+NER_LITE_EXCLUDE = ["tagger", "parser", "attribute_ruler", "lemmatizer", "senter"]
+
 _NLP_CACHE: Dict[str, spacy.language.Language] = {}
 
 
@@ -20,48 +35,69 @@ def get_nlp(lang_code: str) -> spacy.language.Language:
     Return a spaCy Language object for the given language code.
     Lazy-loads and caches pipelines so each model is loaded only once.
     Currently:
-      - 'en' -> en_core_web_md
+      - 'en' -> NER_MODEL (en_core_web_md by default)
       - others -> fallback to English
+    In "lite" NER mode, components NER doesn't need are not loaded at all.
     """
     lang_code = (lang_code or "en").split("-")[0].lower()
 
     if lang_code in _NLP_CACHE:
         return _NLP_CACHE[lang_code]
 
+    exclude = NER_LITE_EXCLUDE if NER_MODE == "lite" else []
+
     if lang_code == "en":
-        nlp = spacy.load("en_core_web_md")
+        nlp = spacy.load(NER_MODEL, exclude=exclude)
     else:
         # TODO: plug in other language pipelines as needed, e.g.:
         # if lang_code == "es": nlp = spacy.load("es_core_news_md")
-        nlp = spacy.load("en_core_web_md")
+        nlp = spacy.load(NER_MODEL, exclude=exclude)
 
     _NLP_CACHE[lang_code] = nlp
     return nlp
 
 # ---------- Skills Taxonomy ----------
 
-with pkg_resources.files(__package__).joinpath("skills_taxonomy.json").open(encoding="utf-8") as f:
-    SKILL_TAXONOMY: Dict[str, List[str]] = json.load(f)
+# Compiled artifact (memory-mapped) when available, else the JSON taxonomy
+# (see taxonomy.py). Either way skill lookup is a single pass per text,
+# whatever the taxonomy size. The version is part of the result cache key.
+SKILL_MATCHER, SKILL_TAXONOMY_VERSION = load_skill_matcher()
 
 
 
 
-# ---------- Name Extraction ----------
+# ---------- Name Extraction (now uses language-aware nlp) ----------
 
+# A "confident" heuristic name: 2-4 capitalized alphabetic words, e.g. "Mary-Jane O'Neil"
+_CONFIDENT_NAME_WORD = re.compile(r"^[A-Z][A-Za-z'\-]*\.?$")
 
-# ---------- Name Extraction (now uses language-aware nlp) ----------
+
+def _name_from_capitalized_lines(lines: List[str]) -> Optional[str]:
+    for line in lines:
+        words = line.strip().split()
+        if 1 < len(words) <= 4 and all(
+            w[0].isupper() for w in words if w.isalpha()
+        ):
+            return line.strip()
+    return None
 
 
-def extract_name_with_confidence(text: str, lang: str) -> Dict[str, Any]:
+def _confident_heuristic_name(lines: List[str]) -> Optional[str]:
     """
-    Extract candidate name with a simple confidence score and language-aware model.
+    Return the first non-empty header line if it is unambiguously a name
+    (only capitalized alphabetic words), otherwise None.
     """
-    nlp = get_nlp(lang)
+    for line in lines:
+        words = line.strip().split()
+        if not words:
+            continue
+        if 1 < len(words) <= 4 and all(_CONFIDENT_NAME_WORD.match(w) for w in words):
+            return line.strip()
+        return None
+    return None
 
-    lines = text.splitlines()
-    header = "\n".join(lines[:5])
 
-    doc = nlp(header)
+def _name_from_doc(doc, lines: List[str]) -> Dict[str, Any]:
     person_entities = [ent for ent in doc.ents if ent.label_ == "PERSON"]
 
     if person_entities:
@@ -69,16 +105,49 @@ def extract_name_with_confidence(text: str, lang: str) -> Dict[str, Any]:
         if len(best.text.split()) <= 4:
             return {"value": best.text.strip(), "confidence": 0.9}
 
-    for line in lines[:5]:
-        words = line.strip().split()
-        if 1 < len(words) <= 4 and all(
-            w[0].isupper() for w in words if w.isalpha()
-        ):
-            return {"value": line.strip(), "confidence": 0.7}
+    heuristic = _name_from_capitalized_lines(lines)
+    if heuristic:
+        return {"value": heuristic, "confidence": 0.7}
 
     return {"value": None, "confidence": 0.0}
 
 
+def extract_names_with_confidence(texts: List[str | ResumeDocument], lang: str) -> List[Dict[str, Any]]:
+    """
+    Batch version of extract_name_with_confidence.
+    Headers that still need NER are run through spaCy together with nlp.pipe.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+    pending: List[tuple[int, List[str]]] = []
+
+    for i, text in enumerate(texts):
+        if isinstance(text, ResumeDocument):
+            lines = text.head_lines
+        else:
+            lines = text.splitlines()[:5]
+        if NER_MODE == "lite":
+            confident = _confident_heuristic_name(lines)
+            if confident:
+                results[i] = {"value": confident, "confidence": 0.8}
+                continue
+        pending.append((i, lines))
+
+    if pending:
+        nlp = get_nlp(lang)
+        docs = nlp.pipe("\n".join(lines) for _, lines in pending)
+        for (i, lines), doc in zip(pending, docs):
+            results[i] = _name_from_doc(doc, lines)
+
+    return results
+
+
+def extract_name_with_confidence(text: str | ResumeDocument, lang: str) -> Dict[str, Any]:
+    """
+    Extract candidate name with a simple confidence score and language-aware model.
+    """
+    return extract_names_with_confidence([text], lang)[0]
+
+
 # ---------- Email & Phone Extraction ----------
 
 
@@ -115,74 +184,110 @@ def score_phone(normalized: str) -> float:
 # ---------- Skills Extraction (taxonomy + sections) ----------
 
 
-def extract_skills_with_confidence(text: str, sections: Dict[str, str] | None = None) -> List[Dict[str, Any]]:
+def extract_skills_with_confidence(
+    text: str | ResumeDocument,
+    sections: Dict[str, str] | None = None,
+) -> List[Dict[str, Any]]:
     """
     Extract skills and attach:
       - canonical id (for matching) = canonical key,
       - label (display) = canonical key,
       - confidence.
-    Uses word-boundary matching on canonical name and aliases.
+    Uses word-boundary matching on canonical name and aliases (see SkillMatcher).
+    Given a ResumeDocument, its cached lowercase view and skills section are
+    used and `sections` is ignored.
     """
     skills_section_text = None
 
-    if sections and "skills" in sections and sections["skills"].strip():
-        skills_section_text = sections["skills"]
+    if isinstance(text, ResumeDocument):
+        skills_section_text = text.section_text("skills") or None
+        full_lower = text.lower
+    else:
+        if sections and "skills" in sections and sections["skills"].strip():
+            skills_section_text = sections["skills"]
+        full_lower = text.lower()
 
-    full_lower = text.lower()
     in_section_lower = skills_section_text.lower() if skills_section_text else None
 
+    section_hits = SKILL_MATCHER.match(in_section_lower) if in_section_lower else set()
+    full_hits = SKILL_MATCHER.match(full_lower)
+
     found: Dict[str, Dict[str, Any]] = {}
 
-    def contains_token(haystack: str, token: str) -> bool:
-        pattern = rf"\b{re.escape(token.lower())}\b"
-        return re.search(pattern, haystack) is not None
-
-    for canonical, variants in SKILL_TAXONOMY.items():
-        # variants is a list of alias strings
-        aliases = variants or []
-        canonical_id = canonical  # canonical ID is the key itself
-        label = canonical         # display text; you can title-case later if you want
-
-        confidence = 0.0
-
-        # Check skills section (higher confidence)
-        if in_section_lower:
-            if any(contains_token(in_section_lower, v) for v in [canonical] + aliases):
-                confidence = max(confidence, 0.9)
-
-        # Check full text (lower confidence)
-        if any(contains_token(full_lower, v) for v in [canonical] + aliases):
-            if confidence < 0.9:
-                confidence = 0.8
-
-        if confidence > 0.0:
-            existing = found.get(canonical_id)
-            if existing:
-                existing["confidence"] = max(existing["confidence"], confidence)
-            else:
-                found[canonical_id] = {
-                    "id": canonical_id,
-                    "value": label,
-                    "confidence": confidence,
-                }
+    for canonical in section_hits | full_hits:
+        # Skills section matches get higher confidence than full-text matches
+        confidence = 0.9 if canonical in section_hits else 0.8
+        found[canonical] = {
+            "id": canonical,       # canonical ID is the key itself
+            "value": canonical,    # display text; you can title-case later if you want
+            "confidence": confidence,
+        }
 
     # Sort by id for stability
     return sorted(found.values(), key=lambda s: s["id"])
 
 
+# ---------- Semantic Skills (optional, SEMANTIC_SKILLS=1) ----------
+
+# Semantic matches rank below exact matches: confidence = this * similarity.
+SEMANTIC_SKILL_CONFIDENCE = 0.7
+
+_SEMANTIC_MATCHER: Optional[SemanticSkillMatcher] = None
+
+
+def get_semantic_matcher() -> SemanticSkillMatcher:
+    """
+    Embed the skills taxonomy with the English model's word vectors once
+    per process (see SemanticSkillMatcher).
+    """
+    global _SEMANTIC_MATCHER
+    if _SEMANTIC_MATCHER is None:
+        _SEMANTIC_MATCHER = SemanticSkillMatcher(get_nlp("en"), SKILL_MATCHER.tokens_by_canonical())
+    return _SEMANTIC_MATCHER
+
+
+def add_semantic_skills(skills: List[Dict[str, Any]], text: str) -> List[Dict[str, Any]]:
+    """
+    Add the skills only the semantic matcher finds in `text` to the output
+    of extract_skills_with_confidence (exact matches are kept as they are).
+    """
+    found = {s["id"]: s for s in skills}
+    for canonical, score in get_semantic_matcher().match(text).items():
+        if canonical not in found:
+            found[canonical] = {
+                "id": canonical,
+                "value": canonical,
+                "confidence": round(SEMANTIC_SKILL_CONFIDENCE * score, 2),
+            }
+    return sorted(found.values(), key=lambda s: s["id"])
+
+
 
 # ---------- Main Entity Extraction ----------
 
 
-def extract_entities(text: str, sections: Dict[str, str] | None = None) -> Dict[str, Any]:
+def extract_entities(
+    text: str | ResumeDocument,
+    sections: Dict[str, str] | None = None,
+    timings: Dict[str, float] | None = None,
+) -> Dict[str, Any]:
     """
     Main interface: extracts name, emails, phones, and skills from resume text.
     Adds confidence and language metadata.
+    Accepts plain text (plus optional detect_sections output) or a
+    ResumeDocument, whose cached views are reused.
+    If `timings` is given, language detection time (seconds) is recorded
+    under "entities.language" (and semantic skill matching under
+    "entities.semantic_skills").
     """
-    clean = clean_text(text)
+    doc = text if isinstance(text, ResumeDocument) else None
+    clean = doc.clean if doc else clean_text(text)
 
     # Language detection (two-letter code like 'en', 'fr', ...)
+    start = time.perf_counter()
     lang = detect_language(clean) or "en"
+    if timings is not None:
+        timings["entities.language"] = time.perf_counter() - start
 
     # Name (language-aware model)
     name_info = extract_name_with_confidence(text, lang)
@@ -205,7 +310,12 @@ def extract_entities(text: str, sections: Dict[str, str] | None = None) -> Dict[
             )
 
     # Skills (canonical ids + labels + confidence)
-    skills_objs = extract_skills_with_confidence(clean, sections=sections)
+    skills_objs = extract_skills_with_confidence(doc or clean, sections=sections)
+    if SEMANTIC_SKILLS:
+        start = time.perf_counter()
+        skills_objs = add_semantic_skills(skills_objs, clean)
+        if timings is not None:
+            timings["entities.semantic_skills"] = time.perf_counter() - start
 
     return {
         # Language info
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
+import importlib.resources as pkg_resources
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
@@ -11,22 +14,57 @@ from resume_parser.utils import (
     parse_date_range,
     extract_lines,
 )
+from resume_parser.document import ResumeDocument
+from resume_parser.title_matcher import TitleMatcher
 
 CURRENT_YEAR = datetime.now().year
 
-TITLES = {
-    "Data Scientist",
-    "Software Engineer",
-    "Machine Learning Engineer",
-    "Research Assistant",
-    "AI Engineer",
-    "Developer",
-    "Intern",
-    "Data Analyst",
-    "Backend Developer",
-    "Frontend Developer",
-    "Full Stack Developer",
+# ---------- Job Title Gazetteer ----------
+#
+# job_titles.json is a hand-curated list of 381 titles, short of the tens of
+# thousands the gazetteer was meant to hold: a generated list of ~21.8k
+# role/domain combinations ("3D Writer", "Server", "Volunteer") made
+# ordinary bullet lines look like headers. The matcher is linear in line
+# length whatever the list size, so it can grow as titles are reviewed.
+
+_TITLES_BYTES = pkg_resources.files(__package__).joinpath("job_titles.json").read_bytes()
+TITLES: List[str] = json.loads(_TITLES_BYTES)
+
+# Content hash of the gazetteer; part of the result cache key, like
+# SKILL_TAXONOMY_VERSION.
+JOB_TITLES_VERSION = hashlib.sha1(_TITLES_BYTES).hexdigest()[:12]
+
+# Indexed once so header detection is linear in line length, whatever the
+# gazetteer size.
+TITLE_MATCHER = TitleMatcher(TITLES)
+
+# A title only marks an experience header where headers put it: at the start
+# of the line (after seniority words, "Senior Data Scientist ...") or next to
+# the separator before a company or dates ("Developer at Acme", "Acme -
+# Developer", "Nurse, 2019"). Anywhere else it is part of a sentence
+# ("worked with the data scientist team in 2020").
+_SENIORITY_WORDS = {
+    "senior", "sr", "junior", "jr", "lead", "principal", "staff", "chief",
+    "head", "trainee", "graduate", "apprentice", "deputy", "interim", "acting",
 }
+_WORD_RE = re.compile(r"\w+")
+_SEPARATOR_BEFORE_RE = re.compile(r"(?:\bat|[-–—|,:(@])\s*$", re.IGNORECASE)
+_SEPARATOR_AFTER_RE = re.compile(r"^\s*(?:at\b|[-–—|,:(@])", re.IGNORECASE)
+
+
+def _leads_with_title(prefix: str) -> bool:
+    return all(word in _SENIORITY_WORDS for word in _WORD_RE.findall(prefix.lower()))
+
+
+def _header_title(line: str) -> Optional[str]:
+    """The gazetteer title in `line` placed where a header puts it, or None."""
+    for start, end, title in TITLE_MATCHER.finditer(line):
+        prefix = line[:start]
+        if _leads_with_title(prefix):
+            return title
+        if _SEPARATOR_BEFORE_RE.search(prefix) or _SEPARATOR_AFTER_RE.match(line[end:]):
+            return title
+    return None
 
 def _experience_signature(exp: dict) -> str:
     """
@@ -48,14 +86,22 @@ def _experience_signature(exp: dict) -> str:
 
 
 def _looks_like_experience_header(line: str) -> bool:
-    lower = line.lower()
-    has_title = any(t.lower() in lower for t in TITLES)
-    if not has_title:
+    if _header_title(line) is None:
         return False
+    lower = line.lower()
 
     if re.search(r"\b(at|@|-|–)\b", lower):
         return True
 
+    # "Web Developer Intern | Acme | ...": a pipe-separated line whose first
+    # field starts or ends with a title is a header even when the dates sit
+    # on the next line.
+    if "|" in lower:
+        field = line.split("|", 1)[0]
+        for start, end, _ in TITLE_MATCHER.finditer(field):
+            if _leads_with_title(field[:start]) or not field[end:].strip():
+                return True
+
     if re.search(r"\b(19|20)\d{2}\b", lower):
         return True
 
@@ -100,15 +146,21 @@ def _score_experience(title: Optional[str], company: Optional[str], start_year,
     return 0.0
 
 
-def extract_experience(text: str, sections: Dict[str, str] | None = None) -> List[Dict[str, Any]]:
+def extract_experience(
+    text: str | ResumeDocument,
+    sections: Dict[str, str] | None = None,
+) -> List[Dict[str, Any]]:
     """
     Extracts work experience entries from resume text (block-based) with confidence.
+    Given a ResumeDocument, its already normalized lines and sections are
+    used and `sections` is ignored.
     """
-    if sections and "experience" in sections and sections["experience"].strip():
-        text = sections["experience"]
-
-    text = clean_text_preserve_structure(text)
-    lines = extract_lines(text)
+    if isinstance(text, ResumeDocument):
+        lines = text.block_lines("experience")
+    else:
+        if sections and "experience" in sections and sections["experience"].strip():
+            text = sections["experience"]
+        lines = extract_lines(clean_text_preserve_structure(text))
 
     blocks = _split_into_blocks(lines)
     experiences: List[Dict[str, Any]] = []
@@ -121,7 +173,7 @@ def extract_experience(text: str, sections: Dict[str, str] | None = None) -> Lis
         body_lines = block[1:] if len(block) > 1 else []
 
         match = re.search(
-            r"(?P<title>[A-Za-z &]+?)\s+(?:at|@|-|–)\s+(?P<company>[A-Za-z0-9 &]+)[,\s]+(?P<range>.*)",
+            r"(?P<title>[A-Za-z &]+?)\s+(?:at|@|-|–|\|)\s+(?P<company>[A-Za-z0-9 &]+)[,\s]+(?P<range>.*)",
             header,
             re.IGNORECASE,
         )
@@ -144,12 +196,8 @@ def extract_experience(text: str, sections: Dict[str, str] | None = None) -> Lis
                     duration = end_year - start_year
                 elif isinstance(end_year, str):
                     duration = CURRENT_YEAR - start_year
-        else:
-            lower = header.lower()
-            for t in TITLES:
-                if t.lower() in lower:
-                    title = header.strip()
-                    break
+        elif _header_title(header) is not None:
+            title = header.strip()
 
         confidence = _score_experience(title, company, start_year, end_year)
 
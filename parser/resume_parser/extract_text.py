@@ -1,6 +1,6 @@
 # resume_parser/extract_text.py
 
-from resume_parser.utils import extract_text_from_file
+from resume_parser.utils import extract_text_from_file, extract_text_from_bytes
 
 def extract_text(path):
     """
@@ -8,3 +8,11 @@ def extract_text(path):
     Delegates to utils.py.
     """
     return extract_text_from_file(path)
+
+
+def extract_text_from_upload(data, filename):
+    """
+    Extract and clean resume text from an in-memory upload.
+    `filename` is only used to pick the reader by extension.
+    """
+    return extract_text_from_bytes(data, filename)
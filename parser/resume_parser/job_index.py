@@ -0,0 +1,236 @@
+# resume_parser/job_index.py
+#
+# Local job matching: a sparse BM25 (or TF-IDF) index over job postings from a
+# JSONL file, ranked against parsed resumes without any external API call.
+#
+# Postings file: one JSON object per line, e.g.
+#   {"id": "123", "title": "Backend Engineer", "description": "...",
+#    "company": "Acme", "location": "Berlin", "salary": "...", "url": "https://..."}
+# Only "title" or "description" is required.
+#
+# Try it (from parser/):
+#   python -m resume_parser.job_index postings.jsonl output_json/resume.json --top 10
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import re
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS, CountVectorizer, TfidfTransformer
+
+from resume_parser.extract_entities import SKILL_MATCHER
+from resume_parser.schema import ResumeOutput
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"\w+")
+
+# Taxonomy skills found in a posting are indexed as "skill:<canonical id>"
+# terms, so "C++" in a description and the "cpp" skill of a resume meet.
+SKILL_PREFIX = "skill:"
+
+# Title terms count this many times as often as description terms.
+TITLE_WEIGHT = 3
+
+# Query term weights: a skill weighs its confidence; words of the job titles
+# in the resume's experience weigh this much times the entry's confidence.
+EXPERIENCE_TITLE_WEIGHT = 0.5
+
+# BM25 parameters (the usual defaults).
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def load_postings(path: str) -> List[Dict[str, Any]]:
+    """Read a JSONL postings file, skipping blank, invalid and empty lines."""
+    postings = []
+    with open(path, "r", encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                posting = json.loads(line)
+            except ValueError:
+                logger.warning("%s:%d: not valid JSON, skipped", path, number)
+                continue
+            if isinstance(posting, dict) and (posting.get("title") or posting.get("description")):
+                postings.append(posting)
+    return postings
+
+
+def analyze(text: str) -> List[str]:
+    """Index/query terms of `text`: non-stop-word tokens plus skill:<id> terms."""
+    lower = text.lower()
+    terms = [w for w in _WORD_RE.findall(lower) if w not in ENGLISH_STOP_WORDS]
+    terms.extend(SKILL_PREFIX + canonical for canonical in sorted(SKILL_MATCHER.match(lower)))
+    return terms
+
+
+class JobIndex:
+    """
+    Sparse term index over job postings.
+
+    Title and description are analyzed separately (see analyze) into one
+    vocabulary, with title counts weighted by TITLE_WEIGHT. The document-term
+    matrix is then turned into BM25 weights (or TF-IDF, `scoring="tfidf"`)
+    once, at build time, and stored term-major (terms x postings CSR, i.e.
+    posting lists with weights). Ranking a resume slices out the rows of its
+    query terms and scores every posting with one sparse matrix-vector
+    product, so the cost follows the length of those posting lists, not the
+    size of the index; top-k selection is an argpartition over the scores.
+    """
+
+    def __init__(self, postings: List[Dict[str, Any]], scoring: str = "bm25"):
+        if scoring not in ("bm25", "tfidf"):
+            raise ValueError(f"Unknown scoring: {scoring}")
+        self.postings = postings
+        self.scoring = scoring
+
+        self.vocabulary: Dict[str, int] = {}
+        self._postings_by_term = sp.csr_matrix((0, len(postings)), dtype=np.float32)
+
+        titles = [p.get("title") or "" for p in postings]
+        descriptions = [p.get("description") or "" for p in postings]
+        vectorizer = CountVectorizer(analyzer=analyze, dtype=np.float32)
+        try:
+            fields = vectorizer.fit_transform(titles + descriptions).tocsr()
+        except ValueError:  # no postings, or no terms in any of them
+            return
+        counts = (TITLE_WEIGHT * fields[: len(postings)] + fields[len(postings):]).tocsr()
+        self.vocabulary = vectorizer.vocabulary_
+
+        weights = self._bm25(counts) if scoring == "bm25" else self._tfidf(counts)
+        self._postings_by_term = weights.T.tocsr()
+
+    def __len__(self) -> int:
+        return len(self.postings)
+
+    @classmethod
+    def from_file(cls, path: str, scoring: str = "bm25") -> "JobIndex":
+        return cls(load_postings(path), scoring=scoring)
+
+    # ---------- Weighting ----------
+
+    @staticmethod
+    def _bm25(counts: sp.csr_matrix) -> sp.csr_matrix:
+        n_docs = counts.shape[0]
+        df = np.bincount(counts.indices, minlength=counts.shape[1])
+        idf = np.log1p((n_docs - df + 0.5) / (df + 0.5)).astype(np.float32)
+
+        lengths = np.asarray(counts.sum(axis=1)).ravel()
+        avg_length = lengths.mean() if n_docs else 0.0
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / max(avg_length, 1e-9))
+
+        weights = counts.copy()
+        rows = np.repeat(np.arange(n_docs), np.diff(counts.indptr))
+        tf = weights.data
+        weights.data = (tf * (BM25_K1 + 1) / (tf + norm[rows]) * idf[weights.indices]).astype(np.float32)
+        return weights
+
+    @staticmethod
+    def _tfidf(counts: sp.csr_matrix) -> sp.csr_matrix:
+        return TfidfTransformer(sublinear_tf=True).fit_transform(counts).astype(np.float32).tocsr()
+
+    # ---------- Queries ----------
+
+    def query_terms(self, resume: ResumeOutput | Dict[str, Any]) -> Dict[str, float]:
+        """Weighted query terms for a resume: its skill ids and experience titles."""
+        if not isinstance(resume, ResumeOutput):
+            resume = ResumeOutput.model_validate(resume)
+
+        terms: Dict[str, float] = {}
+        for skill in resume.skills:
+            term = SKILL_PREFIX + skill.value.lower()
+            terms[term] = max(terms.get(term, 0.0), skill.confidence)
+        for entry in resume.experience:
+            if entry.title:
+                weight = EXPERIENCE_TITLE_WEIGHT * entry.confidence
+                for word in _WORD_RE.findall(entry.title.lower()):
+                    if word not in ENGLISH_STOP_WORDS:
+                        terms[word] = max(terms.get(word, 0.0), weight)
+        return terms
+
+    def _query_vector(self, resume: ResumeOutput | Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """(term columns, weights) of the resume's query terms found in the index."""
+        vocabulary = self.vocabulary
+        columns, weights = [], []
+        for term, weight in self.query_terms(resume).items():
+            column = vocabulary.get(term)
+            if column is not None and weight > 0:
+                columns.append(column)
+                weights.append(weight)
+        return np.asarray(columns, dtype=np.intp), np.asarray(weights, dtype=np.float32)
+
+    def scores(self, resume: ResumeOutput | Dict[str, Any]) -> np.ndarray:
+        """Score of every posting (in index order) for `resume`."""
+        columns, weights = self._query_vector(resume)
+        if not len(columns):
+            return np.zeros(len(self.postings), dtype=np.float32)
+        return self._postings_by_term[columns].T @ weights
+
+    def rank(self, resume: ResumeOutput | Dict[str, Any], top_k: int = 10) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Top `top_k` (posting, score) pairs for `resume`, best first.
+        Postings that share no term with the resume are never returned.
+        """
+        if not self.vocabulary or top_k < 1:
+            return []
+        scores = self.scores(resume)
+        if top_k < len(scores):
+            best = np.argpartition(scores, len(scores) - top_k)[-top_k:]
+        else:
+            best = np.arange(len(scores))
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(self.postings[doc], float(scores[doc])) for doc in best if scores[doc] > 0]
+
+    def rank_many(
+        self,
+        resumes: Iterable[ResumeOutput | Dict[str, Any]],
+        top_k: int = 10,
+    ) -> List[List[Tuple[Dict[str, Any], float]]]:
+        """rank() for each of `resumes`."""
+        return [self.rank(resume, top_k) for resume in resumes]
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Rank local job postings against parsed resumes")
+    parser.add_argument("postings", help="JSONL job postings")
+    parser.add_argument("resumes", nargs="+", help="parsed resume JSON files (ResumeOutput)")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--scoring", choices=["bm25", "tfidf"], default="bm25")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    index = JobIndex.from_file(args.postings, scoring=args.scoring)
+    print(
+        f"indexed {len(index)} postings, {len(index.vocabulary)} terms in {time.perf_counter() - start:.2f}s",
+        file=sys.stderr,
+    )
+
+    resumes = []
+    for path in args.resumes:
+        with open(path, "r", encoding="utf-8") as f:
+            resumes.append(json.load(f))
+
+    start = time.perf_counter()
+    ranked = index.rank_many(resumes, top_k=args.top)
+    elapsed = time.perf_counter() - start
+    print(f"ranked {len(resumes)} resumes in {elapsed * 1000:.1f} ms", file=sys.stderr)
+
+    for path, matches in zip(args.resumes, ranked):
+        print(json.dumps({
+            "resume": path,
+            "jobs": [{**posting, "score": round(score, 4)} for posting, score in matches],
+        }, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,285 @@
+# resume_parser/jobs.py
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import queue
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Priority classes: lower value is served first.
+PRIORITIES: Dict[str, int] = {
+    "interactive": 0,
+    "bulk": 1,
+}
+
+
+# How many submissions between two purges of expired job records.
+_PURGE_EVERY = 100
+
+
+class QueueFullError(Exception):
+    """Raised when the job queue is at capacity; callers should retry later."""
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobStore:
+    """
+    Job status/result records in a small SQLite file.
+
+    Stored on disk rather than in memory so any web worker can answer
+    GET /jobs/<id>, not just the one that accepted the upload.
+    Finished jobs are purged after `ttl_seconds`.
+
+    The queue itself is in memory, so a job dies with the process that
+    queued it. Each row records its owner (host:pid); when a process first
+    opens the store, queued/running rows whose owner on this host has
+    exited are marked failed, and purge_expired() fails unfinished rows
+    older than `ttl_seconds` (which also covers owners on other hosts).
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: float = 3600):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+    def _db(self) -> sqlite3.Connection:
+        # A connection must never be reused across fork(), so reopen per pid.
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id TEXT PRIMARY KEY,"
+                " filename TEXT,"
+                " priority TEXT NOT NULL,"
+                " status TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " finished_at REAL,"
+                " result TEXT,"
+                " error TEXT,"
+                " owner TEXT)"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "owner" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+            conn.commit()
+            self._conn = conn
+            self._conn_pid = os.getpid()
+            self._fail_orphaned(conn)
+        return self._conn
+
+    def _fail_orphaned(self, conn: sqlite3.Connection) -> None:
+        # Unfinished jobs of processes on this host that have exited (a
+        # worker restart) will never run: fail them so clients stop polling.
+        prefix = f"{socket.gethostname()}:"
+        rows = conn.execute(
+            "SELECT DISTINCT owner FROM jobs WHERE status IN ('queued', 'running') AND substr(owner, 1, ?) = ?",
+            (len(prefix), prefix),
+        ).fetchall()
+        for (owner,) in rows:
+            pid = int(owner.rsplit(":", 1)[1])
+            # Our own pid here is a previous process that had the same pid.
+            if pid != os.getpid() and _pid_alive(pid):
+                continue
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', finished_at = ?, error = ?"
+                " WHERE status IN ('queued', 'running') AND owner = ?",
+                (time.time(), "Job lost: the server process running it exited", owner),
+            )
+        conn.commit()
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        with self._lock:
+            db = self._db()
+            db.execute(sql, params)
+            db.commit()
+
+    def create(self, job_id: str, filename: str, priority: str, status: str = "queued") -> None:
+        now = time.time()
+        self._execute(
+            "INSERT INTO jobs (id, filename, priority, status, created_at, owner) VALUES (?, ?, ?, ?, ?, ?)",
+            (job_id, filename, priority, status, now, f"{socket.gethostname()}:{os.getpid()}"),
+        )
+
+    def mark_running(self, job_id: str) -> None:
+        self._execute("UPDATE jobs SET status = 'running' WHERE id = ?", (job_id,))
+
+    def mark_done(self, job_id: str, result: Any) -> None:
+        # Results that are already serialized JSON (bytes) are stored as-is.
+        if isinstance(result, bytes):
+            result = result.decode("utf-8")
+        else:
+            result = json.dumps(result, separators=(",", ":"), ensure_ascii=False)
+        self._execute(
+            "UPDATE jobs SET status = 'done', finished_at = ?, result = ? WHERE id = ?",
+            (time.time(), result, job_id),
+        )
+
+    def mark_failed(self, job_id: str, error: str) -> None:
+        self._execute(
+            "UPDATE jobs SET status = 'failed', finished_at = ?, error = ? WHERE id = ?",
+            (time.time(), error, job_id),
+        )
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        found = self.get_raw(job_id)
+        if found is None:
+            return None
+        job, result = found
+        if result is not None:
+            job["result"] = json.loads(result)
+        return job
+
+    def get_raw(self, job_id: str) -> Optional[Tuple[Dict[str, Any], Optional[bytes]]]:
+        """
+        (job record without the result, result as serialized JSON or None),
+        so the stored result can be sent without decoding it (splice_json).
+        """
+        with self._lock:
+            row = self._db().execute(
+                "SELECT id, filename, priority, status, created_at, finished_at, result, error"
+                " FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        job_id, filename, priority, status, created_at, finished_at, result, error = row
+        job: Dict[str, Any] = {
+            "job_id": job_id,
+            "filename": filename,
+            "priority": priority,
+            "status": status,
+            "created_at": created_at,
+            "finished_at": finished_at,
+        }
+        if error is not None:
+            job["error"] = error
+        return job, None if result is None else result.encode("utf-8")
+
+    def delete(self, job_id: str) -> None:
+        self._execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+    def purge_expired(self) -> None:
+        now = time.time()
+        cutoff = now - self.ttl_seconds
+        with self._lock:
+            db = self._db()
+            db.execute("DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?", (cutoff,))
+            db.execute(
+                "UPDATE jobs SET status = 'failed', finished_at = ?, error = ?"
+                " WHERE status IN ('queued', 'running') AND created_at < ?",
+                (now, "Job expired before it finished", cutoff),
+            )
+            db.commit()
+
+
+class JobQueue:
+    """
+    Bounded priority queue of parse jobs drained by background threads.
+
+    `runner(filename, data)` does the actual work and returns the result (a
+    dict, or already serialized JSON bytes); it is expected to hand the
+    CPU-heavy part to a process pool, so the threads here only order and
+    dispatch jobs. With as many threads as pool workers, a bulk job never
+    sits in the pool ahead of a queued interactive one.
+
+    `submit` never blocks: when `max_pending` jobs are already waiting it
+    raises QueueFullError, so backpressure is explicit to the caller.
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[str, bytes], Dict[str, Any]],
+        store: JobStore,
+        workers: int,
+        max_pending: int,
+    ):
+        self.runner = runner
+        self.store = store
+        self.workers = workers
+        self._queue: queue.PriorityQueue = queue.PriorityQueue(maxsize=max_pending)
+        self._seq = itertools.count()  # FIFO order within a priority class
+        self._threads: List[threading.Thread] = []
+        self._threads_pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_started(self) -> None:
+        # Threads don't survive fork(), so start them lazily in the serving process.
+        with self._start_lock:
+            if self._threads_pid == os.getpid():
+                return
+            self._threads = [
+                threading.Thread(target=self._work, name=f"parse-job-{i}", daemon=True)
+                for i in range(self.workers)
+            ]
+            for t in self._threads:
+                t.start()
+            self._threads_pid = os.getpid()
+        # New serving process: also fail unfinished jobs that outlived the TTL.
+        self.store.purge_expired()
+
+    def submit(self, filename: str, data: bytes, priority: str = "interactive") -> str:
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority}")
+
+        self._ensure_started()
+
+        job_id = uuid.uuid4().hex
+        seq = next(self._seq)
+        if seq % _PURGE_EVERY == 0:
+            self.store.purge_expired()
+
+        # Record the job before queueing it, so a worker never picks up a job
+        # whose row doesn't exist yet.
+        self.store.create(job_id, filename, priority)
+        try:
+            self._queue.put_nowait((PRIORITIES[priority], seq, job_id, filename, data))
+        except queue.Full:
+            self.store.delete(job_id)
+            raise QueueFullError("Parse queue is full") from None
+
+        return job_id
+
+    def record_done(self, filename: str, result: Dict[str, Any] | bytes, priority: str = "interactive") -> str:
+        """
+        Record a job that is already complete (e.g. served from cache) without
+        queueing it, so clients still get a job id to poll.
+        """
+        job_id = uuid.uuid4().hex
+        self.store.create(job_id, filename, priority)
+        self.store.mark_done(job_id, result)
+        return job_id
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def _work(self) -> None:
+        while True:
+            _, _, job_id, filename, data = self._queue.get()
+            try:
+                self.store.mark_running(job_id)
+                result = self.runner(filename, data)
+                self.store.mark_done(job_id, result)
+            except Exception as e:
+                self.store.mark_failed(job_id, f"Failed to parse resume: {str(e)}")
+            finally:
+                self._queue.task_done()
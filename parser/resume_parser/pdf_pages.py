@@ -0,0 +1,164 @@
+# resume_parser/pdf_pages.py
+
+from __future__ import annotations
+
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+from typing import BinaryIO, Callable, Iterator, List, Optional, Sequence
+
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import resolve1
+from pdfminer.utils import open_filename
+
+# Page-level PDF extraction. Output is byte-for-byte what
+# pdfminer.high_level.extract_text returns (each page's text followed by a
+# form feed), unless a page cap or early stop is requested.
+#
+# PDF_MAX_PAGES:            only extract the first N pages (0 = no cap).
+# PDF_PARALLEL_MIN_PAGES:   from this many pages on, split pages across a
+#                           process pool (0 = never).
+# PDF_PAGE_WORKERS:         size of that pool.
+# PDF_STOP_AFTER_SECTIONS:  comma-separated section keys (e.g.
+#                           "experience,education,skills"); stop reading pages
+#                           once all of them were seen and closed by a later
+#                           section header. Sequential mode only.
+PDF_MAX_PAGES = int(os.environ.get("PDF_MAX_PAGES", 0))
+PDF_PARALLEL_MIN_PAGES = int(os.environ.get("PDF_PARALLEL_MIN_PAGES", 0))
+PDF_PAGE_WORKERS = int(os.environ.get("PDF_PAGE_WORKERS", os.cpu_count() or 1))
+PDF_STOP_AFTER_SECTIONS = [
+    s.strip() for s in os.environ.get("PDF_STOP_AFTER_SECTIONS", "").split(",") if s.strip()
+]
+
+PdfSource = str | bytes | BinaryIO
+
+_page_pool: ProcessPoolExecutor | None = None
+
+
+def _open(source: PdfSource):
+    if isinstance(source, bytes):
+        return open_filename(io.BytesIO(source), "rb")
+    return open_filename(source, "rb")
+
+
+def count_pdf_pages(source: PdfSource) -> int:
+    """
+    Number of pages, read from the page tree's /Count without parsing pages.
+    Falls back to iterating pages if the count is missing or malformed.
+    """
+    with _open(source) as fp:
+        start = fp.tell()
+        try:
+            doc = PDFDocument(PDFParser(fp))
+            count = resolve1(resolve1(doc.catalog["Pages"])["Count"])
+            if isinstance(count, int):
+                return count
+        except Exception:
+            pass
+        fp.seek(start)
+        return sum(1 for _ in PDFPage.get_pages(fp))
+
+
+def iter_pdf_page_texts(
+    source: PdfSource,
+    page_numbers: Optional[Sequence[int]] = None,
+    max_pages: int = 0,
+) -> Iterator[str]:
+    """
+    Yield the text of each page in order, exactly as extract_text would
+    write it (page text followed by a form feed).
+    """
+    with _open(source) as fp, StringIO() as output:
+        rsrcmgr = PDFResourceManager(caching=True)
+        device = TextConverter(rsrcmgr, output, codec="utf-8", laparams=LAParams())
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+
+        for page in PDFPage.get_pages(fp, page_numbers, maxpages=max_pages, caching=True):
+            interpreter.process_page(page)
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+
+
+def _extract_page_chunk(source: str | bytes, page_numbers: List[int]) -> str:
+    # Runs in a pool worker.
+    return "".join(iter_pdf_page_texts(source, page_numbers=page_numbers))
+
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    global _page_pool
+    if _page_pool is None:
+        _page_pool = ProcessPoolExecutor(max_workers=PDF_PAGE_WORKERS)
+    return _page_pool
+
+
+def section_stop_condition(required: Sequence[str]) -> Callable[[str], bool]:
+    """
+    Build a stop predicate for extract_pdf_text. It is fed each page's text in
+    order and returns True once every section in `required` has had a header
+    and some other section's header follows the last of them (so the last
+    required section is complete).
+    """
+    # Imported here: sections depends on utils, which depends on this module.
+    from resume_parser.sections import find_section_headers
+
+    required_set = set(required)
+    seen: set[str] = set()
+    state = {"closed": False}
+
+    def should_stop(page_text: str) -> bool:
+        for header in find_section_headers(page_text):
+            if header in required_set:
+                seen.add(header)
+                state["closed"] = False
+            elif seen == required_set:
+                state["closed"] = True
+        return seen == required_set and state["closed"]
+
+    return should_stop
+
+
+def extract_pdf_text(
+    source: PdfSource,
+    max_pages: int = PDF_MAX_PAGES,
+    parallel_min_pages: int = PDF_PARALLEL_MIN_PAGES,
+    stop_after_sections: Sequence[str] = tuple(PDF_STOP_AFTER_SECTIONS),
+) -> str:
+    """
+    Extract the text of a PDF (path, bytes or binary stream) page by page.
+
+    - max_pages caps how many pages are read (0 = all).
+    - Long documents (>= parallel_min_pages, when > 0) are split into
+      contiguous page chunks extracted in a process pool and joined in order.
+    - stop_after_sections stops reading once those sections are complete
+      (see section_stop_condition); only applies to sequential extraction.
+    """
+    if not isinstance(source, (str, bytes)):
+        source = source.read()
+
+    page_count = None
+    if parallel_min_pages > 0 and not stop_after_sections:
+        page_count = count_pdf_pages(source)
+        if max_pages:
+            page_count = min(page_count, max_pages)
+
+    if page_count is not None and page_count >= parallel_min_pages:
+        workers = max(1, min(PDF_PAGE_WORKERS, page_count))
+        chunk = -(-page_count // workers)  # ceil
+        chunks = [list(range(i, min(i + chunk, page_count))) for i in range(0, page_count, chunk)]
+        pool = _get_page_pool()
+        return "".join(pool.map(_extract_page_chunk, [source] * len(chunks), chunks))
+
+    should_stop = section_stop_condition(stop_after_sections) if stop_after_sections else None
+    pages: List[str] = []
+    for page_text in iter_pdf_page_texts(source, max_pages=max_pages):
+        pages.append(page_text)
+        if should_stop and should_stop(page_text):
+            break
+    return "".join(pages)
@@ -0,0 +1,203 @@
+# resume_parser/pipeline.py
+
+from __future__ import annotations
+
+import hashlib
+import importlib.resources as pkg_resources
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from resume_parser.extract_text import extract_text, extract_text_from_upload
+from resume_parser import __version__ as PARSER_VERSION
+from resume_parser.extract_entities import SKILL_TAXONOMY_VERSION, extract_entities, get_nlp
+from resume_parser.extract_experience import JOB_TITLES_VERSION, extract_experience
+from resume_parser.extract_education import extract_education
+from resume_parser.document import ResumeDocument
+from resume_parser.sections import SECTION_HEADERS_VERSION
+from resume_parser.semantic_skills import semantic_version
+from resume_parser.adapter import build_resume_output
+from resume_parser.schema import ResumeOutput
+from resume_parser.profiling import StageProfiler
+from resume_parser.serialization import dump_json
+
+# Modules whose code shapes a parse result, from text extraction to the
+# output schema.
+PARSER_MODULES = [
+    "pipeline.py",
+    "extract_text.py",
+    "pdf_pages.py",
+    "utils.py",
+    "document.py",
+    "sections.py",
+    "extract_entities.py",
+    "skill_matcher.py",
+    "taxonomy.py",
+    "semantic_skills.py",
+    "extract_experience.py",
+    "title_matcher.py",
+    "extract_education.py",
+    "adapter.py",
+    "schema.py",
+    "serialization.py",
+]
+
+
+def code_version() -> str:
+    """
+    Content hash of PARSER_MODULES, so any change to the parsing code gets
+    new cache keys even when __version__ is not bumped.
+    """
+    digest = hashlib.sha1()
+    package = pkg_resources.files(__package__)
+    for name in PARSER_MODULES:
+        digest.update(package.joinpath(name).read_bytes())
+    return digest.hexdigest()[:12]
+
+
+# Identifies everything that shapes a parse result (parser version and code,
+# skill taxonomy, job-title gazetteer, section headers, semantic skill
+# settings). Result caches prefix their keys with it, so an upgrade of any of
+# these never serves stale results.
+RESULT_VERSION = "-".join(filter(None, [
+    PARSER_VERSION,
+    code_version(),
+    SKILL_TAXONOMY_VERSION,
+    JOB_TITLES_VERSION,
+    SECTION_HEADERS_VERSION,
+    semantic_version(),
+]))
+
+
+@contextmanager
+def _stage(
+    timings: Optional[Dict[str, float]],
+    name: str,
+    profiler: Optional[StageProfiler] = None,
+) -> Iterator[None]:
+    """
+    Add the wall time of the block to timings[name] (seconds), if timings is
+    given, and profile it as stage `name` if a profiler is given.
+    """
+    if profiler is not None:
+        with profiler.stage(name), _stage(timings, name):
+            yield
+        return
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+
+
+def parse_text(
+    raw_text: str,
+    timings: Optional[Dict[str, float]] = None,
+    profiler: Optional[StageProfiler] = None,
+) -> ResumeOutput:
+    """
+    Run the parsing pipeline on already-extracted resume text:
+    ResumeDocument (lines + sections) -> extract_entities / extract_experience
+    / extract_education -> build_resume_output.
+    The text is split and normalized once; every extractor reuses the document.
+    If `timings` is given, per-stage durations (seconds) are recorded into it;
+    if `profiler` is given, each stage is profiled (see StageProfiler).
+    """
+    with _stage(timings, "sections", profiler):
+        doc = ResumeDocument(raw_text)
+
+    with _stage(timings, "entities", profiler):
+        parsed_data = extract_entities(doc, timings=timings)
+    with _stage(timings, "experience", profiler):
+        parsed_data["experience"] = extract_experience(doc)
+    with _stage(timings, "education", profiler):
+        parsed_data["education"] = extract_education(doc)
+
+    with _stage(timings, "schema", profiler):
+        return build_resume_output(parsed_data)
+
+
+def parse_file(
+    path: str,
+    timings: Optional[Dict[str, float]] = None,
+    profiler: Optional[StageProfiler] = None,
+) -> ResumeOutput:
+    """
+    Full pipeline for a resume on disk: extract_text followed by parse_text.
+    """
+    with _stage(timings, "extract_text", profiler):
+        raw_text = extract_text(path)
+    return parse_text(raw_text, timings, profiler)
+
+
+def parse_upload(
+    filename: str,
+    data: bytes,
+    timings: Optional[Dict[str, float]] = None,
+    profiler: Optional[StageProfiler] = None,
+) -> Dict[str, Any]:
+    """
+    Parse an uploaded resume given its original filename and raw bytes.
+
+    Parsing happens entirely in memory (nothing is written to disk), and the
+    result is returned as a plain, picklable dict so this can run inside a
+    worker process.
+    """
+    with _stage(timings, "extract_text", profiler):
+        raw_text = extract_text_from_upload(data, filename)
+    return parse_text(raw_text, timings, profiler).model_dump()
+
+
+def parse_upload_json(
+    filename: str,
+    data: bytes,
+    timings: Optional[Dict[str, float]] = None,
+    profiler: Optional[StageProfiler] = None,
+) -> bytes:
+    """
+    parse_upload, but the result comes back as compact JSON bytes serialized
+    straight from the validated ResumeOutput (see serialization.dump_json).
+    These bytes are what the app caches and sends, and they are much cheaper
+    to send back from a worker process than a nested dict.
+    """
+    with _stage(timings, "extract_text", profiler):
+        raw_text = extract_text_from_upload(data, filename)
+    resume_output = parse_text(raw_text, timings, profiler)
+    with _stage(timings, "serialize", profiler):
+        return dump_json(resume_output)
+
+
+def parse_upload_timed(filename: str, data: bytes) -> Tuple[bytes, Dict[str, float]]:
+    """
+    parse_upload_json for worker processes: returns (result JSON, stage
+    timings), so the parent process can record the timings in its metrics.
+    """
+    timings: Dict[str, float] = {}
+    return parse_upload_json(filename, data, timings), timings
+
+
+# Small resume used to exercise every stage once (spaCy, dateparser, langdetect, ...)
+WARM_UP_TEXT = """John Smith
+john.smith@example.com
++1 555 010 0000
+Skills
+Python, SQL, React
+Experience
+Software Engineer at Example Corp, Jan 2019 - Dec 2022
+Built internal tools.
+Education
+Bachelor of Science in Computer Science, 2018
+"""
+
+
+def warm_up() -> None:
+    """
+    Load the spaCy pipeline and run one small parse so the first real parse
+    in this process does not pay model loading or other lazy initialization.
+    Used as a worker pool initializer and by preload().
+    """
+    get_nlp("en")
+    parse_text(WARM_UP_TEXT)
@@ -0,0 +1,109 @@
+# resume_parser/profiling.py
+
+from __future__ import annotations
+
+import cProfile
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+# Only one cProfile profiler can be active per process, so profiled parses
+# run one at a time.
+_PROFILE_LOCK = threading.Lock()
+
+
+class StageProfiler:
+    """
+    Collects a cProfile summary and tracemalloc memory figures for each
+    pipeline stage of a single parse.
+
+    Per stage it reports wall time, the top `top` functions by cumulative
+    time, peak traced memory while the stage ran, and the allocation sites
+    still holding the most memory when it finished.
+
+    Use as a context manager around the whole parse, then pass it to the
+    pipeline functions (`profiler=`), which wrap each stage in `stage(name)`.
+    """
+
+    def __init__(self, top: int = 15):
+        self.top = top
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self._started_tracemalloc = False
+
+    def __enter__(self) -> "StageProfiler":
+        _PROFILE_LOCK.acquire()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        _PROFILE_LOCK.release()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        tracemalloc.reset_peak()
+        mem_before, _ = tracemalloc.get_traced_memory()
+        profile = cProfile.Profile()
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            wall = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            self.stages[name] = {
+                "wall_ms": round(wall * 1000, 3),
+                "peak_memory_bytes": max(0, peak - mem_before),
+                "top_functions": self._top_functions(profile),
+                "top_allocations": self._top_allocations(snapshot),
+            }
+
+    def _top_functions(self, profile: cProfile.Profile) -> List[Dict[str, Any]]:
+        stats = pstats.Stats(profile)
+        rows = []
+        # stats.stats: {(file, line, func): (primitive calls, total calls, tottime, cumtime, callers)}
+        for (filename, line, func), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+            rows.append(
+                {
+                    "function": f"{filename}:{line}({func})",
+                    "ncalls": ncalls,
+                    "tottime_ms": round(tottime * 1000, 3),
+                    "cumtime_ms": round(cumtime * 1000, 3),
+                }
+            )
+        rows.sort(key=lambda r: r["cumtime_ms"], reverse=True)
+        return rows[: self.top]
+
+    def _top_allocations(self, snapshot: tracemalloc.Snapshot) -> List[Dict[str, Any]]:
+        snapshot = snapshot.filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        )
+        return [
+            {"location": str(stat.traceback), "size_bytes": stat.size, "count": stat.count}
+            for stat in snapshot.statistics("lineno")[: self.top]
+        ]
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "total_ms": round(sum(s["wall_ms"] for s in self.stages.values()), 3),
+            "stages": self.stages,
+        }
+
+    def save(self, directory: str, name: str) -> str:
+        """Write the report as JSON into `directory` and return its path."""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        return path
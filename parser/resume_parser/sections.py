@@ -2,18 +2,73 @@
 
 from __future__ import annotations
 
-import re
+import hashlib
+import json
+import os
 from .utils import extract_lines
 
-# Known section header patterns (lowercase, without trailing colon)
+# Known section header patterns (lowercase, without trailing colon).
+# A line is a header when its normalized form starts with one of these; when
+# several match, the earlier key (then the earlier pattern) wins.
 SECTION_HEADERS: dict[str, list[str]] = {
-    "experience": ["experience", "work experience", "professional experience"],
-    "education": ["education", "academic background"],
-    "skills": ["skills", "technical skills", "key skills"],
-    "projects": ["projects", "personal projects"],
-    "certifications": ["certifications", "certificates"],
+    "experience": [
+        "experience", "work experience", "professional experience", "relevant experience",
+        "employment history", "work history", "career history", "internships",
+        "internship experience",
+    ],
+    "education": ["education", "academic background", "academic qualifications", "educational background"],
+    "skills": [
+        "skills", "technical skills", "key skills", "core competencies", "areas of expertise",
+        "technical proficiencies",
+    ],
+    "projects": ["projects", "personal projects", "academic projects", "key projects"],
+    "certifications": [
+        "certifications", "certificates", "licenses and certifications", "licenses & certifications",
+    ],
 }
 
+# SECTION_HEADERS_PATH: optional JSON file {section key: [aliases, ...]} merged
+# into SECTION_HEADERS at import, to add aliases or new sections without code
+# changes. Matching cost per line does not grow with the number of aliases.
+SECTION_HEADERS_PATH = os.environ.get("SECTION_HEADERS_PATH")
+
+if SECTION_HEADERS_PATH:
+    with open(SECTION_HEADERS_PATH, "r", encoding="utf-8") as f:
+        for _key, _aliases in json.load(f).items():
+            _patterns = SECTION_HEADERS.setdefault(_key, [])
+            _patterns += [a.lower() for a in _aliases if a.lower() not in _patterns]
+
+# Hash of the effective header table; part of the result cache key, since a
+# different table can split the same text differently.
+SECTION_HEADERS_VERSION = hashlib.sha1(
+    json.dumps(SECTION_HEADERS, sort_keys=True).encode("utf-8")
+).hexdigest()[:12]
+
+# Key under which a trie node stores (priority, section key) for the pattern
+# ending there. The empty string can never be a single character.
+_END = ""
+
+
+def _build_header_trie(headers: dict[str, list[str]]) -> dict:
+    """
+    Character trie over every header pattern, built once. Each pattern's end
+    node records its priority (key order, then pattern order) so the walk
+    resolves overlaps exactly like checking the patterns in order would.
+    """
+    root: dict = {}
+    priority = 0
+    for key, patterns in headers.items():
+        for p in patterns:
+            node = root
+            for ch in p:
+                node = node.setdefault(ch, {})
+            node.setdefault(_END, (priority, key))
+            priority += 1
+    return root
+
+
+_HEADER_TRIE = _build_header_trie(SECTION_HEADERS)
+
 
 def _normalize_header(line: str) -> str:
     """
@@ -22,22 +77,67 @@ def _normalize_header(line: str) -> str:
     - remove trailing colon(s)
     - lowercase
     """
-    norm = line.strip()
-    # remove trailing ":" or "::"
-    norm = re.sub(r":+$", "", norm)
-    return norm.lower().strip()
+    return line.strip().rstrip(":").lower().strip()
 
 
 def _match_header(normalized_line: str) -> str | None:
     """
     Return the canonical section key if the line matches a known header,
     otherwise None.
+    Walks the header trie along the line, so the cost is bounded by the
+    longest pattern, not by how many patterns there are.
     """
-    for key, patterns in SECTION_HEADERS.items():
-        for p in patterns:
-            if normalized_line.startswith(p):
-                return key
-    return None
+    node = _HEADER_TRIE
+    best = None
+    for ch in normalized_line:
+        node = node.get(ch)
+        if node is None:
+            break
+        end = node.get(_END)
+        if end is not None and (best is None or end < best):
+            best = end
+    return best[1] if best else None
+
+
+def find_section_headers(text: str) -> list[str]:
+    """
+    Return the canonical keys of the section headers found in `text`, in
+    order of appearance (duplicates kept).
+    """
+    headers = []
+    for line in extract_lines(text):
+        key = _match_header(_normalize_header(line))
+        if key:
+            headers.append(key)
+    return headers
+
+
+def section_line_ranges(lines: list[str]) -> dict[str, list[tuple[int, int]]]:
+    """
+    Split normalized lines into sections by header detection, without copying
+    any text.
+
+    Returns a dict mapping section name -> list of (start, end) line index
+    ranges (end exclusive, header lines excluded), in order of first
+    appearance. A section whose header appears more than once gets one range
+    per occurrence; sections with no content lines are left out.
+    """
+    sections: dict[str, list[tuple[int, int]]] = {}
+    current = "other"
+    start = 0
+
+    for i, line in enumerate(lines):
+        header_key = _match_header(_normalize_header(line))
+        if header_key:
+            if i > start:
+                sections.setdefault(current, []).append((start, i))
+            current = header_key
+            start = i + 1
+
+    if len(lines) > start:
+        sections.setdefault(current, []).append((start, len(lines)))
+
+    return sections
 
 
 def detect_sections(text: str) -> dict[str, str]:
@@ -51,30 +151,11 @@ def detect_sections(text: str) -> dict[str, str]:
         "skills": "....",
         "other": "...."
     }
+    Pipeline code should use ResumeDocument (document.py), which keeps the
+    same split as line ranges instead of building these strings.
     """
     lines = extract_lines(text)
-    sections: dict[str, str] = {}
-    current = "other"
-    buffer: list[str] = []
-
-    for line in lines:
-        norm = _normalize_header(line)
-        header_key = _match_header(norm)
-
-        if header_key:
-            # flush previous buffer into current section
-            if buffer:
-                prev = sections.setdefault(current, "")
-                sections[current] = prev + ("\n" if prev else "") + "\n".join(buffer)
-                buffer = []
-
-            current = header_key
-        else:
-            buffer.append(line)
-
-    # flush remaining buffer
-    if buffer:
-        prev = sections.setdefault(current, "")
-        sections[current] = prev + ("\n" if prev else "") + "\n".join(buffer)
-
-    return sections
+    return {
+        key: "\n".join(line for start, end in ranges for line in lines[start:end])
+        for key, ranges in section_line_ranges(lines).items()
+    }
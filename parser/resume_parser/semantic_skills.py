@@ -0,0 +1,212 @@
+# resume_parser/semantic_skills.py
+#
+# Optional semantic skill matching: finds skills written differently from
+# every taxonomy name and alias ("postgres" vs "postgresql", "scikit learn"
+# vs "sklearn") by comparing word vectors of candidate phrases in the resume
+# against every taxonomy entry at once.
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# SEMANTIC_SKILLS=1 turns the stage on (off by default; it needs a spaCy model
+# with word vectors, e.g. en_core_web_md, and runs the pipeline over the
+# whole resume).
+# SEMANTIC_SKILL_THRESHOLD: minimum cosine similarity for a match.
+# SEMANTIC_SKILL_TOP_K: skills kept per candidate phrase, best first.
+SEMANTIC_SKILLS = os.environ.get("SEMANTIC_SKILLS", "0") == "1"
+SEMANTIC_SKILL_THRESHOLD = float(os.environ.get("SEMANTIC_SKILL_THRESHOLD", 0.8))
+SEMANTIC_SKILL_TOP_K = int(os.environ.get("SEMANTIC_SKILL_TOP_K", 1))
+
+# Candidate phrases: spaCy noun chunks when the pipeline has a parser, plus
+# runs of up to this many tokens between punctuation / line breaks (how skills
+# lists are written) and between stop words (skills inside sentences). The
+# latter two are the only candidates in "lite" NER mode, which has no parser.
+MAX_PHRASE_TOKENS = 4
+
+# Pipeline components the noun chunks don't need.
+_SKIP_PIPES = ["ner", "lemmatizer"]
+
+# Columns of Doc.to_array used below.
+_ATTRS = ["LOWER", "IS_STOP", "IS_PUNCT", "IS_SPACE"]
+
+
+def semantic_version() -> str:
+    """
+    Settings that change semantic matches, for the result cache key ("" when
+    the stage is off, so existing keys stay valid).
+    """
+    if not SEMANTIC_SKILLS:
+        return ""
+    return f"sem{SEMANTIC_SKILL_THRESHOLD:g}x{SEMANTIC_SKILL_TOP_K}"
+
+
+class SemanticSkillMatcher:
+    """
+    Matches candidate phrases to taxonomy skills by cosine similarity of
+    static word vectors.
+
+    At load time every canonical name and alias is embedded (mean vector of
+    its words) into one L2-normalized float32 matrix, with the rows of each
+    canonical id kept contiguous. `match` embeds all candidate phrases of a
+    resume into a second matrix, scores everything with a single matrix
+    multiply, takes the best row of each canonical (np.maximum.reduceat), and
+    keeps the top-k canonicals per phrase above the threshold.
+
+    Words without a vector are ignored; a phrase or taxonomy entry with no
+    known words is dropped. Only the model's static vectors are used (no
+    per-token similarity calls), so the cost is a lookup per token plus one
+    BLAS call per resume.
+    """
+
+    def __init__(self, nlp, taxonomy: Dict[str, List[str]]):
+        self.nlp = nlp
+        vectors = nlp.vocab.vectors
+        self._table = vectors.data if vectors.mode == "default" and vectors.shape[0] else None
+        if self._table is None:
+            logger.warning("spaCy model has no static word vectors; semantic skill matching is disabled")
+
+        self.canonicals: List[str] = []
+        self._starts = np.zeros(0, dtype=np.intp)
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        if self._table is not None:
+            self._build(taxonomy)
+
+    def __len__(self) -> int:
+        return len(self.canonicals)
+
+    # ---------- Embedding ----------
+
+    def _token_vectors(self, doc) -> Tuple[np.ndarray, np.ndarray]:
+        """(vectors, mask): one row per token; mask marks content words with a vector."""
+        attrs = doc.to_array(_ATTRS).reshape(len(doc), len(_ATTRS))
+        found = self.nlp.vocab.vectors.find(keys=attrs[:, 0])
+        mask = (found >= 0) & (attrs[:, 1] == 0) & (attrs[:, 2] == 0) & (attrs[:, 3] == 0)
+        vectors = self._table[np.where(mask, found, 0)]
+        vectors[~mask] = 0.0
+        return vectors, mask
+
+    def _embed_spans(self, doc, spans: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mean content-word vector of every (start, end) token span, from
+        cumulative sums. Returns (vectors, kept), `kept` indexing `spans`.
+        """
+        vectors, mask = self._token_vectors(doc)
+        sums = np.zeros((len(doc) + 1, vectors.shape[1]), dtype=np.float32)
+        np.cumsum(vectors, axis=0, out=sums[1:])
+        counts = np.concatenate(([0], np.cumsum(mask)))
+
+        starts, ends = spans[:, 0], spans[:, 1]
+        n = counts[ends] - counts[starts]
+        kept = np.flatnonzero(n > 0)
+        means = (sums[ends[kept]] - sums[starts[kept]]) / n[kept, None]
+        return means, kept
+
+    def _build(self, taxonomy: Dict[str, List[str]]) -> None:
+        # Tokenize every name and alias as one newline-separated text and
+        # embed them all in one _embed_spans call.
+        owners: List[str] = []
+        bounds: List[Tuple[int, int]] = []
+        parts: List[str] = []
+        offset = 0
+        for canonical, tokens in taxonomy.items():
+            for token in tokens:
+                token = " ".join(token.split())
+                if token:
+                    owners.append(canonical)
+                    bounds.append((offset, offset + len(token)))
+                    parts.append(token)
+                    offset += len(token) + 1
+
+        doc = self.nlp.make_doc("\n".join(parts))
+        spans = []
+        for start, end in bounds:
+            span = doc.char_span(start, end, alignment_mode="expand")
+            spans.append((span.start, span.end) if span is not None else (0, 0))
+        if not spans:
+            return
+        vectors, kept = self._embed_spans(doc, np.array(spans, dtype=np.intp))
+
+        # Rows of one canonical id must be contiguous for reduceat.
+        rows = sorted(kept, key=lambda i: owners[i])
+        order = np.searchsorted(kept, rows)
+        starts = [i for i, row in enumerate(rows) if i == 0 or owners[row] != owners[rows[i - 1]]]
+        self.canonicals = [owners[rows[i]] for i in starts]
+        self._starts = np.asarray(starts, dtype=np.intp)
+        self._matrix = _normalize(vectors[order])
+
+    # ---------- Matching ----------
+
+    def match(self, text: str) -> Dict[str, float]:
+        """
+        Return {canonical id: best similarity} for skills mentioned in `text`
+        (candidate phrases scoring at least the threshold, top-k per phrase).
+        """
+        if not len(self.canonicals) or not text.strip():
+            return {}
+
+        doc = self._parse(text)
+        spans = _candidate_spans(doc)
+        # Score each distinct phrase once (skills repeat across a resume).
+        distinct = {doc[start:end].text.lower(): (start, end) for start, end in spans.tolist()}
+        spans = np.array(list(distinct.values()), dtype=np.intp).reshape(-1, 2)
+        if not len(spans):
+            return {}
+        phrases, _ = self._embed_spans(doc, spans)
+        if not len(phrases):
+            return {}
+
+        # (phrases x taxonomy rows) -> best row per canonical id
+        scores = np.maximum.reduceat(_normalize(phrases) @ self._matrix.T, self._starts, axis=1)
+
+        k = min(SEMANTIC_SKILL_TOP_K, scores.shape[1])
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        hits = top_scores >= SEMANTIC_SKILL_THRESHOLD
+
+        found: Dict[str, float] = {}
+        for col, score in zip(top[hits], top_scores[hits]):
+            canonical = self.canonicals[col]
+            found[canonical] = max(found.get(canonical, 0.0), min(float(score), 1.0))
+        return found
+
+    def _parse(self, text: str):
+        if self.nlp.has_pipe("parser"):
+            skip = [name for name in _SKIP_PIPES if self.nlp.has_pipe(name)]
+            return self.nlp(text, disable=skip)
+        return self.nlp.make_doc(text)
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+def _runs(breaks: np.ndarray) -> List[Tuple[int, int]]:
+    """(start, end) of the runs of 1..MAX_PHRASE_TOKENS tokens between breaks."""
+    cuts = np.concatenate(([-1], np.flatnonzero(breaks), [len(breaks)]))
+    lengths = cuts[1:] - cuts[:-1] - 1
+    keep = (lengths > 0) & (lengths <= MAX_PHRASE_TOKENS)
+    starts = cuts[:-1][keep] + 1
+    return list(zip(starts.tolist(), (starts + lengths[keep]).tolist()))
+
+
+def _candidate_spans(doc) -> np.ndarray:
+    """Distinct (start, end) token spans: noun chunks (if parsed) + short phrases."""
+    spans = set()
+    if doc.has_annotation("DEP"):
+        spans.update((chunk.start, chunk.end) for chunk in doc.noun_chunks)
+
+    attrs = doc.to_array(["IS_PUNCT", "IS_SPACE", "IS_STOP"]).reshape(len(doc), 3)
+    punct = attrs[:, 0].astype(bool) | attrs[:, 1].astype(bool)
+    spans.update(_runs(punct))
+    spans.update(_runs(punct | attrs[:, 2].astype(bool)))
+
+    return np.array(sorted(spans), dtype=np.intp).reshape(-1, 2)
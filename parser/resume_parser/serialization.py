@@ -0,0 +1,65 @@
+# resume_parser/serialization.py
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+
+from pydantic_core import to_json
+
+try:
+    import msgpack
+except ImportError:  # optional: only needed to answer Accept: application/msgpack
+    msgpack = None
+
+# ---------- Formats ----------
+
+JSON_MIMETYPE = "application/json"
+MSGPACK_MIMETYPE = "application/msgpack"
+
+# Response formats a client can ask for with the Accept header, in order of
+# preference when it accepts several equally (e.g. "*/*"): JSON stays the
+# default, msgpack only when the client asks for it and msgpack is installed.
+RESPONSE_MIMETYPES: List[str] = [JSON_MIMETYPE]
+if msgpack is not None:
+    RESPONSE_MIMETYPES += [MSGPACK_MIMETYPE, "application/x-msgpack"]
+
+
+# ---------- JSON ----------
+
+
+def dump_json(value: Any) -> bytes:
+    """
+    Compact UTF-8 JSON for a pydantic model or plain JSON data, serialized by
+    pydantic-core in one pass (no model_dump() dict in between).
+    """
+    return to_json(value)
+
+
+def splice_json(obj: Dict[str, Any], raw: Dict[str, bytes]) -> bytes:
+    """
+    JSON object for `obj` plus the fields in `raw`, whose values are already
+    serialized JSON and are copied in as-is instead of being decoded and
+    encoded again (e.g. cached results inside a batch response).
+    """
+    body = dump_json(obj)
+    parts = [body[:-1]]
+    for name, value in raw.items():
+        if len(parts) > 1 or len(body) > 2:
+            parts.append(b",")
+        parts.append(dump_json(name) + b":" + value)
+    parts.append(b"}")
+    return b"".join(parts)
+
+
+# ---------- Negotiated formats ----------
+
+
+def encode_body(json_body: bytes, mimetype: str) -> bytes:
+    """
+    Convert serialized JSON to the response format `mimetype` (one of
+    RESPONSE_MIMETYPES). JSON is returned untouched.
+    """
+    if mimetype == JSON_MIMETYPE:
+        return json_body
+    return msgpack.packb(json.loads(json_body), use_bin_type=True)
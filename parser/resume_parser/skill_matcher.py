@@ -0,0 +1,205 @@
+# resume_parser/skill_matcher.py
+
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Set
+
+import marisa_trie
+
+# Every position where a regex word boundary (\b) holds. A token can only
+# match at such a position, so these are the only starts worth walking.
+_BOUNDARY_RE = re.compile(r"\b")
+
+# Key under which a trie node stores the canonical ids of tokens ending there.
+# The empty string can never be a single character, so it never clashes.
+_END = ""
+
+
+def _is_word_char(ch: str) -> bool:
+    # Mirrors how Python's `re` defines \w for str patterns.
+    return ch.isalnum() or ch == "_"
+
+
+def _ends_token(haystack: str, j: int) -> bool:
+    """
+    Whether a token matched up to haystack[j] (exclusive) ends there. Like a
+    trailing \b when the token ends in a word character (no word character
+    may follow); a token ending in a symbol, such as 'c++' or 'c#', ends there
+    whatever follows ('c++,', 'c++17'), where \b would need a word character.
+    """
+    return not _is_word_char(haystack[j - 1]) or j == len(haystack) or not _is_word_char(haystack[j])
+
+
+def _continues_with_symbol(haystack: str, j: int) -> bool:
+    # A shorter token followed by a symbol that a longer token at the same
+    # start goes on with is part of it: 'c' in 'c++' or 'c#' is not C.
+    return j < len(haystack) and not _is_word_char(haystack[j]) and not haystack[j].isspace()
+
+
+def _select(haystack: str, hits: List[tuple]) -> List[tuple]:
+    """
+    Of the (end, canonicals) matches found from one start, shortest first,
+    drop those a longer one continues with a symbol (see above).
+    """
+    return [hit for k, hit in enumerate(hits) if k + 1 == len(hits) or not _continues_with_symbol(haystack, hit[0])]
+
+
+class SkillMatcher:
+    """
+    Precompiled matcher over a skills taxonomy (canonical -> aliases).
+
+    All canonical names and aliases are lowercased into a single character
+    trie once, at load time. `match` then finds every skill in one pass over
+    the haystack, walking the trie only from word-boundary positions, so cost
+    depends on document length rather than on taxonomy size.
+
+    Tokens match on word boundaries, like `re.search(rf"\\b{re.escape(token)}\\b")`,
+    except that a token ending in a symbol ('c++', 'c#') also matches before
+    a space or punctuation, and hides the shorter token it starts with ('c');
+    see _ends_token.
+    """
+
+    def __init__(self, taxonomy: Dict[str, List[str]]):
+        self._root: dict = {}
+        self._tokens: Dict[str, List[str]] = {}
+        for canonical, variants in taxonomy.items():
+            for token in [canonical] + list(variants or []):
+                self._add(token.lower(), canonical)
+
+    def _add(self, token: str, canonical: str) -> None:
+        if not token:
+            return
+        node = self._root
+        for ch in token:
+            node = node.setdefault(ch, {})
+        node.setdefault(_END, set()).add(canonical)
+        tokens = self._tokens.setdefault(canonical, [])
+        if token not in tokens:
+            tokens.append(token)
+
+    def tokens_by_canonical(self) -> Dict[str, List[str]]:
+        """{canonical id: its lowercased tokens (name and aliases)}."""
+        return {canonical: list(tokens) for canonical, tokens in self._tokens.items()}
+
+    def match(self, haystack: str) -> Set[str]:
+        """
+        Return the canonical ids of every taxonomy token found in `haystack`.
+        `haystack` is expected to be lowercased already.
+        """
+        root = self._root
+        n = len(haystack)
+        found: Set[str] = set()
+
+        for m in _BOUNDARY_RE.finditer(haystack):
+            node = root
+            j = m.start()
+            hits = []
+            while j < n:
+                node = node.get(haystack[j])
+                if node is None:
+                    break
+                j += 1
+                ends = node.get(_END)
+                if ends and _ends_token(haystack, j):
+                    hits.append((j, ends))
+            for _, ends in _select(haystack, hits):
+                found |= ends
+
+        return found
+
+
+# ---------- Compiled taxonomy (marisa-trie) ----------
+
+# A compiled taxonomy is one marisa Trie holding three kinds of keys:
+#   "<token>"                  every lowercased canonical name and alias
+#   "<token>\x01<canonical>"   one per canonical id the token maps to
+#   "\x01meta:<name>=<value>"  build metadata
+# Resume text never contains "\x01" (marisa keys can't contain "\x00"), so
+# only plain tokens can be prefixes of it.
+_SEP = "\x01"
+_META_PREFIX = _SEP + "meta:"
+
+
+def compile_taxonomy(taxonomy: Dict[str, List[str]], path: str, version: str) -> int:
+    """
+    Write `taxonomy` to `path` as a compiled marisa Trie (see above), tagged
+    with the source `version`. Returns the number of distinct tokens written.
+    """
+    tokens: Set[str] = set()
+    keys: Set[str] = set()
+    for canonical, variants in taxonomy.items():
+        for token in [canonical] + list(variants or []):
+            token = token.lower()
+            if token:
+                tokens.add(token)
+                keys.add(token + _SEP + canonical)
+
+    max_len = max((len(t) for t in tokens), default=0)
+    keys |= tokens
+    keys.add(f"{_META_PREFIX}version={version}")
+    keys.add(f"{_META_PREFIX}max_len={max_len}")
+    marisa_trie.Trie(keys).save(path)
+    return len(tokens)
+
+
+class CompiledSkillMatcher:
+    """
+    SkillMatcher backed by a compiled taxonomy (see compile_taxonomy).
+
+    The trie is memory-mapped rather than loaded, so opening it is nearly
+    free, it takes no Python heap, and every worker process shares the same
+    pages through the OS page cache. `match` has exactly the semantics of
+    SkillMatcher.match: at each word-boundary position, marisa returns every
+    token that is a prefix of the remaining text, and token ends are checked
+    the same way.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._trie = marisa_trie.Trie()
+        self._trie.mmap(path)
+        self.version = self._meta("version")
+        self._max_len = int(self._meta("max_len") or 0)
+
+    def _meta(self, name: str) -> str | None:
+        prefix = f"{_META_PREFIX}{name}="
+        keys = self._trie.keys(prefix)
+        return keys[0][len(prefix):] if keys else None
+
+    def _canonicals(self, token: str) -> List[str]:
+        prefix = token + _SEP
+        return [key[len(prefix):] for key in self._trie.keys(prefix)]
+
+    def tokens_by_canonical(self) -> Dict[str, List[str]]:
+        """{canonical id: its lowercased tokens (name and aliases)}."""
+        result: Dict[str, List[str]] = {}
+        for key in self._trie.iterkeys():
+            token, sep, canonical = key.partition(_SEP)
+            if sep and token:
+                result.setdefault(canonical, []).append(token)
+        return result
+
+    def match(self, haystack: str) -> Set[str]:
+        """
+        Return the canonical ids of every taxonomy token found in `haystack`.
+        `haystack` is expected to be lowercased already.
+        """
+        trie = self._trie
+        max_len = self._max_len
+        found: Set[str] = set()
+        seen_tokens: Set[str] = set()
+
+        for m in _BOUNDARY_RE.finditer(haystack):
+            i = m.start()
+            hits = sorted(
+                (i + len(token), token)
+                for token in trie.prefixes(haystack[i : i + max_len])
+                if _SEP not in token and _ends_token(haystack, i + len(token))
+            )
+            for _, token in _select(haystack, hits):
+                if token not in seen_tokens:
+                    seen_tokens.add(token)
+                    found.update(self._canonicals(token))
+
+        return found
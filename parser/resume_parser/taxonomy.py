@@ -0,0 +1,115 @@
+# resume_parser/taxonomy.py
+#
+# Skills taxonomy loading: from the JSON source, or from a compiled
+# marisa-trie artifact that worker processes memory-map instead of parsing.
+#
+# Build the artifact (from parser/):
+#   python -m resume_parser.taxonomy
+#   python -m resume_parser.taxonomy --input esco_skills.json --output /srv/skills.marisa
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib.resources as pkg_resources
+import json
+import logging
+import os
+import sys
+import time
+from typing import List, Tuple
+
+from resume_parser.skill_matcher import CompiledSkillMatcher, SkillMatcher, compile_taxonomy
+
+logger = logging.getLogger(__name__)
+
+# SKILL_TAXONOMY_PATH:      JSON taxonomy {canonical: [aliases, ...]}
+#                           (default: the packaged skills_taxonomy.json).
+# SKILL_TAXONOMY_ARTIFACT:  compiled taxonomy, used instead of the JSON when it
+#                           exists and was built from the current JSON (or the
+#                           JSON isn't deployed). Default: the JSON path with a
+#                           .marisa extension.
+SKILL_TAXONOMY_PATH = os.environ.get("SKILL_TAXONOMY_PATH") or str(
+    pkg_resources.files(__package__).joinpath("skills_taxonomy.json")
+)
+SKILL_TAXONOMY_ARTIFACT = os.environ.get("SKILL_TAXONOMY_ARTIFACT") or (
+    os.path.splitext(SKILL_TAXONOMY_PATH)[0] + ".marisa"
+)
+
+SkillMatcherLike = SkillMatcher | CompiledSkillMatcher
+
+
+def taxonomy_version(data: bytes) -> str:
+    """
+    Content hash of a taxonomy source file; part of the result cache key, so
+    editing the taxonomy invalidates previously cached parses.
+    """
+    return hashlib.sha1(data).hexdigest()[:12]
+
+
+def load_skill_matcher(
+    path: str = SKILL_TAXONOMY_PATH,
+    artifact: str = SKILL_TAXONOMY_ARTIFACT,
+) -> Tuple[SkillMatcherLike, str]:
+    """
+    Return (matcher, taxonomy version).
+
+    Prefers the compiled artifact; falls back to parsing the JSON when there
+    is no artifact or it is stale (built from a different JSON).
+    """
+    data = None
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            data = f.read()
+
+    if os.path.exists(artifact):
+        matcher = CompiledSkillMatcher(artifact)
+        if data is None or matcher.version == taxonomy_version(data):
+            return matcher, matcher.version
+        logger.warning(
+            "%s was not built from the current %s; loading the JSON instead "
+            "(rebuild with: python -m resume_parser.taxonomy)",
+            artifact,
+            path,
+        )
+
+    if data is None:
+        raise FileNotFoundError(f"No skills taxonomy at {path} or {artifact}")
+    return SkillMatcher(json.loads(data)), taxonomy_version(data)
+
+
+def build_artifact(path: str = SKILL_TAXONOMY_PATH, artifact: str = SKILL_TAXONOMY_ARTIFACT) -> Tuple[str, int]:
+    """
+    Compile the JSON taxonomy at `path` into `artifact`.
+    Returns (taxonomy version, number of distinct tokens).
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    version = taxonomy_version(data)
+
+    # Write next to the target and rename, so running workers that have the
+    # old file mapped keep a consistent view.
+    tmp = f"{artifact}.{os.getpid()}.tmp"
+    tokens = compile_taxonomy(json.loads(data), tmp, version)
+    os.replace(tmp, artifact)
+    return version, tokens
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compile the skills taxonomy into a marisa-trie artifact")
+    parser.add_argument("--input", default=SKILL_TAXONOMY_PATH, help="JSON taxonomy")
+    parser.add_argument("--output", default=SKILL_TAXONOMY_ARTIFACT, help="artifact path")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    version, tokens = build_artifact(args.input, args.output)
+    print(
+        f"wrote {args.output}: {tokens} tokens, version {version}, "
+        f"{os.path.getsize(args.output)} bytes in {time.perf_counter() - start:.2f}s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
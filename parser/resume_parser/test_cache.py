@@ -0,0 +1,114 @@
+import sqlite3
+
+import pytest
+
+from resume_parser import cache
+from resume_parser.cache import ResultCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache, "time", clock)
+    return clock
+
+
+def _disk_keys(path):
+    conn = sqlite3.connect(path)
+    keys = {key for (key,) in conn.execute("SELECT key FROM results")}
+    conn.close()
+    return keys
+
+
+def test_round_trip_and_stats(tmp_path, clock):
+    results = ResultCache(str(tmp_path / "cache.sqlite3"), "v1", memory_items=2)
+    assert results.get("a") is None
+    results.set("a", {"name": "Ada"})
+    assert results.get("a") == {"name": "Ada"}
+    assert results.get_raw("a") == b'{"name":"Ada"}'
+
+    # A second instance on the same file (another worker) reads from disk,
+    # then from memory.
+    other = ResultCache(results.db_path, "v1")
+    assert other.get("a") == {"name": "Ada"}
+    assert other.get("a") == {"name": "Ada"}
+
+    assert results.stats() == {
+        "memory_hits": 2, "disk_hits": 0, "misses": 1, "expired": 0,
+        "memory_evictions": 0, "disk_evictions": 0, "memory_items": 1,
+    }
+    assert other.stats()["disk_hits"] == 1 and other.stats()["memory_hits"] == 1
+
+
+def test_memory_tier_evicts_least_recently_used(tmp_path, clock):
+    results = ResultCache(str(tmp_path / "cache.sqlite3"), "v1", memory_items=2)
+    results.set("a", 1)
+    results.set("b", 2)
+    results.get("a")  # "b" is now the least recently used
+    results.set("c", 3)
+    assert results.stats()["memory_evictions"] == 1
+
+    assert results.get("a") == 1 and results.get("c") == 3
+    assert results.stats()["disk_hits"] == 0
+    assert results.get("b") == 2  # evicted from memory, still on disk
+    assert results.stats()["disk_hits"] == 1
+
+
+def test_disk_eviction_every_64_inserts_keeps_recently_used(tmp_path, clock):
+    path = str(tmp_path / "cache.sqlite3")
+    results = ResultCache(path, "v1", memory_items=1, max_disk_items=10)
+    for i in range(63):
+        clock.now += 1
+        results.set(f"k{i}", i)
+    clock.now += 1
+    results.get("k0")  # touched on disk: most recently used
+    assert len(_disk_keys(path)) == 63
+    assert results.stats()["disk_evictions"] == 0
+
+    clock.now += 1
+    results.set("k63", 63)
+    keys = _disk_keys(path)
+    assert len(keys) == 10
+    assert results.stats()["disk_evictions"] == 54
+    assert keys == {"v1:k0", "v1:k63"} | {f"v1:k{i}" for i in range(55, 63)}
+
+
+def test_ttl(tmp_path, clock):
+    path = str(tmp_path / "cache.sqlite3")
+    results = ResultCache(path, "v1", ttl_seconds=60)
+    results.set("a", 1)
+    clock.now += 30
+    assert results.get("a") == 1
+    clock.now += 31
+    assert results.get("a") is None  # expired in memory, then on disk
+    assert results.stats()["expired"] == 1
+    assert _disk_keys(path) == set()
+
+
+def test_ttl_eviction_on_disk(tmp_path, clock):
+    path = str(tmp_path / "cache.sqlite3")
+    results = ResultCache(path, "v1", ttl_seconds=60)
+    results.set("old", 0)
+    clock.now += 120
+    for i in range(63):
+        results.set(f"k{i}", i)
+    assert "v1:old" not in _disk_keys(path)
+    assert results.stats()["disk_evictions"] == 1
+
+
+def test_version_bump_invalidates(tmp_path, clock):
+    path = str(tmp_path / "cache.sqlite3")
+    ResultCache(path, "v1").set("a", 1)
+    upgraded = ResultCache(path, "v2")
+    assert upgraded.get("a") is None
+    upgraded.set("a", 2)
+    assert ResultCache(path, "v1").get("a") == 1
+    assert ResultCache(path, "v2").get("a") == 2
@@ -0,0 +1,138 @@
+import operator
+import random
+
+import pytest
+
+from resume_parser import candidate_index
+from resume_parser.candidate_index import CandidateIndex, QueryError, candidate_terms, parse_query
+from resume_parser.schema import ResumeOutput
+
+SKILLS = ["python", "java", "react", "php", "sql", "docker", "aws", "go", "kotlin", "machine learning"]
+DEGREES = ["B.Tech", "Bachelor of Science", "M.Sc", "Master of Technology", "MCA", "Ph.D", "Diploma"]
+
+QUERIES = [
+    "python",
+    "python AND react AND NOT php AND years>=3",
+    "python react",
+    "(degree:msc OR level:doctorate) AND (java OR kotlin) AND years<5",
+    "NOT python",
+    "NOT (python OR java)",
+    '"machine learning" OR sql',
+    "level:bachelor AND NOT level:master",
+    "degree:phd",
+    "years>=0",
+    "years<0.5",
+    "years=4",
+    "years>4.5",
+    "years<=2",
+    "years>30",
+    "years>=29.5 OR years<1",
+    "docker AND (aws OR go) AND years>1 AND years<=12",
+    "skill:unknown",
+    "NOT skill:unknown AND NOT years>100",
+]
+
+_OPS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge, "=": operator.eq}
+
+
+def _random_resume(rng):
+    experience = []
+    for _ in range(rng.randrange(4)):
+        years = rng.choice([None, 0, 0.5, 1, 2, 3, 4.5, 7, 12, 20])
+        start = rng.choice([None, rng.randrange(1990, 2024)])
+        experience.append({"start_year": start, "years": years, "confidence": 0.9})
+    return ResumeOutput.model_validate({
+        "name": {"value": None},
+        "primary_email": {"value": None},
+        "primary_phone": {"value": None},
+        "skills": [{"value": s, "confidence": 0.9} for s in rng.sample(SKILLS, rng.randrange(5))],
+        "education": [{"degree_raw": d} for d in rng.sample(DEGREES, rng.randrange(3))],
+        "experience": experience,
+    })
+
+
+def _matches(node, terms, years):
+    """Brute-force evaluation of a parse_query tree for one candidate."""
+    kind = node[0]
+    if kind == "and":
+        return _matches(node[1], terms, years) and _matches(node[2], terms, years)
+    if kind == "or":
+        return _matches(node[1], terms, years) or _matches(node[2], terms, years)
+    if kind == "not":
+        return not _matches(node[1], terms, years)
+    if kind == "years":
+        return _OPS[node[1]](years, node[2])
+    return node[1] in terms
+
+
+def _check(index, resumes):
+    candidates = {key: candidate_terms(resume) for key, resume in resumes.items()}
+    for query in QUERIES:
+        tree = parse_query(query)
+        expected = {key for key, (terms, years) in candidates.items() if _matches(tree, set(terms), years)}
+        assert set(index.search(tree)) == expected, query
+        assert index.count(tree) == len(expected), query
+
+
+def test_matches_brute_force(tmp_path):
+    rng = random.Random(7)
+    index = CandidateIndex()
+    resumes = {}
+    for i in range(3000):
+        resumes[f"r{i}"] = resume = _random_resume(rng)
+        index.add(f"r{i}", resume)
+    _check(index, resumes)
+
+    # Deletes and replacements (re-adding a key) are incremental.
+    for i in rng.sample(range(3000), 500):
+        assert index.delete(f"r{i}")
+        del resumes[f"r{i}"]
+    for i in rng.sample(range(3000), 500):
+        resumes[f"r{i}"] = resume = _random_resume(rng)
+        index.add(f"r{i}", resume)
+    assert len(index) == len(resumes)
+    _check(index, resumes)
+
+    path = str(tmp_path / "candidates.idx")
+    index.save(path)
+    _check(CandidateIndex.load(path), resumes)
+
+
+def test_search_limit_is_oldest_first():
+    rng = random.Random(1)
+    index = CandidateIndex()
+    for i in range(10):
+        index.add(f"r{i}", _random_resume(rng))
+    assert index.search("years>=0", limit=3) == ["r0", "r1", "r2"]
+
+
+def test_deleted_ids_are_reclaimed(monkeypatch):
+    monkeypatch.setattr(candidate_index, "COMPACT_MIN_DELETED", 50)
+    rng = random.Random(3)
+    index = CandidateIndex()
+    resumes = {}
+    # Steady churn: past the first 300, every add deletes the oldest record.
+    for i in range(2000):
+        resumes[f"r{i}"] = resume = _random_resume(rng)
+        index.add(f"r{i}", resume)
+        if i >= 300:
+            assert index.delete(f"r{i - 300}")
+            del resumes[f"r{i - 300}"]
+    assert len(index) == 300
+    # Without compaction there would be 2000 ids.
+    assert len(index._keys) <= 2 * 300
+    assert index._capacity <= 2 * 300 + 7
+    _check(index, resumes)
+    assert index.search("years>=0", limit=3) == ["r1700", "r1701", "r1702"]
+
+    index.compact()
+    assert index.deleted == 0 and len(index._keys) == 300
+    _check(index, resumes)
+
+
+@pytest.mark.parametrize("query", [
+    "years>", "years>=abc", "years >", "years>3abc", "years=>3", "python AND years<", "", "python AND", "(python", "NOT",
+])
+def test_invalid_queries(query):
+    with pytest.raises(QueryError):
+        parse_query(query)
@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+from resume_parser.document import ResumeDocument
+from resume_parser.extract_experience import TITLE_MATCHER, _looks_like_experience_header, extract_experience
+from resume_parser.extract_text import extract_text
+
+RESUMES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resumes")
+
+# The hard-coded titles the gazetteer replaced; each must still be found.
+BASELINE_TITLES = [
+    "Data Scientist",
+    "Software Engineer",
+    "Machine Learning Engineer",
+    "Research Assistant",
+    "AI Engineer",
+    "Developer",
+    "Intern",
+    "Data Analyst",
+    "Backend Developer",
+    "Frontend Developer",
+    "Full Stack Developer",
+]
+
+
+@pytest.mark.parametrize("title", BASELINE_TITLES)
+def test_baseline_titles_still_match(title):
+    assert TITLE_MATCHER.search(title) == title
+
+
+# Experience extracted from the bundled sample resumes.
+# Before the gazetteer: Gautam_res [] and Resume []; Prasanna_Resume had one
+# entry headed by the bullet "○ Collaborating with back-end developers ...",
+# from the old substring match of "Developer" in "developers" (titles match
+# whole words now). Prasanna_Resume's internships are headed
+# "WEB DEVELOPER INTERN | Thapy | LINK | ..." with the dates on the next
+# line; the other two have no header the parser can read, in particular no
+# "Volunteer, ..." or "○ Integrating front-end code ..." entries.
+SAMPLE_EXPERIENCE = {
+    "Gautam_res": [],
+    "Prasanna_Resume": [
+        ("WEB DEVELOPER INTERN", "Thapy"),
+        ("WEB DEVELOPER INTERN", "Samsung R&D"),
+        ("FULLSTACK DEVELOPER INTERN", "Eventory"),
+    ],
+    "Resume": [],
+}
+
+
+@pytest.mark.parametrize("name", sorted(SAMPLE_EXPERIENCE))
+def test_sample_resumes_experience(name):
+    doc = ResumeDocument(extract_text(os.path.join(RESUMES_DIR, f"{name}.pdf")))
+    entries = extract_experience(doc)
+    assert [(entry["title"], entry["company"]) for entry in entries] == SAMPLE_EXPERIENCE[name]
+
+
+@pytest.mark.parametrize("line", [
+    "Built a REST server handling 1M req - 2019",
+    "Wrote a Linux device driver - 2020",
+    "Mentor for 20 students - 2021",
+    "Volunteer, IE-ENC Club, Manipal - 2022",
+    "○ Integrating front-end code with server-side code to implement dynamic pages.",
+    "Worked with the data scientist team in 2020",
+    "Internal tools developer work 2019",
+    "Skills: Python | Data Analyst tools",
+    "Portfolio Website | LINK",
+])
+def test_bullet_lines_are_not_headers(line):
+    assert not _looks_like_experience_header(line)
+
+
+@pytest.mark.parametrize("line", [
+    "Software Engineer at Google, 2019 - 2021",
+    "Senior Data Scientist, Acme 2019",
+    "Intern - International Business Machines 2020",
+    "Python Developer | Foo | 2021",
+    "• Registered Nurse, City Hospital 2018 - 2020",
+    "WEB DEVELOPER INTERN | Thapy | LINK | CERTIFICATE | LOR",
+    "FULLSTACK DEVELOPER INTERN | Eventory | LINK",
+])
+def test_header_lines(line):
+    assert _looks_like_experience_header(line)
+
+
+def test_header_entry():
+    [entry] = extract_experience("Experience\nSoftware Engineer at Google, 2019 - 2021\nBuilt services.")
+    assert (entry["title"], entry["company"], entry["start_year"], entry["end_year"]) == (
+        "Software Engineer", "Google", 2019, 2021,
+    )
+    assert entry["responsibilities"] == ["Built services."]
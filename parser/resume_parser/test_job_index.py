@@ -0,0 +1,60 @@
+import json
+
+from resume_parser.extract_entities import SKILL_MATCHER
+from resume_parser.job_index import JobIndex, analyze
+
+POSTINGS = [
+    {"id": "cpp", "title": "Embedded Engineer", "description": "Embedded C++ work on firmware for sensors."},
+    {"id": "c", "title": "Systems Programmer", "description": "Low level C, Linux kernel modules."},
+    {"id": "web", "title": "Frontend Developer", "description": "React and TypeScript single page apps."},
+    {"id": "ds", "title": "Data Scientist", "description": "Python, pandas and machine learning models."},
+    {"id": "empty-match", "title": "Barista", "description": "Coffee, customers and the espresso machine."},
+]
+
+
+def _resume(skills, titles=()):
+    return {
+        "name": {"value": None},
+        "primary_email": {"value": None},
+        "primary_phone": {"value": None},
+        "skills": [{"value": skill, "confidence": 0.9} for skill in skills],
+        "experience": [{"title": title, "confidence": 0.9} for title in titles],
+    }
+
+
+def _index(tmp_path, scoring="bm25"):
+    path = tmp_path / "postings.jsonl"
+    path.write_text("\n".join(json.dumps(p) for p in POSTINGS) + "\n\nnot json\n", encoding="utf-8")
+    return JobIndex.from_file(str(path), scoring=scoring)
+
+
+def test_symbol_skills_are_indexed():
+    assert SKILL_MATCHER.match("embedded c++ work") == {"cpp"}
+    terms = analyze("Embedded C++ work")
+    assert "skill:cpp" in terms and "skill:c" not in terms
+
+
+def test_loads_valid_postings_only(tmp_path):
+    assert [p["id"] for p in _index(tmp_path).postings] == [p["id"] for p in POSTINGS]
+
+
+def test_cpp_resume_ranks_cpp_posting_first(tmp_path):
+    ranked = _index(tmp_path).rank(_resume(["cpp"]), top_k=3)
+    assert [posting["id"] for posting, _ in ranked] == ["cpp"]
+
+
+def test_ranking_order_and_scores(tmp_path):
+    for scoring in ("bm25", "tfidf"):
+        index = _index(tmp_path, scoring)
+        ranked = index.rank(_resume(["react", "typescript"], ["Frontend Developer"]), top_k=10)
+        assert ranked[0][0]["id"] == "web"
+        scores = [score for _, score in ranked]
+        assert scores == sorted(scores, reverse=True) and all(score > 0 for score in scores)
+        assert "empty-match" not in [posting["id"] for posting, _ in ranked]
+
+
+def test_top_k_and_no_overlap(tmp_path):
+    index = _index(tmp_path)
+    assert len(index.rank(_resume(["python", "react", "cpp", "c"]), top_k=2)) == 2
+    assert index.rank(_resume(["cobol"]), top_k=5) == []
+    assert index.rank(_resume(["python"]), top_k=0) == []
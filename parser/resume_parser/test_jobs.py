@@ -0,0 +1,95 @@
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import time
+
+from resume_parser.jobs import JobStore
+
+
+def _dead_pid() -> int:
+    child = subprocess.Popen([sys.executable, "-c", "pass"])
+    child.wait()
+    return child.pid
+
+
+def _set(path, job_id, **columns):
+    conn = sqlite3.connect(path)
+    assignments = ", ".join(f"{name} = ?" for name in columns)
+    conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*columns.values(), job_id))
+    conn.commit()
+    conn.close()
+
+
+def test_jobs_of_exited_process_fail_on_startup(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    host = socket.gethostname()
+    before = JobStore(path)
+    before.create("lost", "a.pdf", "interactive")
+    before.create("running", "b.pdf", "bulk")
+    before.mark_running("running")
+    before.create("other", "c.pdf", "interactive")
+    before.create("remote", "d.pdf", "interactive")
+    before.create("done", "e.pdf", "interactive")
+    before.mark_done("done", {"ok": 1})
+    dead = _dead_pid()
+    for job_id in ("lost", "running", "done"):
+        _set(path, job_id, owner=f"{host}:{dead}")
+    # A live sibling worker, and a process on another host.
+    _set(path, "other", owner=f"{host}:{os.getppid()}")
+    _set(path, "remote", owner=f"elsewhere:{dead}")
+
+    after = JobStore(path)
+    for job_id in ("lost", "running"):
+        job = after.get(job_id)
+        assert job["status"] == "failed" and "exited" in job["error"]
+    assert after.get("other")["status"] == "queued"
+    assert after.get("remote")["status"] == "queued"
+    assert after.get("done")["status"] == "done"
+
+
+def test_unfinished_jobs_expire_by_created_at(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    store = JobStore(path, ttl_seconds=60)
+    store.create("old", "a.pdf", "interactive")
+    store.create("new", "b.pdf", "interactive")
+    store.create("finished", "c.pdf", "interactive")
+    store.mark_done("finished", {"ok": 1})
+    _set(path, "old", created_at=time.time() - 120)
+    _set(path, "finished", created_at=time.time() - 240, finished_at=time.time() - 120)
+
+    store.purge_expired()
+    old = store.get("old")
+    assert old["status"] == "failed" and "expired" in old["error"]
+    assert store.get("new")["status"] == "queued"
+    assert store.get("finished") is None
+
+
+def test_owner_column_added_to_existing_store(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE jobs (id TEXT PRIMARY KEY, filename TEXT, priority TEXT NOT NULL, status TEXT NOT NULL,"
+        " created_at REAL NOT NULL, finished_at REAL, result TEXT, error TEXT)"
+    )
+    conn.execute("INSERT INTO jobs (id, priority, status, created_at) VALUES ('legacy', 'bulk', 'queued', ?)", (time.time(),))
+    conn.commit()
+    conn.close()
+
+    store = JobStore(path)
+    assert store.get("legacy")["status"] == "queued"
+    store.create("job", "a.pdf", "interactive")
+    assert store.get("job")["status"] == "queued"
+
+
+def test_get_raw_returns_stored_result_bytes(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    store.create("job", "a.pdf", "interactive")
+    assert store.get_raw("job") == (store.get("job"), None)
+    store.mark_done("job", b'{"name":{"value":"Ada"}}')
+    job, result = store.get_raw("job")
+    assert result == b'{"name":{"value":"Ada"}}'
+    assert job["status"] == "done" and "result" not in job
+    assert store.get("job")["result"] == {"name": {"value": "Ada"}}
+    assert store.get_raw("missing") is None
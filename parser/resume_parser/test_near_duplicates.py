@@ -0,0 +1,82 @@
+import json
+
+import bulk_parse
+from resume_parser.adapter import build_resume_output
+from resume_parser.near_duplicates import NearDuplicateIndex, minhash
+
+LINES = [f"Line {i}: built python and react services for team {i}" for i in range(30)]
+TEXT = "\n".join(LINES)
+
+
+def test_near_copy_matches_original():
+    index = NearDuplicateIndex(0.8)
+    assert index.check("a", minhash(TEXT)) is None
+    edited = LINES[:5] + ["Phone +1 555 0100"] + LINES[6:]
+    key, score = index.check("b", minhash("\n".join(edited)))
+    assert key == "a" and score >= 0.8
+    assert "b" not in index
+
+
+def test_unrelated_resume_is_not_a_duplicate():
+    index = NearDuplicateIndex(0.8)
+    index.check("a", minhash(TEXT))
+    other = "\n".join(f"Other person {i}: managed accounts in region {i}" for i in range(30))
+    assert index.check("c", minhash(other)) is None
+
+
+def test_key_never_matches_itself():
+    index = NearDuplicateIndex(0.8)
+    signature = minhash(TEXT)
+    assert index.check("a", signature) is None
+    # The same file checked again (retry, rerun against a saved index).
+    assert index.check("a", signature) is None
+    assert index.query(signature, exclude="a") == []
+    assert len(index) == 1
+
+
+def _failing_parse(text):
+    raise RuntimeError("parse failed")
+
+
+def _stub_parse(text):
+    return build_resume_output({})
+
+
+def _records(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_bulk_retry_of_failed_file_is_parsed(tmp_path, monkeypatch):
+    inputs = tmp_path / "in"
+    inputs.mkdir()
+    (inputs / "a.txt").write_text(TEXT, encoding="utf-8")
+    output = str(tmp_path / "out.jsonl")
+    options = dict(
+        workers=1,
+        use_cache=False,
+        progress_every=3600,
+        near_duplicates="skip",
+        near_duplicates_index=str(tmp_path / "seen.idx"),
+    )
+
+    # Workers are forked, so they see the patched functions; the parse itself
+    # is stubbed (no models needed), only the bookkeeping around it is real.
+    monkeypatch.setattr(bulk_parse, "warm_up", lambda: None)
+    monkeypatch.setattr(bulk_parse, "parse_text", _failing_parse)
+    summary = bulk_parse.run_bulk([str(inputs)], output, **options)
+    assert summary["error"] == 1
+    assert len(NearDuplicateIndex.load(str(tmp_path / "seen.idx"))) == 0
+
+    monkeypatch.setattr(bulk_parse, "parse_text", _stub_parse)
+    summary = bulk_parse.run_bulk([str(inputs)], output, retry_failed=True, **options)
+    assert summary["ok"] == 1 and summary["duplicate"] == 0
+    retried = _records(output)[-1]
+    assert retried["status"] == "ok" and "duplicate_of" not in retried
+
+    # A later near-copy points at the parsed original.
+    (inputs / "b.txt").write_text(TEXT + "\nPhone +1 555 0100", encoding="utf-8")
+    summary = bulk_parse.run_bulk([str(inputs)], output, **options)
+    copy = _records(output)[-1]
+    assert copy["status"] == "duplicate"
+    assert copy["duplicate_of"].endswith("a.txt")
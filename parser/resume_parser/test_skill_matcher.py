@@ -0,0 +1,92 @@
+import json
+import random
+import re
+
+import pytest
+
+from resume_parser.skill_matcher import CompiledSkillMatcher, SkillMatcher, compile_taxonomy
+from resume_parser.taxonomy import SKILL_TAXONOMY_PATH
+
+with open(SKILL_TAXONOMY_PATH, "r", encoding="utf-8") as f:
+    TAXONOMY = json.load(f)
+
+TOKENS = [token.lower() for canonical, variants in TAXONOMY.items() for token in [canonical] + list(variants or [])]
+FILLER = ["the", "and", "built", "with", "using", "x", "2019", "-", ",", ".", "(", ")", "/", "+", "#", ":", "\n"]
+
+# Tokens that start and end with a word character, where matching is exactly
+# the regex loop's \b...\b; tokens ending in a symbol ("c++", "c#") differ
+# on purpose (see skill_matcher._ends_token and test_symbol_tokens).
+WORD_TOKENS = [token for token in TOKENS if re.match(r"\w", token) and re.search(r"\w$", token)]
+WORD_FILLER = [part for part in FILLER if part not in ("+", "#")]
+
+
+def regex_match(haystack: str) -> set:
+    """The per-alias regex loop the trie matcher replaced."""
+    return {
+        canonical
+        for canonical, variants in TAXONOMY.items()
+        if any(re.search(rf"\b{re.escape(token.lower())}\b", haystack) for token in [canonical] + list(variants or []))
+    }
+
+
+def random_texts(seed: int, count: int, words=TOKENS + FILLER):
+    rng = random.Random(seed)
+    for _ in range(count):
+        parts = rng.choices(words, k=rng.randrange(1, 25))
+        joiners = rng.choices(["", " ", " ", ", ", "\n", "/", "-"], k=len(parts))
+        yield "".join(part + joiner for part, joiner in zip(parts, joiners))
+
+
+@pytest.fixture(scope="module")
+def matchers(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("taxonomy") / "skills.marisa")
+    compile_taxonomy(TAXONOMY, path, "test")
+    return SkillMatcher(TAXONOMY), CompiledSkillMatcher(path)
+
+
+def test_matches_regex_loop_on_word_tokens(matchers):
+    memory, _ = matchers
+    for text in random_texts(1, 3000, WORD_TOKENS + WORD_FILLER):
+        assert memory.match(text) == regex_match(text), text
+
+
+@pytest.mark.parametrize("text, expected, baseline", [
+    # Tokens ending in a symbol end there, whatever follows; \b needed a
+    # word character after the "+" / "#".
+    ("embedded c++ work", {"cpp"}, {"c"}),
+    ("c++", {"cpp"}, {"c"}),
+    ("c#; .net", {"csharp"}, {"c"}),
+    ("c++, c# and c", {"cpp", "csharp", "c"}, {"c"}),
+    # "c" inside "c++" is not C.
+    ("c++17", {"cpp"}, {"c", "cpp"}),
+    # Unchanged: a space is not a symbol, and "c+" is no token.
+    ("c sharp", {"c", "csharp"}, {"c", "csharp"}),
+    ("c+", {"c"}, {"c"}),
+    ("next.js apps", {"nextjs", "javascript"}, {"nextjs", "javascript"}),
+    ("react.js, vue.js", {"react", "vue", "javascript"}, {"react", "vue", "javascript"}),
+])
+def test_symbol_tokens(matchers, text, expected, baseline):
+    assert regex_match(text) == baseline
+    for matcher in matchers:
+        assert matcher.match(text) == expected
+
+
+def test_compiled_matches_memory(matchers):
+    memory, compiled = matchers
+    assert compiled.version == "test"
+    assert compiled.tokens_by_canonical().keys() == memory.tokens_by_canonical().keys()
+    for text in random_texts(2, 3000):
+        assert compiled.match(text) == memory.match(text), text
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("python, sql and react", {"python", "sql", "react"}),
+    ("pythonic code", set()),
+    ("next.js apps", {"nextjs"}),
+    ("internal tools", set()),
+    ("", set()),
+])
+def test_word_boundaries(matchers, text, expected):
+    for matcher in matchers:
+        assert matcher.match(text) >= expected
+        assert matcher.match(text) == regex_match(text)
@@ -1,4 +1,8 @@
-from extract_entities import extract_entities
+import spacy.util
+
+import pytest
+
+from resume_parser.extract_entities import NER_MODEL, extract_entities
 
 sample_text = """
 Gautam Manipal
@@ -7,4 +11,11 @@ Phone: +91-9876543210
 Skills: Python, Machine Learning, React, SQL
 """
 
-print(extract_entities(sample_text))
+
+@pytest.mark.skipif(not spacy.util.is_package(NER_MODEL), reason=f"spaCy model {NER_MODEL} is not installed")
+def test_extract_entities():
+    entities = extract_entities(sample_text)
+    assert entities["language"] == "en"
+    assert entities["primary_email"] == "gautam@example.com"
+    assert entities["primary_phone"] == "+919876543210"
+    assert entities["skills"] == ["machine learning", "python", "react", "sql"]
@@ -0,0 +1,67 @@
+import pytest
+
+from resume_parser import utils
+from resume_parser.utils import _parse_date_part, parse_date_range
+
+
+@pytest.fixture
+def dateparser_calls(monkeypatch):
+    """Parts handed to the dateparser fallback (the memo is cleared first)."""
+    calls = []
+    parse = utils.dateparser.parse
+
+    def spy(part, *args, **kwargs):
+        calls.append(part)
+        return parse(part, *args, **kwargs)
+
+    _parse_date_part.cache_clear()
+    monkeypatch.setattr(utils.dateparser, "parse", spy)
+    yield calls
+    _parse_date_part.cache_clear()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Jan 2019 - Dec 2022", (2019, 2022)),
+    ("Jan 2019-Dec 2022", (2019, 2022)),
+    ("2019/01 - 2021/06", (2019, 2021)),
+    ("01/2019 – 06/2021", (2019, 2021)),
+    ("Aug'20 – Dec'22", (2020, 2022)),
+    ("Aug’20 – Present", (2020, "present")),
+    ("Jun'98 - Sep'01", (1998, 2001)),
+    ("March 2017 – Present", (2017, "present")),
+    ("June 2019 to May 2021", (2019, 2021)),
+    ("2018 - 2020", (2018, 2020)),
+    ("2018-2020", (2018, 2020)),
+    ("2019", (2019, None)),
+    ("", (None, None)),
+])
+def test_fast_path_forms(dateparser_calls, text, expected):
+    assert parse_date_range(text) == expected
+    assert dateparser_calls == []
+
+
+def test_to_inside_words_is_not_a_separator():
+    # The old .replace("to", "-") split "Toronto" into "-ron-" and returned
+    # (None, 2019).
+    assert parse_date_range("Toronto, ON 2019 - 2021") == (2019, 2021)
+    assert parse_date_range("Customer Success, Toronto 2020") == (2020, None)
+
+
+def test_dateparser_fallback(dateparser_calls):
+    # Years outside 19xx/20xx are not on the fast path.
+    assert _parse_date_part("june 1875") == 1875
+    assert dateparser_calls == ["june 1875"]
+
+
+def test_several_years_fall_back_to_the_first(dateparser_calls):
+    assert _parse_date_part("2015, 2016") == 2015
+    assert dateparser_calls == ["2015, 2016"]
+
+
+def test_month_and_two_digit_day_is_not_a_year():
+    # Behavior change: "May 24" without an apostrophe is a day to dateparser,
+    # which used to fill in the current year on both sides. A year is now
+    # required, so there is none.
+    assert parse_date_range("May 24-October 24") == (None, None)
+    assert parse_date_range("May 24 - October 24") == (None, None)
+    assert parse_date_range("May'24 - October'24") == (2024, 2024)
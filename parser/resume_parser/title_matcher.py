@@ -0,0 +1,87 @@
+# resume_parser/title_matcher.py
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# Titles and lines are compared as sequences of lowercase word tokens, so
+# punctuation and spacing differences ("Full-Stack" / "Full Stack",
+# "Sr." / "Sr") don't matter.
+_TOKEN_RE = re.compile(r"\w+")
+
+# Key under which a trie node stores the title ending there. Tokens are never
+# empty, so it never clashes with a token.
+_END = ""
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class TitleMatcher:
+    """
+    Precompiled matcher over a job-title gazetteer.
+
+    Every title is split into word tokens and added to a token trie once, at
+    load time. `search` then walks the trie from each token of a line, so the
+    cost of a lookup depends on the line's length (times the longest title,
+    in tokens), not on how many titles the gazetteer holds.
+
+    Matches are whole tokens: "Intern" matches "Intern at Acme" but not
+    "International"; list such variants ("Internship") in the gazetteer.
+    """
+
+    def __init__(self, titles: Iterable[str]):
+        self._root: dict = {}
+        self.size = 0
+        for title in titles:
+            self._add(title)
+
+    def _add(self, title: str) -> None:
+        tokens = _tokens(title)
+        if not tokens:
+            return
+        node = self._root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        if _END not in node:
+            self.size += 1
+        node.setdefault(_END, title)
+
+    def finditer(self, line: str) -> Iterator[Tuple[int, int, str]]:
+        """
+        Yield (start, end, title) for the non-overlapping gazetteer titles in
+        `line`, leftmost then longest first; start/end are character offsets.
+        """
+        matches = list(_TOKEN_RE.finditer(line))
+        tokens = [m.group().lower() for m in matches]
+        root = self._root
+        i = 0
+        while i < len(tokens):
+            node = root
+            best = None
+            for j in range(i, len(tokens)):
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                if _END in node:
+                    best = (j, node[_END])
+            if best is None:
+                i += 1
+                continue
+            last, title = best
+            yield matches[i].start(), matches[last].end(), title
+            i = last + 1
+
+    def search(self, line: str) -> Optional[str]:
+        """
+        Return the gazetteer title found in `line` (leftmost, then longest),
+        or None.
+        """
+        for _, _, title in self.finditer(line):
+            return title
+        return None
+
+    def __contains__(self, line: str) -> bool:
+        return self.search(line) is not None
@@ -1,11 +1,15 @@
 # resume_parser/utils.py
 
+import io
 import os
 import re
+from functools import lru_cache
+from typing import BinaryIO
 import dateparser
 import docx
-from pdfminer.high_level import extract_text as extract_pdf_text
-from langdetect import detect as _langdetect_detect
+from resume_parser.pdf_pages import extract_pdf_text
+from langdetect import DetectorFactory, detect as _langdetect_detect
+from langdetect.detector_factory import init_factory
 
 
 # --- Cleaning Helpers ---
@@ -20,13 +24,56 @@ def clean_text(text: str) -> str:
     text = re.sub(r"\s+", " ", text)
     return text.strip()
 
+# --- Language Detection ---
+
+# langdetect samples n-grams randomly: seed it so the same text always gets
+# the same language (results are cached by content). Its language profiles
+# are loaded here, once, instead of on the first request.
+DetectorFactory.seed = 0
+init_factory()
+
+# Only this many characters are looked at; a resume's language is clear from
+# its first page.
+LANG_SAMPLE_CHARS = 2000
+
+# English function words that are rare in other Latin-script languages.
+_ENGLISH_MARKERS = frozenset({
+    "the", "and", "of", "to", "for", "with", "from", "using", "at", "by", "is",
+    "was", "were", "are", "this", "that", "which", "have", "has", "my", "our",
+})
+_WORD_RE = re.compile(r"[^\W\d_]+")
+_ASCII_LETTER_RE = re.compile(r"[A-Za-z]")
+
+
+def _is_obviously_english(sample: str) -> bool:
+    """
+    Cheap pre-check: (almost) all letters are plain ASCII Latin and enough
+    words are English function words. Anything else goes to langdetect.
+    """
+    words = _WORD_RE.findall(sample.lower())
+    if len(words) < 20:
+        return False
+
+    letters = sum(len(w) for w in words)
+    if len(_ASCII_LETTER_RE.findall(sample)) < 0.98 * letters:
+        return False
+
+    markers = sum(1 for w in words if w in _ENGLISH_MARKERS)
+    return markers >= 5 and markers >= 0.05 * len(words)
+
+
 def detect_language(text: str) -> str | None:
     """
-    Detect the language of the given text using langdetect.
+    Detect the language of the given text.
+    Looks at a bounded sample only, short-circuits obvious English text, and
+    otherwise uses (seeded, deterministic) langdetect.
     Returns a two-letter language code like 'en', 'es', 'fr', or None on failure.
     """
+    sample = text[:LANG_SAMPLE_CHARS]
+    if _is_obviously_english(sample):
+        return "en"
     try:
-        return _langdetect_detect(text)
+        return _langdetect_detect(sample)
     except Exception:
         return None
 
@@ -98,6 +145,73 @@ def clean_text_preserve_structure(text: str) -> str:
 
 # --- Date Range Parser ---
 
+# Separators between the two sides of a range: en/em dashes, a spaced hyphen,
+# or the word "to"/"till"/"until". Bare hyphens are only used as a fallback
+# (e.g. "2018-2020", "Jan 2019-Dec 2022").
+_RANGE_SEP_RE = re.compile(r"\s*[\u2013\u2014]\s*|\s+-\s+|\s+(?:to|till|until)\s+")
+_BARE_HYPHEN_RE = re.compile(r"\s*-\s*")
+
+_PRESENT_RE = re.compile(r"\b(?:present|current|now|ongoing|today|date)\b")
+_SHORT_YEAR_RE = re.compile(r"'(\d{2})\b")
+_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b")
+
+# Languages/settings for the dateparser fallback: restricting languages skips
+# locale detection, and requiring a year rejects inputs like "01" that would
+# otherwise resolve to the current year.
+DATEPARSER_LANGUAGES = ["en"]
+DATEPARSER_SETTINGS = {"REQUIRE_PARTS": ["year"], "PREFER_DAY_OF_MONTH": "first"}
+
+
+def _split_date_range(normalized: str) -> list[str]:
+    parts = [p.strip() for p in _RANGE_SEP_RE.split(normalized) if p.strip()]
+    if len(parts) < 2:
+        parts = [p.strip() for p in _BARE_HYPHEN_RE.split(normalized) if p.strip()]
+    return parts
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_part(part: str):
+    """
+    Parse one side of a date range (already normalized) into a year,
+    'present', or None. Results are memoized on the normalized string.
+
+    Fast path handles the common forms without dateparser:
+      'present' / 'current' / 'now', "aug'20", 'jan 2019', 'march 2017',
+      '2019/01', '01/2019', bare '2019'.
+    Anything else falls back to dateparser.
+    """
+    if not part:
+        return None
+
+    # If it clearly says present/current/etc.
+    if _PRESENT_RE.search(part):
+        return "present"
+
+    # Handle short year forms like '20, '22
+    m_short = _SHORT_YEAR_RE.search(part)
+    if m_short:
+        yy = int(m_short.group(1))
+        # Heuristic: '90–'99 -> 1990–1999, '00–'29 -> 2000–2029
+        if yy >= 90:
+            return 1900 + yy
+        return 2000 + yy
+
+    # Exactly one 4-digit year (with or without month/day around it)
+    years = _YEAR_RE.findall(part)
+    if len(years) == 1:
+        return int(years[0])
+
+    # Slow path: dateparser for anything the fast path can't read
+    dt = dateparser.parse(part, languages=DATEPARSER_LANGUAGES, settings=DATEPARSER_SETTINGS)
+    if dt:
+        return dt.year
+
+    # Last resort: first 4-digit year, if several were present
+    if years:
+        return int(years[0])
+
+    return None
+
 
 def parse_date_range(text: str):
     """
@@ -109,93 +223,73 @@ def parse_date_range(text: str):
       - 'March 2017 – Present'
       - '2021/01 – Present'
       - "Aug'20 – Dec'22"
+      - 'June 2019 to May 2021'
 
     Returns:
         (start_year: int or None, end_year: int or str or None)
         where end_year can be 'present' if text indicates an ongoing role.
-    """
-    # Normalize separators and quotes
-    normalized = (
-        text.replace("–", "-")
-            .replace("—", "-")
-            .replace("—", "-")
-            .replace("to", "-")
-            .replace("–", "-")
-            .replace("’", "'")
-            .strip()
-            .lower()
-    )
 
-    # Common tokens indicating "present"
-    present_tokens = {"present", "current", "now"}
+    A side without a year gives None. This includes "Month YY" without an
+    apostrophe ('May 24-October 24' -> (None, None)), which dateparser
+    reads as a day of the current year; the result used to be the current
+    year on both sides.
+    """
+    # Normalize quotes and case; separators are handled by _split_date_range
+    normalized = text.replace("\u2019", "'").replace("\u2018", "'").strip().lower()
 
-    # Split on dash-like separators (keep max 2 parts)
-    parts = [p.strip() for p in re.split(r"\s*-\s*|\s+to\s+", normalized) if p.strip()]
+    parts = _split_date_range(normalized)
 
     start_part = parts[0] if parts else ""
     end_part = parts[1] if len(parts) > 1 else ""
 
-    # Helper to parse a single date-like part into a year
-    def parse_part(part: str):
-        if not part:
-            return None
-
-        # If it clearly says present/current/etc.
-        if any(tok in part for tok in present_tokens):
-            return "present"
-
-        # Handle short year forms like '20, '22
-        m_short = re.search(r"'(\d{2})", part)
-        if m_short:
-            yy = int(m_short.group(1))
-            # Heuristic: '90–'99 -> 1990–1999, '00–'29 -> 2000–2029
-            if yy >= 90:
-                return 1900 + yy
-            return 2000 + yy
-
-        # General fallback: use dateparser to interpret month/year patterns, etc.
-        dt = dateparser.parse(part)
-        if dt:
-            return dt.year
-
-        # Last resort: extract a 4-digit year directly
-        m_year = re.search(r"(19|20)\d{2}", part)
-        if m_year:
-            return int(m_year.group(0))
-
-        return None
-
-    start_year = parse_part(start_part)
-    end_year = parse_part(end_part)
+    start_year = _parse_date_part(start_part)
+    end_year = _parse_date_part(end_part)
 
     return start_year, end_year
 
 
 
 # --- Resume File Reader ---
+#
+# Readers take either a filesystem path or a binary file-like object
+# (e.g. an upload held in memory), so uploads never have to touch disk.
 
 
-def extract_text_from_docx(path: str) -> str:
+def extract_text_from_docx(source: str | BinaryIO) -> str:
     """
-    Extracts and returns text from a .docx file.
+    Extracts and returns text from a .docx file (path or binary stream).
     """
-    doc_obj = docx.Document(path)
+    doc_obj = docx.Document(source)
     return "\n".join([para.text for para in doc_obj.paragraphs])
 
 
-def extract_text_from_txt(path: str) -> str:
+def extract_text_from_txt(source: str | BinaryIO) -> str:
     """
-    Extracts and returns text from a .txt file.
+    Extracts and returns text from a .txt file (path or binary stream).
     """
-    with open(path, "r", encoding="utf-8") as file:
-        return file.read()
+    if isinstance(source, str):
+        with open(source, "r", encoding="utf-8") as file:
+            return file.read()
+    return source.read().decode("utf-8")
 
 
-def extract_text_from_pdf(path: str) -> str:
+def extract_text_from_pdf(source: str | BinaryIO) -> str:
     """
-    Extracts and returns text from a .pdf file using pdfminer.six
+    Extracts and returns text from a .pdf file (path or binary stream) using pdfminer.six.
+    Pages are read one by one, so long PDFs can be capped, split across
+    processes or cut short once the needed sections are read (see pdf_pages.py).
     """
-    return extract_pdf_text(path)
+    return extract_pdf_text(source)
+
+
+def _extract_raw_text(source: str | BinaryIO, ext: str) -> str:
+    if ext == ".pdf":
+        return extract_text_from_pdf(source)
+    if ext == ".docx":
+        return extract_text_from_docx(source)
+    if ext == ".txt":
+        return extract_text_from_txt(source)
+    raise ValueError(f"Unsupported file type: {ext}")
 
 
 def extract_text_from_file(path: str) -> str:
@@ -204,20 +298,22 @@ def extract_text_from_file(path: str) -> str:
     Applies structured cleanup afterward, preserving lines and sections.
     """
     ext = os.path.splitext(path)[1].lower()
-
-    if ext == ".pdf":
-        raw = extract_text_from_pdf(path)
-    elif ext == ".docx":
-        raw = extract_text_from_docx(path)
-    elif ext == ".txt":
-        raw = extract_text_from_txt(path)
-    else:
-        raise ValueError(f"Unsupported file type: {ext}")
+    raw = _extract_raw_text(path, ext)
 
     # Use structured cleaning that preserves line structure
     return clean_text_preserve_structure(raw)
 
 
+def extract_text_from_bytes(data: bytes, filename: str) -> str:
+    """
+    Same as extract_text_from_file, but for file contents already in memory.
+    The file type is taken from `filename`'s extension.
+    """
+    ext = os.path.splitext(filename)[1].lower()
+    raw = _extract_raw_text(io.BytesIO(data), ext)
+    return clean_text_preserve_structure(raw)
+
+
 # --- Experience Parser Helpers ---
 
 
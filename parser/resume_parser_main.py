@@ -1,26 +1,179 @@
 import sys
 import json
-from resume_parser.extract_text import extract_text
+import base64
+import os
+import argparse
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from resume_parser.extract_text import extract_text, extract_text_from_upload
 from resume_parser.extract_entities import extract_entities
 from resume_parser.extract_experience import extract_experience
+from resume_parser.pipeline import warm_up
+from resume_parser.profiling import StageProfiler
 
 
 
 
 
-def parse_resume(file_path):
-    try:
-        text = extract_text(file_path)
+def parse_resume_data(file_path=None, data=None, filename=None, profile=False, profile_out=None):
+    """
+    Parse one resume, given a path or its raw bytes (plus `filename` for the
+    extension), and return the result dict printed by the CLI.
+    With `profile`, the stage report is added under "profile" (or written to
+    `profile_out`).
+    """
+    def read_text():
+        if data is not None:
+            return extract_text_from_upload(data, filename or "")
+        return extract_text(file_path)
+
+    if profile:
+        with StageProfiler() as profiler:
+            with profiler.stage("extract_text"):
+                text = read_text()
+            with profiler.stage("entities"):
+                entities = extract_entities(text)
+            with profiler.stage("experience"):
+                entities["experience"] = extract_experience(text)
+
+        report = profiler.report()
+        if profile_out:
+            with open(profile_out, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        else:
+            entities["profile"] = report
+    else:
+        text = read_text()
         entities = extract_entities(text)
         experience = extract_experience(text)
         entities["experience"] = experience
 
+    return entities
+
+
+def parse_resume(file_path, profile=False, profile_out=None):
+    try:
+        entities = parse_resume_data(file_path, profile=profile, profile_out=profile_out)
         print(json.dumps(entities))  # Output result to stdout for Node.js to read
     except Exception as e:
         print(json.dumps({"error": str(e)}))
 
+
+# ---------- Daemon mode ----------
+#
+# One long-running process instead of one spawn per file: models are loaded
+# once, then requests are read from stdin and answered on stdout, one JSON
+# object per line.
+#
+# Request:  {"id": "r1", "path": "/abs/resume.pdf"}
+#           {"id": "r2", "data": "<base64>", "filename": "resume.docx", "profile": true}
+# Response: {"id": "r1", "result": {...}}   or   {"id": "r1", "error": "..."}
+#
+# A {"ready": true, "pid": ...} line is written once models are loaded.
+# With --workers > 1, requests are parsed concurrently and responses come
+# back in completion order; match them by id.
+
+
+def handle_request(request):
+    """Run one daemon request and return its response dict (never raises)."""
+    request_id = request.get("id")
+    try:
+        if request.get("data") is not None:
+            data = base64.b64decode(request["data"])
+            result = parse_resume_data(
+                data=data, filename=request.get("filename"), profile=bool(request.get("profile"))
+            )
+        elif request.get("path"):
+            result = parse_resume_data(request["path"], profile=bool(request.get("profile")))
+        else:
+            raise ValueError("request needs 'path' or 'data'")
+        return {"id": request_id, "result": result}
+    except Exception as e:
+        return {"id": request_id, "error": str(e)}
+
+
+def _worker_pid(_):
+    return os.getpid()
+
+
+def run_daemon(stdin=sys.stdin, stdout=sys.stdout, workers=1):
+    """
+    Serve newline-delimited JSON requests from `stdin` until EOF.
+    `workers` > 1 parses in that many warmed-up worker processes.
+    """
+    write_lock = threading.Lock()
+
+    def respond(response):
+        line = json.dumps(response)
+        with write_lock:
+            stdout.write(line + "\n")
+            stdout.flush()
+
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=warm_up)
+        # Start the workers (each loads models in warm_up) before reporting ready.
+        list(pool.map(_worker_pid, range(workers)))
+    else:
+        warm_up()
+    respond({"ready": True, "pid": os.getpid(), "workers": workers})
+
+    for line in stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            respond({"id": None, "error": f"Invalid request: {e}"})
+            continue
+
+        if pool is None:
+            respond(handle_request(request))
+        else:
+            future = pool.submit(handle_request, request)
+            future.add_done_callback(lambda f, rid=request.get("id"): respond(
+                f.result() if f.exception() is None else {"id": rid, "error": str(f.exception())}
+            ))
+
+    if pool is not None:
+        # Answer everything still in flight before exiting.
+        pool.shutdown(wait=True)
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(description="Parse a resume and print JSON to stdout.")
+    parser.add_argument("file_path", nargs="?", help="resume file (.pdf, .docx, .txt)")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="profile each stage (cProfile + tracemalloc) and include the report in the output",
+    )
+    parser.add_argument(
+        "--profile-out",
+        help="with --profile, write the report to this JSON file instead of the output",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="stay running: read JSON-lines requests on stdin, write JSON-lines results to stdout",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="with --daemon, number of parser processes working on requests concurrently",
+    )
+    return parser
+
+
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        parse_resume(sys.argv[1])
+    args = build_arg_parser().parse_args()
+    if args.daemon:
+        run_daemon(workers=args.workers)
+    elif args.file_path:
+        parse_resume(args.file_path, profile=args.profile, profile_out=args.profile_out)
     else:
         print(json.dumps({"error": "No file path provided"}))